@@ -1,216 +1,456 @@
-"""Scheduling algorithms implementation."""
-import numpy as np
-from typing import List, Tuple
-
-def first_come_first_serve(arrival_times: List[float], burst_times: List[float]) -> Tuple[List[Tuple[int, float, float]], float, float]:
+"""Scheduling algorithms implementation.
+
+Each algorithm returns (execution_order, avg_turnaround, avg_waiting), where
+execution_order is an ExecutionTrace. Pass record_trace=False when only
+metrics are needed: the trace then keeps running totals (slice count, context
+switches, makespan) instead of storing slices. Pass a counters dict to have it
+filled with scheduling counters (instrumentation.COUNTER_NAMES); without one,
+nothing extra is counted.
+
+Pass ticks_per_unit (e.g. 10 for a 0.1 resolution, 1000 for 0.001) to
+simulate on an integer time base: times are rounded once to int64 ticks, the
+engine does exact integer arithmetic with no per-step rounding, and results
+are converted back to time units only on output. Results are then
+bit-reproducible across platforms.
+
+Pass should_stop, a callable checked between bounded steps of the run, to be
+able to abandon a long simulation: it raises engines.SimulationCancelled
+once should_stop() returns True.
+"""
+import math
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+from engines import (AgingPriorityEngine, CFSEngine, FCFSEngine, MLFQEngine, PriorityEngine, RoundRobinEngine, SMPEngine,
+                     SRTFEngine)
+from execution_trace import ExecutionTrace
+
+if TYPE_CHECKING:
+    import numpy as np  # Imported on first use, so the GUI starts without NumPy
+
+def _to_ticks(values: Sequence[float], ticks_per_unit: int) -> List[int]:
+    """Times as integer ticks, rounded to the nearest tick"""
+    if ticks_per_unit < 1 or int(ticks_per_unit) != ticks_per_unit:
+        raise ValueError(f"ticks_per_unit must be a positive integer, got {ticks_per_unit}")
+    import numpy as np
+    return np.rint(np.asarray(values, dtype=np.float64) * ticks_per_unit).astype(np.int64).tolist()
+
+def _quantum_ticks(quantum: float, ticks_per_unit: int) -> int:
+    """A time quantum in whole ticks"""
+    ticks = round(quantum * ticks_per_unit)
+    if ticks < 1:
+        raise ValueError(f"quantum {quantum} is shorter than one tick (1/{ticks_per_unit})")
+    return ticks
+
+def _run(engine, should_stop: Optional[Callable[[], bool]]):
+    """Run an engine to completion, in interruptible steps when should_stop is given"""
+    if should_stop is None:
+        engine.run()
+    else:
+        engine.run_interruptible(should_stop)
+
+def _from_ticks(engine, ticks_per_unit: int) -> Tuple[ExecutionTrace, float, float]:
+    """An engine's result on integer ticks, converted back to time units"""
+    execution_order, _, _ = engine.result()
+    execution_order.divide_times(ticks_per_unit)
+    # Exact integer totals, divided once
+    scale = engine.num_processes * ticks_per_unit
+    return execution_order, engine.total_turnaround / scale, engine.total_waiting / scale
+
+def first_come_first_serve(arrival_times: List[float], burst_times: List[float], record_trace: bool = True,
+                           counters: Optional[Dict[str, int]] = None, ticks_per_unit: Optional[int] = None,
+                           should_stop: Optional[Callable[[], bool]] = None) -> Tuple[ExecutionTrace, float, float]:
     """
     First Come First Serve scheduling algorithm.
     Processes are executed in order of arrival.
-    """
-    num_processes = len(arrival_times)
-    # Sort processes by arrival time
-    sorted_processes = sorted(range(num_processes), key=lambda i: arrival_times[i])
-
-    current_time = 0
-    total_turnaround = 0
-    total_waiting = 0
-    execution_order = []
 
-    for i in sorted_processes:
-        # Handle idle time between processes
-        if arrival_times[i] > current_time:
-            current_time = arrival_times[i]
-        
-        # Record execution period
-        execution_order.append((i, current_time, current_time + burst_times[i]))
+    Runs an FCFSEngine to completion; use the engine directly to checkpoint
+    and resume with late arrivals.
+    """
+    if ticks_per_unit:
+        arrival_times, burst_times = _to_ticks(arrival_times, ticks_per_unit), _to_ticks(burst_times, ticks_per_unit)
+    engine = FCFSEngine(record_trace)
+    engine.add_processes(arrival_times, burst_times)
+    _run(engine, should_stop)
+    if counters is not None:
+        counters.update(engine.counters())
+    return _from_ticks(engine, ticks_per_unit) if ticks_per_unit else engine.result()
 
-        # Calculate metrics
-        turnaround = (current_time + burst_times[i]) - arrival_times[i]
-        waiting = turnaround - burst_times[i]
-        total_turnaround += turnaround
-        total_waiting += waiting
 
-        current_time += burst_times[i]  # Move to next process
+def first_come_first_serve_batch(arrival_times: "np.ndarray", burst_times: "np.ndarray") -> Tuple["np.ndarray", "np.ndarray", "np.ndarray", "np.ndarray"]:
+    """
+    Vectorized First Come First Serve over a batch of workloads.
 
-    # Calculate averages
-    avg_turnaround = total_turnaround / num_processes
-    avg_waiting = total_waiting / num_processes
+    FCFS completion follows finish_i = max(finish_{i-1}, arrival_i) + burst_i,
+    which unrolls to finish_i = S_i + max(0, max_{j<=i}(arrival_j - S_{j-1}))
+    where S is the prefix sum of bursts in arrival order. That is an argsort,
+    a cumsum and a running maximum per row, with no Python loop per process.
 
-    return execution_order, avg_turnaround, avg_waiting
+    Args:
+        arrival_times: (k, n) array, one workload per row (1-D means k=1)
+        burst_times: (k, n) array matching arrival_times
 
-def round_robin(arrival_times: List[float], burst_times: List[float], quantum: float = 2) -> Tuple[List[Tuple[int, float, float]], float, float]:
+    Returns:
+        Tuple of (start, finish, avg_turnaround, avg_waiting) where start and
+        finish are (k, n) arrays in original process order and the averages
+        are (k,) arrays.
+    """
+    import numpy as np
+    arrival = np.atleast_2d(np.asarray(arrival_times, dtype=np.float64))
+    burst = np.atleast_2d(np.asarray(burst_times, dtype=np.float64))
+    if arrival.shape != burst.shape:
+        raise ValueError(f"arrival_times {arrival.shape} and burst_times {burst.shape} must have the same shape")
+
+    # Sort each workload by arrival time (stable keeps ties in index order)
+    order = np.argsort(arrival, axis=1, kind="stable")
+    sorted_arrival = np.take_along_axis(arrival, order, axis=1)
+    sorted_burst = np.take_along_axis(burst, order, axis=1)
+
+    # Burst time completed before each process starts, ignoring idle time
+    prior_work = np.cumsum(sorted_burst, axis=1) - sorted_burst
+    # Accumulated idle time; the CPU clock starts at 0
+    idle = np.maximum(np.maximum.accumulate(sorted_arrival - prior_work, axis=1), 0)
+    sorted_start = prior_work + idle
+
+    # Scatter back to original process order
+    start = np.empty_like(sorted_start)
+    np.put_along_axis(start, order, sorted_start, axis=1)
+    finish = start + burst
+
+    avg_turnaround = (finish - arrival).mean(axis=1)
+    avg_waiting = (start - arrival).mean(axis=1)
+    return start, finish, avg_turnaround, avg_waiting
+
+def round_robin(arrival_times: List[float], burst_times: List[float], quantum: float = 2, record_trace: bool = True,
+                counters: Optional[Dict[str, int]] = None, ticks_per_unit: Optional[int] = None,
+                should_stop: Optional[Callable[[], bool]] = None) -> Tuple[ExecutionTrace, float, float]:
     """
     Round Robin scheduling algorithm.
     Each process gets a fixed time quantum before switching.
-    """
-    n = len(arrival_times)
-    remaining = burst_times.copy()  # Track remaining burst time
-    complete = [False] * n  # Completion status
-    time = 0
-    execution_order = []
-    waiting_time = [0] * n
-    turnaround_time = [0] * n
-
-    # Prepare process list sorted by arrival time
-    processes = [(i, arrival_times[i], burst_times[i]) for i in range(n)]
-    processes.sort(key=lambda x: x[1])
-
-    time = min(arrival_times)  # Start at first arrival
-    ready_queue = []
-    visited = [False] * n  # Track if process entered queue
-
-    while not all(complete):
-        # Add newly arrived processes to queue
-        for i, arrival, _ in processes:
-            if arrival <= time and not visited[i]:
-                ready_queue.append(i)
-                visited[i] = True
-
-        if not ready_queue:
-            time += 0.1  # No processes ready, increment time
-            time = round(time, 1)
-            continue
-
-        current = ready_queue.pop(0)  # Get next process
 
-        # Execute for quantum or remaining time
-        exec_start = time
-        exec_time = min(quantum, remaining[current])
-        time += exec_time
-        time = round(time, 1)
-        remaining[current] -= exec_time
-        execution_order.append((current, exec_start, time))
-
-        # Check for new arrivals during execution
-        for i, arrival, _ in processes:
-            if arrival <= time and not visited[i]:
-                ready_queue.append(i)
-                visited[i] = True
-
-        if remaining[current] > 0:
-            ready_queue.append(current)  # Requeue if not finished
-        else:
-            complete[current] = True  # Mark complete
-            turnaround_time[current] = time - arrival_times[current]
-            waiting_time[current] = turnaround_time[current] - burst_times[current]
-
-    # Calculate averages
-    avg_turnaround_time = sum(turnaround_time) / n
-    avg_waiting_time = sum(waiting_time) / n
-    return execution_order, avg_turnaround_time, avg_waiting_time
-
-def preemptive_shortest_remaining_time_first(arrival_times: List[float], burst_times: List[float]) -> Tuple[List[Tuple[int, float, float]], float, float]:
+    Runs a RoundRobinEngine to completion; use the engine directly to
+    checkpoint and resume with late arrivals. On float times the clock is
+    rounded to 0.1 after every slice; on integer ticks it needs no rounding.
+    """
+    if ticks_per_unit:
+        arrival_times, burst_times = _to_ticks(arrival_times, ticks_per_unit), _to_ticks(burst_times, ticks_per_unit)
+        engine = RoundRobinEngine(_quantum_ticks(quantum, ticks_per_unit), record_trace,
+                                  count_decisions=counters is not None, round_digits=None)
+    else:
+        engine = RoundRobinEngine(quantum, record_trace, count_decisions=counters is not None)
+    engine.add_processes(arrival_times, burst_times)
+    _run(engine, should_stop)
+    if counters is not None:
+        counters.update(engine.counters())
+    return _from_ticks(engine, ticks_per_unit) if ticks_per_unit else engine.result()
+
+
+def preemptive_shortest_remaining_time_first(arrival_times: List[float], burst_times: List[float], record_trace: bool = True,
+                                             counters: Optional[Dict[str, int]] = None, ticks_per_unit: Optional[int] = None,
+                                             should_stop: Optional[Callable[[], bool]] = None) -> Tuple[ExecutionTrace, float, float]:
     """
     Preemptive Shortest Remaining Time First algorithm.
     Always executes the process with shortest remaining time.
+
+    Runs an SRTFEngine to completion: time jumps straight to the next arrival
+    or completion and ready processes are kept in a min-heap keyed on
+    (remaining, pid). Use the engine directly to checkpoint and resume.
     """
-    num_processes = len(arrival_times)
-    remaining_burst = burst_times.copy()
-    complete = [False] * num_processes
-    current_time = min(arrival_times)
-    execution_order = []
-    waiting_time = [0] * num_processes
-    turnaround_time = [0] * num_processes
-    processes_completed = 0
-    last_process = -1  # Track last executed process
-
-    while processes_completed < num_processes:
-        # Get ready processes
-        ready_queue = [i for i in range(num_processes)
-                       if arrival_times[i] <= current_time and not complete[i]]
-
-        if ready_queue:
-            # Select process with shortest remaining time
-            current_process = min(ready_queue, key=lambda i: remaining_burst[i])
-
-            # Record context switch
-            if last_process != current_process:
-                execution_order.append((current_process, current_time))
-            last_process = current_process
-
-            # Execute for 0.1 time unit
-            remaining_burst[current_process] -= 0.1
-            remaining_burst[current_process] = max(0, remaining_burst[current_process])
-
-            # Check if process completed
-            if remaining_burst[current_process] == 0:
-                complete[current_process] = True
-                processes_completed += 1
-                finish_time = current_time + 0.1
-                turnaround_time[current_process] = finish_time - arrival_times[current_process]
-                waiting_time[current_process] = turnaround_time[current_process] - burst_times[current_process]
-                execution_order[-1] += (finish_time,)  # Add end time
-                last_process = -1
-
-        current_time += 0.1
-        current_time = round(current_time, 2)
-
-    # Ensure all execution periods have end times
-    for i in range(len(execution_order)):
-        if len(execution_order[i]) == 2:
-            execution_order[i] += (execution_order[i][1] + 0.1,)
-
-    # Calculate averages
-    avg_turnaround_time = sum(turnaround_time) / num_processes
-    avg_waiting_time = sum(waiting_time) / num_processes
-
-    return execution_order, avg_turnaround_time, avg_waiting_time
-
-def non_preemptive_priority(arrival_times: List[float], burst_times: List[float], priorities: List[int]) -> Tuple[List[Tuple[int, float, float]], float, float]:
+    if ticks_per_unit:
+        arrival_times, burst_times = _to_ticks(arrival_times, ticks_per_unit), _to_ticks(burst_times, ticks_per_unit)
+    engine = SRTFEngine(record_trace, count_decisions=counters is not None)
+    engine.add_processes(arrival_times, burst_times)
+    _run(engine, should_stop)
+    if counters is not None:
+        counters.update(engine.counters())
+    return _from_ticks(engine, ticks_per_unit) if ticks_per_unit else engine.result()
+
+def non_preemptive_priority(arrival_times: List[float], burst_times: List[float], priorities: List[int], record_trace: bool = True,
+                            counters: Optional[Dict[str, int]] = None, ticks_per_unit: Optional[int] = None,
+                            should_stop: Optional[Callable[[], bool]] = None) -> Tuple[ExecutionTrace, float, float]:
     """
     Non-preemptive Priority scheduling algorithm.
-    Executes highest priority process first (lower number = higher priority).
-    """
-    current_time = min(arrival_times)
-    total_turnaround_time = 0
-    total_waiting_time = 0
-    processes_completed = 0
-    num_processes = len(arrival_times)
-
-    # Create process dictionary list
-    process_list = []
-    for i in range(num_processes):
-        process_list.append({
-            'arrival': arrival_times[i],
-            'burst': burst_times[i],
-            'priority': priorities[i]
-        })
-
-    processes_done = [False] * num_processes
-    execution_order = []
-
-    while processes_completed < num_processes:
-        # Find ready processes
-        ready = []
-        for i in range(num_processes):
-            if process_list[i]['arrival'] <= current_time and not processes_done[i]:
-                ready.append((i, process_list[i]))
-
-        if not ready:
-            current_time += 1  # No processes ready
-            continue
+    Executes highest priority process first (higher number = higher priority).
 
-        # Sort by priority (descending) and arrival time
-        ready.sort(key=lambda x: (-x[1]['priority'], x[1]['arrival']))
-        i, process = ready[0]  # Get highest priority process
+    Arrived processes wait in a heap keyed on (-priority, arrival, pid), so
+    each dispatch is a single O(log n) pop. Runs a PriorityEngine to
+    completion; use the engine directly to checkpoint and resume.
+    """
+    if ticks_per_unit:
+        arrival_times, burst_times = _to_ticks(arrival_times, ticks_per_unit), _to_ticks(burst_times, ticks_per_unit)
+    engine = PriorityEngine(record_trace)
+    engine.add_processes(arrival_times, burst_times, priorities)
+    _run(engine, should_stop)
+    if counters is not None:
+        counters.update(engine.counters())
+    return _from_ticks(engine, ticks_per_unit) if ticks_per_unit else engine.result()
+
+def multilevel_feedback_queue(arrival_times: List[float], burst_times: List[float], quanta: Sequence[float] = (2, 4, 8),
+                              boost_interval: Optional[float] = 100, record_trace: bool = True,
+                              counters: Optional[Dict[str, int]] = None, ticks_per_unit: Optional[int] = None,
+                              should_stop: Optional[Callable[[], bool]] = None) -> Tuple[ExecutionTrace, float, float]:
+    """
+    Multilevel Feedback Queue scheduling algorithm.
+    New processes start at the top level and are demoted one level each time
+    they use up a level's quantum; every boost_interval time units all
+    processes are lifted back to the top level.
 
-        # Execute entire process (non-preemptive)
-        process['start'] = current_time
-        process['finish'] = current_time + process['burst']
-        process['turnaround'] = process['finish'] - process['arrival']
-        process['waiting'] = process['start'] - process['arrival']
+    Runs an MLFQEngine to completion (O(1) per dispatch); use the engine
+    directly to checkpoint and resume.
+    """
+    if ticks_per_unit:
+        arrival_times, burst_times = _to_ticks(arrival_times, ticks_per_unit), _to_ticks(burst_times, ticks_per_unit)
+        quanta = [_quantum_ticks(quantum, ticks_per_unit) for quantum in quanta]
+        boost_interval = _quantum_ticks(boost_interval, ticks_per_unit) if boost_interval else None
+        engine = MLFQEngine(quanta, boost_interval, record_trace, count_decisions=counters is not None, round_digits=None)
+    else:
+        engine = MLFQEngine(quanta, boost_interval, record_trace, count_decisions=counters is not None)
+    engine.add_processes(arrival_times, burst_times)
+    _run(engine, should_stop)
+    if counters is not None:
+        counters.update(engine.counters())
+    return _from_ticks(engine, ticks_per_unit) if ticks_per_unit else engine.result()
+
+def completely_fair(arrival_times: List[float], burst_times: List[float], priorities: List[int], target_latency: float = 20,
+                    min_granularity: float = 1, record_trace: bool = True, counters: Optional[Dict[str, int]] = None,
+                    ticks_per_unit: Optional[int] = None,
+                    should_stop: Optional[Callable[[], bool]] = None) -> Tuple[ExecutionTrace, float, float]:
+    """
+    Completely Fair (CFS-style) scheduling algorithm.
+    Shares the CPU in proportion to weights derived from priorities (higher
+    number = larger share): the process with the smallest weighted virtual
+    runtime runs next, for its share of target_latency but at least
+    min_granularity.
+
+    Runs a CFSEngine to completion (O(log n) per dispatch); use the engine
+    directly to checkpoint and resume. metrics.fairness_metrics() gives the
+    matching per-process fairness figures.
+    """
+    if ticks_per_unit:
+        arrival_times, burst_times = _to_ticks(arrival_times, ticks_per_unit), _to_ticks(burst_times, ticks_per_unit)
+        engine = CFSEngine(target_latency * ticks_per_unit, _quantum_ticks(min_granularity, ticks_per_unit), record_trace,
+                           count_decisions=counters is not None, whole_ticks=True)
+    else:
+        engine = CFSEngine(target_latency, min_granularity, record_trace, count_decisions=counters is not None)
+    engine.add_processes(arrival_times, burst_times, priorities)
+    _run(engine, should_stop)
+    if counters is not None:
+        counters.update(engine.counters())
+    return _from_ticks(engine, ticks_per_unit) if ticks_per_unit else engine.result()
+
+def multi_cpu(policy: str, arrival_times: List[float], burst_times: List[float], priorities: Optional[List[int]] = None,
+              cpus: int = 4, queue: str = "global", quantum: float = 2, record_trace: bool = True,
+              counters: Optional[Dict[str, int]] = None, ticks_per_unit: Optional[int] = None,
+              should_stop: Optional[Callable[[], bool]] = None) -> Tuple[ExecutionTrace, float, float]:
+    """
+    Run a scheduling policy on several CPUs.
+
+    Args:
+        policy: One of engines.SMP_POLICIES (the SCHEDULERS names)
+        arrival_times: Arrival time per process
+        burst_times: Burst time per process
+        priorities: Priority per process, used by "Priority Scheduling"
+        cpus: Number of CPUs
+        queue: "global" for one shared run queue, "per-core" for a queue per
+            CPU with work stealing
+        quantum: Time quantum for "Round Robin"
+
+    Returns:
+        (execution_order, avg_turnaround, avg_waiting); execution_order.cores
+        holds the CPU of each slice
+    """
+    if ticks_per_unit:
+        arrival_times, burst_times = _to_ticks(arrival_times, ticks_per_unit), _to_ticks(burst_times, ticks_per_unit)
+        engine = SMPEngine(policy, cpus, queue, _quantum_ticks(quantum, ticks_per_unit), record_trace, round_digits=None)
+    else:
+        engine = SMPEngine(policy, cpus, queue, quantum, record_trace)
+    engine.add_processes(arrival_times, burst_times, priorities)
+    _run(engine, should_stop)
+    if counters is not None:
+        counters.update(engine.counters())
+    return _from_ticks(engine, ticks_per_unit) if ticks_per_unit else engine.result()
+
+def preemptive_priority(arrival_times: List[float], burst_times: List[float], priorities: List[int], aging_interval: Optional[float] = 5,
+                        record_trace: bool = True, counters: Optional[Dict[str, int]] = None,
+                        ticks_per_unit: Optional[int] = None,
+                        should_stop: Optional[Callable[[], bool]] = None) -> Tuple[ExecutionTrace, float, float]:
+    """
+    Preemptive Priority scheduling algorithm with aging.
+    Runs the highest priority process (higher number = higher priority),
+    preempting it when a higher priority one arrives; a waiting process
+    gains one priority level per aging_interval time units, so low
+    priorities cannot starve. aging_interval=None disables aging.
+
+    Runs an AgingPriorityEngine to completion (O(log n) per decision); its
+    counters include max_starvation, the longest single wait of any process.
+    """
+    if ticks_per_unit:
+        arrival_times, burst_times = _to_ticks(arrival_times, ticks_per_unit), _to_ticks(burst_times, ticks_per_unit)
+        aging_interval = _quantum_ticks(aging_interval, ticks_per_unit) if aging_interval else None
+    engine = AgingPriorityEngine(aging_interval, record_trace)
+    engine.add_processes(arrival_times, burst_times, priorities)
+    _run(engine, should_stop)
+    if counters is not None:
+        counters.update(engine.counters())
+        if ticks_per_unit:
+            counters["max_starvation"] /= ticks_per_unit
+    return _from_ticks(engine, ticks_per_unit) if ticks_per_unit else engine.result()
+
+
+def first_come_first_serve_stream(chunks: Iterable[Sequence], on_slices: Optional[Callable] = None) -> Tuple[int, float, float]:
+    """
+    First Come First Serve over an arrival-ordered stream of process chunks.
 
-        total_turnaround_time += process['turnaround']
-        total_waiting_time += process['waiting']
+    Each chunk is solved with the same closed-form recurrence as
+    first_come_first_serve_batch, carrying the CPU clock into the next chunk,
+    so only one chunk is ever held in memory.
 
-        execution_order.append((i, process['start'], process['finish']))
+    Args:
+        chunks: Iterable of (arrival_times, burst_times, ...) arrays, ordered by arrival
+        on_slices: Optional callback receiving (pids, starts, ends) arrays per chunk
 
-        current_time = process['finish']
-        processes_done[i] = True
-        processes_completed += 1
+    Returns:
+        Tuple of (num_processes, avg_turnaround, avg_waiting)
+    """
+    import numpy as np
+    clock = 0.0  # Finish time of the last process so far
+    last_arrival = -math.inf
+    num_processes = 0
+    total_turnaround = 0.0
+    total_waiting = 0.0
+
+    for chunk in chunks:
+        arrival = np.asarray(chunk[0], dtype=np.float64)
+        burst = np.asarray(chunk[1], dtype=np.float64)
+        if arrival.size == 0:
+            continue
+        if arrival[0] < last_arrival or np.any(arrival[1:] < arrival[:-1]):
+            raise ValueError(f"Chunk starting at process {num_processes} is not ordered by arrival")
+        last_arrival = arrival[-1]
+
+        # start_i = max(finish_{i-1}, arrival_i), unrolled with the carried-in clock
+        prior_work = np.cumsum(burst) - burst
+        start = prior_work + np.maximum(np.maximum.accumulate(arrival - prior_work), clock)
+        finish = start + burst
+
+        total_turnaround += float((finish - arrival).sum())
+        total_waiting += float((start - arrival).sum())
+        if on_slices is not None:
+            on_slices(np.arange(num_processes, num_processes + arrival.size), start, finish)
+        num_processes += arrival.size
+        clock = float(finish[-1])
+
+    if num_processes == 0:
+        raise ValueError("The process stream is empty")
+    return num_processes, total_turnaround / num_processes, total_waiting / num_processes
+
+def round_robin_stream(chunks: Iterable[Sequence], quantum: float = 2, on_slices: Optional[Callable] = None,
+                       ticks_per_unit: Optional[int] = None) -> Tuple[int, float, float]:
+    """
+    Round Robin over an arrival-ordered stream of process chunks.
+
+    Drives a RoundRobinEngine: each chunk is added once the engine has run up
+    to shortly before its first arrival, and completed processes are
+    compacted away as they accumulate. Memory is bounded by the processes
+    still in the system and the current chunk, and the schedule is the same
+    as round_robin's.
+
+    Args:
+        chunks: Iterable of (arrival_times, burst_times, ...) arrays, ordered by arrival
+        quantum: Time quantum
+        on_slices: Optional callback receiving (pids, starts, ends) arrays of
+            the slices run since the previous call, once per chunk
+        ticks_per_unit: Simulate on integer ticks (see module docstring)
+
+    Returns:
+        Tuple of (num_processes, avg_turnaround, avg_waiting)
+    """
+    import numpy as np
+    round_digits = 1
+    if ticks_per_unit:
+        quantum = _quantum_ticks(quantum, ticks_per_unit)
+        round_digits = None  # Integer times need no rounding
+    scale = ticks_per_unit or 1
+    engine = RoundRobinEngine(quantum, record_trace=on_slices is not None, round_digits=round_digits)
+    ids = np.empty(0, dtype=np.int64)  # Stream position of each process the engine holds
+    num_added = 0
+    num_processes = 0
+    held_arrival, held_burst = np.empty(0), np.empty(0)
+
+    def add(arrival: "np.ndarray", burst: "np.ndarray"):
+        nonlocal ids, num_added
+        ids = np.concatenate([ids, np.arange(num_added, num_added + len(arrival))])
+        num_added += len(arrival)
+        if ticks_per_unit:
+            arrival, burst = _to_ticks(arrival, ticks_per_unit), _to_ticks(burst, ticks_per_unit)
+        engine.add_processes(arrival, burst)
+
+    def flush():
+        trace = engine.execution_order
+        if on_slices is not None and len(trace):
+            on_slices(ids[trace.pids], trace.starts / scale, trace.ends / scale)
+            engine.execution_order = ExecutionTrace()
+
+    for chunk in chunks:
+        arrival = np.asarray(chunk[0], dtype=np.float64)
+        burst = np.asarray(chunk[1], dtype=np.float64)
+        if arrival.size == 0:
+            continue
+        if (held_arrival.size and arrival[0] < held_arrival[-1]) or np.any(arrival[1:] < arrival[:-1]):
+            raise ValueError(f"Chunk starting at process {num_processes} is not ordered by arrival")
+        num_processes += arrival.size
+
+        # Processes arriving with the latest arrival wait for the next chunk,
+        # which may hold more arrivals at that same time
+        arrival = np.concatenate([held_arrival, arrival])
+        burst = np.concatenate([held_burst, burst])
+        split = int(np.searchsorted(arrival, arrival[-1]))
+        held_arrival, held_burst = arrival[split:], burst[split:]
+        if split:
+            add(arrival[:split], burst[:split])
+
+        # A slice started before until ends within a quantum (plus rounding),
+        # so it never runs past an arrival the engine has not been given yet
+        next_arrival = _to_ticks(held_arrival[:1], ticks_per_unit)[0] if ticks_per_unit else float(held_arrival[0])
+        engine.run(until=next_arrival - 2 * quantum)
+        flush()
+        # Compacting once completed processes are half of those held keeps it O(1) per process
+        if 2 * (engine.completed - engine.released) >= engine.num_processes:
+            ids = ids[engine.compact()]
+
+    if num_processes == 0:
+        raise ValueError("The process stream is empty")
+    add(held_arrival, held_burst)
+    engine.run()
+    flush()
+    return num_processes, engine.total_turnaround / (num_processes * scale), engine.total_waiting / (num_processes * scale)
+
+# Scheduling algorithms by display name
+SCHEDULERS = {
+    "FCFS": first_come_first_serve,
+    "Round Robin": round_robin,
+    "Preemptive SRTF": preemptive_shortest_remaining_time_first,
+    "Priority Scheduling": non_preemptive_priority,
+    "MLFQ": multilevel_feedback_queue,
+    "CFS": completely_fair,
+    "Preemptive Priority": preemptive_priority
+}
+
+# Algorithms that take the priorities array as their third argument
+PRIORITY_SCHEDULERS = {"Priority Scheduling", "CFS", "Preemptive Priority"}
+
+def run_scheduler(name: str, arrival_times: List[float], burst_times: List[float], priorities: Optional[List[int]] = None, **params) -> Tuple[ExecutionTrace, float, float]:
+    """
+    Run a scheduling algorithm from SCHEDULERS by name.
 
-    # Calculate averages
-    avg_turnaround_time = total_turnaround_time / num_processes
-    avg_waiting_time = total_waiting_time / num_processes
+    Args:
+        name: Key in SCHEDULERS
+        arrival_times: Arrival time per process
+        burst_times: Burst time per process
+        priorities: Priority per process, passed only to algorithms that use it
+        **params: Algorithm parameters (e.g. quantum for Round Robin)
 
-    return execution_order, avg_turnaround_time, avg_waiting_time
\ No newline at end of file
+    Returns:
+        The algorithm's (execution_order, avg_turnaround, avg_waiting)
+    """
+    if name in PRIORITY_SCHEDULERS:
+        return SCHEDULERS[name](arrival_times, burst_times, priorities, **params)
+    return SCHEDULERS[name](arrival_times, burst_times, **params)
@@ -0,0 +1,350 @@
+"""Benchmark suite for the scheduling algorithms.
+
+Times every function in algorithms.py over seeded workloads from 10 to a
+million processes (Round Robin at several quantum values, multi_cpu on 64
+cores with each queue layout), records wall time, peak memory and events
+processed, and writes the results as JSON. Results are checked against a
+stored baseline with regression thresholds, and a log-log fit of time against
+n per benchmark catches accidentally quadratic loops.
+
+    python benchmark.py                           # compare against data/benchmark_baseline.json
+    python benchmark.py --sizes 10 1000 100000    # quicker run
+    python benchmark.py --update-baseline         # accept the current numbers
+"""
+import argparse
+import gc
+import json
+import math
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple
+import numpy as np
+import algorithms
+from engines import SMP_QUEUES
+from workload import WorkloadConfig, generate_workload, iter_workload_chunks, read_config
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+DEFAULT_BASELINE = os.path.join(DATA_DIR, "benchmark_baseline.json")
+
+SIZES = (10, 100, 1_000, 10_000, 100_000, 1_000_000)
+QUANTUMS = (0.5, 2, 8)
+SMP_CPUS = 64  # Simulated cores of the multi_cpu benchmarks
+
+TIME_TOLERANCE = 0.30  # Slower than baseline by more than this fraction is a regression
+MEMORY_TOLERANCE = 0.20
+NOISE_FLOOR_SECONDS = 0.05  # Faster runs are too noisy to compare with the baseline
+FIT_MIN_SECONDS = 0.001  # Faster runs are dominated by fixed overhead and left out of fits
+MAX_EXPONENT = 1.3  # n log n fits to about 1.1 over these sizes; n^2 to 2
+
+class BenchWorkload(NamedTuple):
+    """One seeded workload in the forms the algorithms take"""
+    arrival_times: List[float]
+    burst_times: List[float]
+    priorities: List[int]
+    arrays: Tuple[np.ndarray, np.ndarray, np.ndarray]  # Sorted by arrival, for the batch and stream engines
+
+class Benchmark(NamedTuple):
+    """A timed call: run(workload) executes it and returns the events processed"""
+    name: str
+    function: str
+    quantum: Optional[float]
+    run: Callable[[BenchWorkload], int]
+
+def make_workload(config: WorkloadConfig, num_processes: int, seed: int) -> BenchWorkload:
+    """
+    Draw the workload for one size.
+
+    The arrival window grows with the process count, so every size has the
+    same load as the configured workload.
+    """
+    scale = num_processes / config.num_processes
+    scaled = config._replace(num_processes=num_processes, arrival_mean=config.arrival_mean * scale,
+                             arrival_sd=config.arrival_sd * scale)
+    arrival, burst, priorities = generate_workload(scaled, np.random.default_rng((seed, num_processes)))
+    order = np.argsort(arrival, kind="stable")
+    return BenchWorkload(arrival.tolist(), burst.tolist(), priorities.tolist(),
+                         (arrival[order], burst[order], priorities[order]))
+
+def _trace_events(workload: BenchWorkload, result) -> int:
+    """Events of an algorithm run: one arrival per process plus one dispatch per (merged) slice"""
+    return len(workload.arrival_times) + result[0].slice_count
+
+def _smp_arrivals(workload: BenchWorkload) -> List[float]:
+    """Arrivals compressed by SMP_CPUS, so every simulated core gets the configured load"""
+    return (np.asarray(workload.arrival_times) / SMP_CPUS).tolist()
+
+def _stream_events(stream: Callable, workload: BenchWorkload, **params) -> int:
+    """Run a streaming engine, counting the slices it emits"""
+    slices = 0
+    def count(pids, starts, ends):
+        nonlocal slices
+        slices += len(pids)
+    num_processes, _, _ = stream(iter_workload_chunks(workload.arrays), on_slices=count, **params)
+    return num_processes + slices
+
+def make_benchmarks(quantums: Sequence[float] = QUANTUMS) -> List[Benchmark]:
+    """Every function in algorithms.py, Round Robin once per quantum and multi_cpu once per queue layout"""
+    benchmarks = [
+        Benchmark("first_come_first_serve", "first_come_first_serve", None,
+                  lambda w: _trace_events(w, algorithms.first_come_first_serve(w.arrival_times, w.burst_times))),
+        Benchmark("first_come_first_serve_batch", "first_come_first_serve_batch", None,
+                  lambda w: 2 * algorithms.first_come_first_serve_batch(w.arrays[0], w.arrays[1])[0].size),
+        Benchmark("first_come_first_serve_stream", "first_come_first_serve_stream", None,
+                  lambda w: _stream_events(algorithms.first_come_first_serve_stream, w)),
+        Benchmark("preemptive_shortest_remaining_time_first", "preemptive_shortest_remaining_time_first", None,
+                  lambda w: _trace_events(w, algorithms.preemptive_shortest_remaining_time_first(w.arrival_times, w.burst_times))),
+        Benchmark("non_preemptive_priority", "non_preemptive_priority", None,
+                  lambda w: _trace_events(w, algorithms.non_preemptive_priority(w.arrival_times, w.burst_times, w.priorities))),
+        Benchmark("multilevel_feedback_queue", "multilevel_feedback_queue", None,
+                  lambda w: _trace_events(w, algorithms.multilevel_feedback_queue(w.arrival_times, w.burst_times))),
+        Benchmark("completely_fair", "completely_fair", None,
+                  lambda w: _trace_events(w, algorithms.completely_fair(w.arrival_times, w.burst_times, w.priorities))),
+        Benchmark("preemptive_priority", "preemptive_priority", None,
+                  lambda w: _trace_events(w, algorithms.preemptive_priority(w.arrival_times, w.burst_times, w.priorities))),
+    ]
+    for quantum in quantums:
+        benchmarks.append(Benchmark(f"round_robin[q={quantum:g}]", "round_robin", quantum,
+                                    lambda w, q=quantum: _trace_events(w, algorithms.round_robin(w.arrival_times, w.burst_times, q))))
+        benchmarks.append(Benchmark(f"round_robin_stream[q={quantum:g}]", "round_robin_stream", quantum,
+                                    lambda w, q=quantum: _stream_events(algorithms.round_robin_stream, w, quantum=q)))
+    for queue in SMP_QUEUES:
+        benchmarks.append(Benchmark(f"multi_cpu[{queue}]", "multi_cpu", None,
+                                    lambda w, q=queue: _trace_events(w, algorithms.multi_cpu(
+                                        "Preemptive SRTF", _smp_arrivals(w), w.burst_times, w.priorities, cpus=SMP_CPUS, queue=q))))
+    return benchmarks
+
+def time_benchmark(benchmark: Benchmark, workload: BenchWorkload, min_time: float = 0.2, max_repeat: int = 5) -> Tuple[float, int, int]:
+    """
+    Time a benchmark, repeating until min_time has passed or max_repeat runs.
+
+    The garbage collector is paused while timing, as in timeit.
+
+    Returns:
+        Tuple of (best seconds, repeats, events)
+    """
+    best = math.inf
+    total = 0.0
+    repeats = 0
+    gc.collect()
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        while repeats < max_repeat and (repeats == 0 or total < min_time):
+            start = time.perf_counter()
+            events = benchmark.run(workload)
+            elapsed = time.perf_counter() - start
+            best = min(best, elapsed)
+            total += elapsed
+            repeats += 1
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return best, repeats, events
+
+def peak_memory(benchmark: Benchmark, workload: BenchWorkload) -> int:
+    """Peak bytes allocated during one run (NumPy buffers included), measured with tracemalloc"""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        benchmark.run(workload)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+def run_benchmarks(
+    config: WorkloadConfig,
+    sizes: Sequence[int] = SIZES,
+    benchmarks: Optional[Sequence[Benchmark]] = None,
+    seed: int = 0,
+    min_time: float = 0.2,
+    max_repeat: int = 5,
+    measure_memory: bool = True,
+    progress: Optional[Callable[[Dict], None]] = None
+) -> List[Dict]:
+    """
+    Run every benchmark at every size.
+
+    Args:
+        config: Base workload parameters (the shape of the workload)
+        sizes: Process counts
+        benchmarks: Benchmarks to run (default: make_benchmarks())
+        seed: Seed of the workloads
+        min_time: Keep repeating a benchmark until this many seconds have passed
+        max_repeat: Upper bound on repeats
+        measure_memory: Also run once under tracemalloc for the peak memory
+        progress: Called with each result row as it is produced
+
+    Returns:
+        One row per (benchmark, size)
+    """
+    benchmarks = make_benchmarks() if benchmarks is None else benchmarks
+    rows = []
+    for num_processes in sizes:
+        workload = make_workload(config, num_processes, seed)
+        for benchmark in benchmarks:
+            seconds, repeats, events = time_benchmark(benchmark, workload, min_time, max_repeat)
+            row = {
+                "benchmark": benchmark.name,
+                "function": benchmark.function,
+                "quantum": benchmark.quantum,
+                "num_processes": num_processes,
+                "seconds": seconds,
+                "repeats": repeats,
+                "events": events,
+                "events_per_second": events / seconds if seconds > 0 else math.inf,
+                "peak_bytes": peak_memory(benchmark, workload) if measure_memory else None
+            }
+            rows.append(row)
+            if progress is not None:
+                progress(row)
+    return rows
+
+def fit_exponents(rows: List[Dict], min_seconds: float = FIT_MIN_SECONDS) -> Dict[str, Optional[float]]:
+    """
+    Empirical complexity per benchmark: the slope of log(seconds) against log(n).
+
+    Runs under min_seconds are left out; a benchmark needs three remaining
+    sizes to be fitted, otherwise its exponent is None.
+    """
+    points: Dict[str, List[Tuple[float, float]]] = {}
+    for row in rows:
+        points.setdefault(row["benchmark"], [])
+        if row["seconds"] >= min_seconds:
+            points[row["benchmark"]].append((math.log(row["num_processes"]), math.log(row["seconds"])))
+
+    exponents = {}
+    for name, pairs in points.items():
+        if len(pairs) < 3:
+            exponents[name] = None
+            continue
+        log_n, log_seconds = np.array(pairs).T
+        exponents[name] = float(np.polyfit(log_n, log_seconds, 1)[0])
+    return exponents
+
+def compare_to_baseline(
+    rows: List[Dict],
+    baseline_rows: List[Dict],
+    time_tolerance: float = TIME_TOLERANCE,
+    memory_tolerance: float = MEMORY_TOLERANCE,
+    noise_floor: float = NOISE_FLOOR_SECONDS
+) -> List[str]:
+    """
+    Find results that are worse than the baseline beyond the tolerances.
+
+    Only (benchmark, size) pairs present in both are compared, and times only
+    where the baseline run took at least noise_floor seconds.
+
+    Returns:
+        One message per regression
+    """
+    baseline = {(row["benchmark"], row["num_processes"]): row for row in baseline_rows}
+    regressions = []
+    for row in rows:
+        base = baseline.get((row["benchmark"], row["num_processes"]))
+        if base is None:
+            continue
+        where = f"{row['benchmark']} n={row['num_processes']}"
+        if base["seconds"] >= noise_floor and row["seconds"] > base["seconds"] * (1 + time_tolerance):
+            regressions.append(f"{where}: {row['seconds']:.4f} s vs baseline {base['seconds']:.4f} s "
+                               f"(+{row['seconds'] / base['seconds'] - 1:.0%})")
+        if (row.get("peak_bytes") is not None and base.get("peak_bytes")
+                and row["peak_bytes"] > base["peak_bytes"] * (1 + memory_tolerance)):
+            regressions.append(f"{where}: peak {row['peak_bytes'] / 1e6:.1f} MB vs baseline "
+                               f"{base['peak_bytes'] / 1e6:.1f} MB (+{row['peak_bytes'] / base['peak_bytes'] - 1:.0%})")
+        if row["events"] != base["events"]:
+            regressions.append(f"{where}: {row['events']} events vs baseline {base['events']} (schedule changed)")
+    return regressions
+
+def format_row(row: Dict) -> str:
+    """One result as a table line"""
+    memory = "-" if row["peak_bytes"] is None else f"{row['peak_bytes'] / 1e6:.1f}"
+    return (f"{row['benchmark']:<44} {row['num_processes']:>9} {row['seconds']:>10.4f} {row['repeats']:>4} "
+            f"{row['events']:>10} {row['events_per_second']:>12.0f} {memory:>10}")
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(description="Benchmark the scheduling algorithms")
+    parser.add_argument("--config", default=os.path.join(DATA_DIR, "input.txt"),
+                        help="workload configuration giving the workload shape (default: data/input.txt)")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(SIZES), help="process counts")
+    parser.add_argument("--quantum", type=float, nargs="+", default=list(QUANTUMS), help="Round Robin quantum values")
+    parser.add_argument("--benchmarks", nargs="+", help="only run benchmarks whose name starts with one of these")
+    parser.add_argument("--seed", type=int, default=0, help="workload seed (default: 0)")
+    parser.add_argument("--min-time", type=float, default=0.2, help="seconds to keep repeating each benchmark")
+    parser.add_argument("--repeat", type=int, default=5, help="maximum repeats per benchmark")
+    parser.add_argument("--no-memory", action="store_true", help="skip the tracemalloc run for peak memory")
+    parser.add_argument("--json", help="write results to this JSON file")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="baseline JSON (default: data/benchmark_baseline.json)")
+    parser.add_argument("--update-baseline", action="store_true", help="write the results as the new baseline")
+    parser.add_argument("--time-tolerance", type=float, default=TIME_TOLERANCE,
+                        help=f"allowed slowdown as a fraction (default: {TIME_TOLERANCE})")
+    parser.add_argument("--memory-tolerance", type=float, default=MEMORY_TOLERANCE,
+                        help=f"allowed peak memory growth as a fraction (default: {MEMORY_TOLERANCE})")
+    parser.add_argument("--max-exponent", type=float, default=MAX_EXPONENT,
+                        help=f"largest acceptable fitted complexity exponent (default: {MAX_EXPONENT})")
+    args = parser.parse_args(argv)
+
+    benchmarks = make_benchmarks(args.quantum)
+    if args.benchmarks:
+        benchmarks = [b for b in benchmarks if b.name.startswith(tuple(args.benchmarks))]
+        if not benchmarks:
+            parser.error("no benchmark matches --benchmarks")
+
+    print(f"{'Benchmark':<44} {'N':>9} {'Seconds':>10} {'Runs':>4} {'Events':>10} {'Events/s':>12} {'Peak MB':>10}")
+    config = read_config(args.config)
+    rows = run_benchmarks(config, args.sizes, benchmarks, args.seed, args.min_time,
+                          args.repeat, not args.no_memory, progress=lambda row: print(format_row(row), flush=True))
+
+    exponents = fit_exponents(rows)
+    print("\nFitted complexity (seconds ~ n^k):")
+    too_steep = []
+    for name, exponent in exponents.items():
+        if exponent is None:
+            print(f"  {name:<44} -  (too few timed sizes)")
+            continue
+        flag = ""
+        if exponent > args.max_exponent:
+            flag = f"  > {args.max_exponent:g}, superlinear"
+            too_steep.append(name)
+        print(f"  {name:<44} {exponent:.2f}{flag}")
+
+    results = {
+        "meta": {
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "processor": platform.processor(),
+            "seed": args.seed,
+            "config": config._asdict(),
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S")
+        },
+        "results": rows,
+        "exponents": exponents
+    }
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+
+    if args.update_baseline:
+        with open(args.baseline, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"\nBaseline written to {args.baseline}")
+        return 1 if too_steep else 0
+
+    regressions = []
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            regressions = compare_to_baseline(rows, json.load(f)["results"], args.time_tolerance, args.memory_tolerance)
+        print(f"\nBaseline {args.baseline}: {len(regressions)} regression(s)")
+        for message in regressions:
+            print(f"  {message}")
+    else:
+        print(f"\nNo baseline at {args.baseline}; run with --update-baseline to create one")
+
+    return 1 if regressions or too_steep else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,92 @@
+"""Keyed cache for simulation results."""
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple
+
+def workload_digest(*arrays) -> str:
+    """
+    Compute a digest identifying a workload.
+
+    Args:
+        *arrays: Workload columns (arrival, burst, priority...); None is allowed
+
+    Returns:
+        Hex digest covering dtype, shape and contents of every array
+    """
+    import numpy as np
+
+    digest = hashlib.blake2b(digest_size=16)
+    for array in arrays:
+        if array is None:
+            digest.update(b"none;")
+            continue
+        array = np.ascontiguousarray(array)
+        digest.update(f"{array.dtype.str}{array.shape};".encode())
+        digest.update(memoryview(array).cast("B"))
+    return digest.hexdigest()
+
+class SimulationCache:
+    """
+    Bounded LRU cache of scheduling results.
+
+    Entries are keyed by workload digest, algorithm name and algorithm
+    parameters (e.g. the Round Robin quantum), so every algorithm runs at most
+    once per workload. Cached results are shared between callers and must be
+    treated as read-only. Lookups are thread-safe; the simulation itself runs
+    outside the lock.
+    """
+    def __init__(self, max_entries: int = 32):
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Tuple, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(digest: str, algorithm: str, params: Optional[Dict[str, Any]] = None) -> Tuple:
+        """Build the cache key for one simulation"""
+        return (digest, algorithm, tuple(sorted((params or {}).items())))
+
+    def get_or_run(self, digest: str, algorithm: str, func: Callable, args: Sequence,
+                   params: Optional[Dict[str, Any]] = None) -> Any:
+        """
+        Return the cached result for a simulation, running it on a miss.
+
+        Args:
+            digest: Workload digest from workload_digest()
+            algorithm: Algorithm name
+            func: Scheduling function to call on a miss
+            args: Positional arguments for func
+            params: Keyword parameters for func, part of the key
+
+        Returns:
+            Whatever func returns
+        """
+        key = self.make_key(digest, algorithm, params)
+        with self._lock:
+            if key in self._entries:
+                self.hits += 1
+                self._entries.move_to_end(key)
+                return self._entries[key]
+            self.misses += 1
+
+        result = func(*args, **(params or {}))
+        with self._lock:
+            self._entries[key] = result
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)  # Evict least recently used
+        return result
+
+    def __contains__(self, key: Tuple) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self):
+        """Drop all cached results"""
+        with self._lock:
+            self._entries.clear()
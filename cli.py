@@ -0,0 +1,262 @@
+"""Headless command line interface for the Process Scheduler.
+
+Usage:
+    python cli.py run [--config data/input.txt | --trace FILE | --workload FILE.psw] [--algorithms ...]
+                      [--csv FILE] [--jsonl FILE] [--profile] [--profile-json FILE] [--ticks-per-unit N]
+                      [--cpus M [--queue global|per-core]]
+    python cli.py stream (--trace FILE | --workload FILE.psw) [--algorithms FCFS "Round Robin"] [--ticks-per-unit N]
+    python cli.py generate --out FILE.psw [--config data/input.txt] [--processes N] [--seed S]
+    python cli.py sweep ...          (see sweep.py)
+    python cli.py bench ...          (see benchmark.py)
+    python cli.py startup-time       (check cold-start time against the budget)
+
+Only the modules a command needs are imported, and never the GUI stack.
+"""
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from functools import partial
+from typing import List, Optional
+from algorithms import SCHEDULERS, multi_cpu, run_scheduler
+from engines import SMP_POLICIES
+from report import REPORT_NAMES, ReportWriter
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+
+# Cold start of `run` on a small trace, in milliseconds
+COLD_START_BUDGET_MS = 250
+
+# Modules a headless run must never load
+GUI_MODULES = {"customtkinter", "CTkMessagebox", "matplotlib", "tkinter"}
+
+def load_workload(args):
+    """
+    Return (arrival_times, burst_times, priorities) for the run command.
+
+    Binary workloads stay memory-mapped: the engines and report writer take
+    the columns as they are, so nothing is copied up front.
+    """
+    if args.trace:
+        from workload import read_trace
+        return read_trace(args.trace)
+    if args.workload:
+        from workload import open_workload
+        return open_workload(args.workload)
+
+    from workload import generate_workload, read_config
+    import numpy as np
+    config = read_config(args.config)
+    if args.processes:
+        config = config._replace(num_processes=args.processes)
+    arrival_times, burst_times, priorities = generate_workload(config, np.random.default_rng(args.seed))
+    return arrival_times.tolist(), burst_times.tolist(), priorities.tolist()
+
+def command_run(args) -> int:
+    """Run the selected algorithms and write the text report"""
+    from metrics import tail_summary
+    from instrumentation import Profiler
+
+    arrival_times, burst_times, priorities = load_workload(args)
+    selected = args.algorithms or [name for name in REPORT_NAMES if not args.cpus or name in SMP_POLICIES]
+    if args.cpus and not set(selected) <= set(SMP_POLICIES):
+        print(f"--cpus supports {', '.join(SMP_POLICIES)}", file=sys.stderr)
+        return 2
+    profiler = Profiler(enabled=args.profile or bool(args.profile_json))
+
+    with ReportWriter(args.output, csv_file=args.csv, jsonl_file=args.jsonl) as writer:
+        with profiler.span("report-write", "processes"):
+            writer.write_processes(arrival_times, burst_times, priorities)
+        # Report order follows REPORT_NAMES, like the GUI
+        for name in sorted(selected, key=lambda n: list(REPORT_NAMES).index(n)):
+            params = {"quantum": args.quantum} if name == "Round Robin" else {}
+            if name == "MLFQ":
+                params = {"quanta": args.mlfq_quanta, "boost_interval": args.boost_interval}
+            elif name == "CFS":
+                params = {"target_latency": args.target_latency, "min_granularity": args.min_granularity}
+            elif name == "Preemptive Priority":
+                params = {"aging_interval": args.aging_interval or None}
+            if args.ticks_per_unit:
+                params["ticks_per_unit"] = args.ticks_per_unit
+            with profiler.span("simulate", name):
+                if args.cpus:
+                    execution_order, avg_tat, avg_wt = multi_cpu(name, arrival_times, burst_times, priorities,
+                                                                 cpus=args.cpus, queue=args.queue,
+                                                                 counters=profiler.counters_for(name), **params)
+                else:
+                    execution_order, avg_tat, avg_wt = run_scheduler(name, arrival_times, burst_times, priorities,
+                                                                     counters=profiler.counters_for(name), **params)
+            with profiler.span("report-write", name):
+                writer.write_result(name, execution_order, avg_tat, avg_wt,
+                                    tail_summary(arrival_times, burst_times, execution_order, priorities))
+            if not args.quiet:
+                print(f"{name:<20} avg turnaround {avg_tat:10.2f}   avg waiting {avg_wt:10.2f}")
+
+    if args.profile:
+        print(profiler.format_report())
+    if args.profile_json:
+        profiler.write_json(args.profile_json)
+
+    if args.check_headless:
+        loaded = sorted(name for name in GUI_MODULES if name in sys.modules)
+        if loaded:
+            print(f"GUI modules loaded by a headless run: {', '.join(loaded)}", file=sys.stderr)
+            return 3
+    return 0
+
+def command_stream(args) -> int:
+    """Replay a large trace in chunks through the streaming engines"""
+    from algorithms import first_come_first_serve_stream, round_robin_stream
+    from workload import iter_trace_chunks, iter_workload_chunks, open_workload
+
+    engines = {
+        "FCFS": first_come_first_serve_stream,
+        "Round Robin": partial(round_robin_stream, quantum=args.quantum, ticks_per_unit=args.ticks_per_unit)
+    }
+    for name in args.algorithms:
+        start = time.perf_counter()
+        if args.workload:
+            chunks = iter_workload_chunks(open_workload(args.workload), args.chunk_size)
+        else:
+            chunks = iter_trace_chunks(args.trace, args.chunk_size)
+        num_processes, avg_tat, avg_wt = engines[name](chunks)
+        elapsed = time.perf_counter() - start
+        print(f"{name:<20} {num_processes} processes   avg turnaround {avg_tat:10.2f}   "
+              f"avg waiting {avg_wt:10.2f}   ({elapsed:.2f} s)")
+    return 0
+
+def command_generate(args) -> int:
+    """Generate a random workload and write it in the binary workload format"""
+    from workload import generate_workload, read_config, write_workload
+    import numpy as np
+
+    config = read_config(args.config)
+    if args.processes:
+        config = config._replace(num_processes=args.processes)
+    arrival_times, burst_times, priorities = generate_workload(config, np.random.default_rng(args.seed))
+
+    # Store in arrival order so the file can feed the streaming engines directly
+    order = np.argsort(arrival_times, kind="stable")
+    write_workload(args.out, arrival_times[order], burst_times[order], priorities[order])
+    print(f"Wrote {config.num_processes} processes to {args.out}")
+    return 0
+
+def command_sweep(argv: List[str]) -> int:
+    """Delegate to the Monte Carlo sweep CLI"""
+    from sweep import main as sweep_main
+    return sweep_main(argv)
+
+def command_bench(argv: List[str]) -> int:
+    """Delegate to the benchmark suite CLI"""
+    from benchmark import main as bench_main
+    return bench_main(argv)
+
+def command_startup_time(args) -> int:
+    """Measure cold-start time of a headless run and compare it to the budget"""
+    with tempfile.TemporaryDirectory() as tmp:
+        trace = os.path.join(tmp, "trace.txt")
+        with open(trace, "w") as f:
+            f.write("0 5 1\n1 3 2\n2 8 0\n3 6 3\n")
+        command = [sys.executable, os.path.abspath(__file__), "run", "--trace", trace,
+                   "--output", os.path.join(tmp, "output.txt"), "--quiet", "--check-headless"]
+
+        timings = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            completed = subprocess.run(command)
+            timings.append((time.perf_counter() - start) * 1000)
+            if completed.returncode != 0:
+                print(f"Headless run failed with exit code {completed.returncode}", file=sys.stderr)
+                return completed.returncode
+
+    best = min(timings)
+    print(f"Cold start: best {best:.1f} ms, median {sorted(timings)[len(timings) // 2]:.1f} ms "
+          f"over {len(timings)} runs (budget {args.budget_ms} ms)")
+    if best > args.budget_ms:
+        print("Cold start is over budget", file=sys.stderr)
+        return 1
+    return 0
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command line entry point"""
+    argv = sys.argv[1:] if argv is None else argv
+    if argv[:1] == ["sweep"]:
+        return command_sweep(argv[1:])
+    if argv[:1] == ["bench"]:
+        return command_bench(argv[1:])
+
+    parser = argparse.ArgumentParser(description="Process scheduling simulator (headless)")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="run scheduling algorithms and write the report")
+    source = run.add_mutually_exclusive_group()
+    source.add_argument("--config", default=os.path.join(DATA_DIR, "input.txt"),
+                        help="input.txt-style workload configuration (default: data/input.txt)")
+    source.add_argument("--trace", help="trace file of 'arrival burst [priority]' rows")
+    source.add_argument("--workload", help="binary workload file written by 'generate'")
+    run.add_argument("--algorithms", nargs="+", choices=list(SCHEDULERS),
+                     help="algorithms to run (default: all)")
+    run.add_argument("--quantum", type=float, default=2, help="Round Robin quantum (default: 2)")
+    run.add_argument("--mlfq-quanta", type=float, nargs="+", default=[2, 4, 8],
+                     help="MLFQ quantum per level, top level first (default: 2 4 8)")
+    run.add_argument("--boost-interval", type=float, default=100,
+                     help="MLFQ priority boost period; 0 disables boosting (default: 100)")
+    run.add_argument("--target-latency", type=float, default=20,
+                     help="CFS period shared among runnable processes by weight (default: 20)")
+    run.add_argument("--min-granularity", type=float, default=1, help="CFS minimum slice (default: 1)")
+    run.add_argument("--aging-interval", type=float, default=5,
+                     help="Preemptive Priority: waiting time per priority level gained; 0 disables aging (default: 5)")
+    run.add_argument("--ticks-per-unit", type=int,
+                     help="simulate on an integer time base with this many ticks per time unit (e.g. 10, 1000)")
+    run.add_argument("--cpus", type=int, help="simulate this many CPUs instead of one")
+    run.add_argument("--queue", choices=["global", "per-core"], default="global",
+                     help="with --cpus: one shared run queue, or a queue per CPU with work stealing (default: global)")
+    run.add_argument("--processes", type=int, help="override the configured number of processes")
+    run.add_argument("--seed", type=int, help="random seed for generated workloads")
+    run.add_argument("--output", default=os.path.join(DATA_DIR, "output.txt"), help="report file (default: data/output.txt)")
+    run.add_argument("--csv", help="also write execution slices as CSV to this file")
+    run.add_argument("--jsonl", help="also write one JSON summary line per algorithm to this file")
+    run.add_argument("--profile", action="store_true", help="print scheduling counters and phase timings")
+    run.add_argument("--profile-json", help="write scheduling counters and phase timings to this JSON file")
+    run.add_argument("--quiet", action="store_true", help="do not print averages")
+    run.add_argument("--check-headless", action="store_true", help="fail if any GUI module was imported")
+
+    stream = commands.add_parser("stream", help="replay an arrival-ordered trace in bounded memory")
+    stream_source = stream.add_mutually_exclusive_group(required=True)
+    stream_source.add_argument("--trace", help="trace file of 'arrival burst [priority]' rows, ordered by arrival")
+    stream_source.add_argument("--workload", help="binary workload file written by 'generate', ordered by arrival")
+    stream.add_argument("--algorithms", nargs="+", choices=["FCFS", "Round Robin"], default=["FCFS", "Round Robin"],
+                        help="streaming algorithms to run (default: both)")
+    stream.add_argument("--quantum", type=float, default=2, help="Round Robin quantum (default: 2)")
+    stream.add_argument("--ticks-per-unit", type=int,
+                        help="run Round Robin on an integer time base with this many ticks per time unit")
+    stream.add_argument("--chunk-size", type=int, default=65536, help="rows parsed per chunk (default: 65536)")
+
+    generate = commands.add_parser("generate", help="write a random workload in the binary workload format")
+    generate.add_argument("--out", required=True, help="output file (conventionally *.psw)")
+    generate.add_argument("--config", default=os.path.join(DATA_DIR, "input.txt"),
+                          help="workload configuration (default: data/input.txt)")
+    generate.add_argument("--processes", type=int, help="override the configured number of processes")
+    generate.add_argument("--seed", type=int, help="random seed")
+
+    commands.add_parser("sweep", help="Monte Carlo sweep (options: python cli.py sweep --help)")
+    commands.add_parser("bench", help="benchmark suite with baseline checks (options: python cli.py bench --help)")
+
+    startup = commands.add_parser("startup-time", help="check cold-start time against the budget")
+    startup.add_argument("--budget-ms", type=float, default=COLD_START_BUDGET_MS,
+                         help=f"budget in milliseconds (default: {COLD_START_BUDGET_MS})")
+    startup.add_argument("--repeat", type=int, default=5, help="number of runs (default: 5)")
+
+    args = parser.parse_args(argv)
+    if args.command == "run":
+        return command_run(args)
+    if args.command == "stream":
+        return command_stream(args)
+    if args.command == "generate":
+        return command_generate(args)
+    return command_startup_time(args)
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,1213 @@
+"""Resumable scheduling engines with checkpoints.
+
+An engine holds the whole simulation state: the clock, the ready queue,
+processes that have not arrived yet and the accumulated sums. run(until)
+advances it, checkpoint() forks it, and processes arriving after the clock
+can be added to a fork before running on. A resumed run gives exactly the
+same result as a full run over the combined workload, because it replays the
+same operations in the same order.
+
+    engine = RoundRobinEngine(quantum=2)
+    engine.add_processes(arrival_times, burst_times)
+    checkpoint = engine.run(until=100).checkpoint()
+    execution_order, avg_tat, avg_wt = engine.run().result()
+
+    # Later: late arrivals (after checkpoint.clock) without starting over
+    checkpoint.add_processes(late_arrivals, late_bursts)
+    execution_order, avg_tat, avg_wt = checkpoint.run().result()
+"""
+import copy
+import heapq
+import math
+from collections import deque
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+from execution_trace import ExecutionTrace
+
+# Steps of SchedulerEngine.run_interruptible
+INTERRUPT_CHUNKS = 256
+
+class SimulationCancelled(Exception):
+    """Raised by SchedulerEngine.run_interruptible when asked to stop"""
+
+def _as_list(values: Sequence) -> list:
+    """Python list of values (NumPy arrays convert in one call)"""
+    return values.tolist() if hasattr(values, "tolist") else list(values)
+
+def _copy_state(container):
+    """Copy of a list, deque or dict, including the lists or deques nested in it"""
+    if isinstance(container, dict):
+        return {key: type(value)(value) for key, value in container.items()}
+    if container and isinstance(container[0], (list, deque)):
+        return type(container)(type(inner)(inner) for inner in container)
+    return type(container)(container)
+
+class SchedulerEngine:
+    """
+    Common state of a resumable scheduling engine.
+
+    Processes get ids in the order they are added. Processes that have not
+    been admitted yet wait in arrival order (ties by id), consumed through a
+    cursor, exactly like the one-shot algorithms.
+
+    Idle jumps are always counted. Engines whose dispatch count is not implied
+    by the number of completions count dispatches only with
+    count_decisions=True, so the uninstrumented hot loop is unchanged.
+    """
+    # Mutable per-engine state (lists and deques) copied by checkpoint()
+    _fork_state: Tuple[str, ...] = ()
+
+    def __init__(self, record_trace: bool = True, count_decisions: bool = False):
+        self.arrival_times: List[float] = []
+        self.burst_times: List[float] = []
+        self.priorities: List[int] = []
+        self.pending: List[int] = []  # Not yet admitted, ordered by arrival
+        self.next_index = 0  # Cursor into pending
+        self.clock: Optional[float] = None  # None until the first run
+        self.completed = 0
+        self.total_turnaround = 0
+        self.total_waiting = 0
+        self.execution_order = ExecutionTrace(record=record_trace)
+        self.count_decisions = count_decisions
+        self.decisions = 0  # Dispatches
+        self.idle_jumps = 0  # Times the clock skipped over an idle CPU
+        self.released = 0  # Completed processes dropped by compact()
+
+    @property
+    def num_processes(self) -> int:
+        """Processes held by the engine (all added ones unless compacted)"""
+        return len(self.arrival_times)
+
+    @property
+    def finished(self) -> bool:
+        """Whether every added process has completed"""
+        return self.completed == self.num_processes + self.released
+
+    def add_processes(self, arrival_times: Sequence[float], burst_times: Sequence[float], priorities: Optional[Sequence[int]] = None) -> range:
+        """
+        Add processes to the workload.
+
+        Once the engine has run, new processes must arrive strictly after its
+        clock; earlier arrivals would have changed decisions already taken.
+
+        Returns:
+            Range of ids given to the new processes
+        """
+        arrival = _as_list(arrival_times)
+        burst = _as_list(burst_times)
+        priority = [0] * len(arrival) if priorities is None else _as_list(priorities)
+        if not (len(arrival) == len(burst) == len(priority)):
+            raise ValueError("arrival_times, burst_times and priorities must have the same length")
+        if self.clock is not None and arrival and min(arrival) <= self.clock:
+            raise ValueError(f"Processes added after a run must arrive after the engine clock ({self.clock}); "
+                             f"got an arrival at {min(arrival)}")
+
+        first = self.num_processes
+        self.arrival_times.extend(arrival)
+        self.burst_times.extend(burst)
+        self.priorities.extend(priority)
+        self._on_added(first)
+
+        # Pending ids stay in (arrival, id) order: the old ones are already
+        # sorted and have lower ids, so a stable sort on arrival suffices
+        waiting = self.pending[self.next_index:] + list(range(first, self.num_processes))
+        self.pending = sorted(waiting, key=self.arrival_times.__getitem__)
+        self.next_index = 0
+        return range(first, self.num_processes)
+
+    def _on_added(self, first: int):
+        """Hook for per-process state of new processes (ids from first on)"""
+
+    def run(self, until: Optional[float] = None) -> "SchedulerEngine":
+        """
+        Simulate until every process has completed, or until the clock
+        reaches until (checked between dispatches).
+
+        Returns:
+            self, for chaining
+        """
+        raise NotImplementedError
+
+    def run_interruptible(self, should_stop: Callable[[], bool], chunks: int = INTERRUPT_CHUNKS) -> "SchedulerEngine":
+        """
+        Run to completion in bounded steps of simulated time, calling
+        should_stop() between steps.
+
+        The span from the first arrival to the last arrival plus all bursts
+        bounds the makespan on any number of CPUs; it is cut into chunks
+        equal steps, so a long run can be abandoned after about 1/chunks of
+        its work.
+
+        Raises:
+            SimulationCancelled: once should_stop() returns True
+        """
+        if not self.finished:
+            first = self.clock if self.clock is not None else self.arrival_times[self.pending[self.next_index]]
+            horizon = max(self.arrival_times) + sum(self.burst_times) - first
+            for chunk in range(1, chunks):
+                if self.finished:
+                    break
+                if should_stop():
+                    raise SimulationCancelled()
+                self.run(until=first + horizon * chunk / chunks)
+        if should_stop():
+            raise SimulationCancelled()
+        return self.run()
+
+    def checkpoint(self) -> "SchedulerEngine":
+        """
+        Fork the engine at its current state.
+
+        The fork owns copies of every mutable container (the engine's
+        _fork_state), so the original can keep running while the fork is
+        extended and resumed. Heaps are copied as lists in the same layout,
+        so the fork pops ties in the same order as the original would.
+        """
+        fork = copy.copy(self)
+        fork.arrival_times = list(self.arrival_times)
+        fork.burst_times = list(self.burst_times)
+        fork.priorities = list(self.priorities)
+        fork.pending = self.pending[self.next_index:]
+        fork.next_index = 0
+        fork.execution_order = self.execution_order.copy()
+        for name in self._fork_state:
+            setattr(fork, name, _copy_state(getattr(self, name)))
+        return fork
+
+    def compact(self) -> List[int]:
+        """
+        Drop completed processes and renumber the others 0, 1, ... in id
+        order, so an engine fed by add_processes() and run(until) for ever
+        holds only the processes still in the system.
+
+        Totals and counters carry over; slices already in the trace keep
+        their old ids.
+
+        Returns:
+            Old id of each kept process, indexed by its new id
+        """
+        keep = sorted(self._unfinished())
+        new_id = {old: new for new, old in enumerate(keep)}
+        self.released += self.num_processes - len(keep)
+        self.arrival_times = [self.arrival_times[old] for old in keep]
+        self.burst_times = [self.burst_times[old] for old in keep]
+        self.priorities = [self.priorities[old] for old in keep]
+        self.pending = [new_id[old] for old in self.pending[self.next_index:]]
+        self.next_index = 0
+        self._on_compacted(keep, new_id)
+        return keep
+
+    def _unfinished(self) -> List[int]:
+        """Ids of processes that have not completed, for compact()"""
+        raise NotImplementedError(f"{type(self).__name__} does not support compact()")
+
+    def _on_compacted(self, keep: List[int], new_id: Dict[int, int]):
+        """Hook to renumber per-process state after compact()"""
+
+    def _counting(self, record_slice: Callable) -> Callable:
+        """Wrap a trace append so that every dispatch is counted"""
+        def record_and_count(pid: int, start: float, end: float):
+            self.decisions += 1
+            record_slice(pid, start, end)
+        return record_and_count
+
+    def counters(self) -> Dict[str, int]:
+        """
+        Scheduling counters of the run so far (names as in instrumentation.COUNTER_NAMES).
+
+        Every dispatch takes one process off the ready queue and, unless it
+        is its first dispatch, puts it back after a preemption, so queue
+        operations are twice the decisions. A preemption ends a merged
+        trace slice without completing the process.
+        """
+        return {
+            "decisions": self.decisions,
+            "queue_ops": 2 * self.decisions,
+            "preemptions": self.execution_order.slice_count - self.completed,
+            "idle_jumps": self.idle_jumps
+        }
+
+    def result(self) -> Tuple[ExecutionTrace, float, float]:
+        """(execution_order, avg_turnaround, avg_waiting) of a finished run"""
+        if not self.finished:
+            raise ValueError(f"Only {self.completed} of {self.num_processes + self.released} processes have completed; run() first")
+        n = self.completed
+        return self.execution_order, self.total_turnaround / n, self.total_waiting / n
+
+class FCFSEngine(SchedulerEngine):
+    """First Come First Serve: processes run to completion in arrival order"""
+    def run(self, until: Optional[float] = None) -> "FCFSEngine":
+        arrival_times, burst_times = self.arrival_times, self.burst_times
+        pending, next_index = self.pending, self.next_index
+        num_pending = len(pending)
+        current_time = 0 if self.clock is None else self.clock
+        total_turnaround, total_waiting = self.total_turnaround, self.total_waiting
+        idle_jumps = self.idle_jumps
+        record_slice = self.execution_order.append
+
+        while next_index < num_pending:
+            if until is not None and current_time >= until:
+                break
+            i = pending[next_index]
+            next_index += 1
+
+            # Handle idle time between processes
+            if arrival_times[i] > current_time:
+                current_time = arrival_times[i]
+                idle_jumps += 1
+
+            record_slice(i, current_time, current_time + burst_times[i])
+            turnaround = (current_time + burst_times[i]) - arrival_times[i]
+            total_turnaround += turnaround
+            total_waiting += turnaround - burst_times[i]
+            current_time += burst_times[i]
+
+        self.completed += next_index - self.next_index
+        self.decisions = self.completed  # One dispatch per process
+        self.idle_jumps = idle_jumps
+        self.next_index = next_index
+        self.clock = current_time
+        self.total_turnaround, self.total_waiting = total_turnaround, total_waiting
+        return self
+
+class PriorityEngine(SchedulerEngine):
+    """
+    Non-preemptive priority (higher number = higher priority).
+
+    Arrived processes wait in a heap keyed on (-priority, arrival, pid).
+    """
+    _fork_state = ("ready",)
+
+    def __init__(self, record_trace: bool = True, count_decisions: bool = False):
+        super().__init__(record_trace, count_decisions)
+        self.ready: List[Tuple[int, float, int]] = []
+
+    def run(self, until: Optional[float] = None) -> "PriorityEngine":
+        arrival_times, burst_times, priorities = self.arrival_times, self.burst_times, self.priorities
+        pending, next_index = self.pending, self.next_index
+        num_pending = len(pending)
+        ready = self.ready
+        if self.clock is None and pending:
+            self.clock = arrival_times[pending[0]]  # Start at first arrival
+        current_time = self.clock
+        total_turnaround, total_waiting = self.total_turnaround, self.total_waiting
+        completed = self.completed
+        idle_jumps = self.idle_jumps
+        record_slice = self.execution_order.append
+
+        while next_index < num_pending or ready:
+            if until is not None and current_time >= until:
+                break
+            # Jump over idle gaps to the next arrival
+            if not ready and arrival_times[pending[next_index]] > current_time:
+                current_time = arrival_times[pending[next_index]]
+                idle_jumps += 1
+
+            # Push every process that has arrived by now
+            while next_index < num_pending and arrival_times[pending[next_index]] <= current_time:
+                i = pending[next_index]
+                heapq.heappush(ready, (-priorities[i], arrival_times[i], i))
+                next_index += 1
+
+            _, arrival, i = heapq.heappop(ready)  # Highest priority process
+
+            # Execute entire process (non-preemptive)
+            start = current_time
+            finish = current_time + burst_times[i]
+            total_turnaround += finish - arrival
+            total_waiting += start - arrival
+            record_slice(i, start, finish)
+            current_time = finish
+            completed += 1
+
+        self.next_index = next_index
+        self.clock = current_time
+        self.completed = completed
+        self.decisions = completed  # One dispatch per process
+        self.idle_jumps = idle_jumps
+        self.total_turnaround, self.total_waiting = total_turnaround, total_waiting
+        return self
+
+class RoundRobinEngine(SchedulerEngine):
+    """
+    Round Robin with a fixed time quantum.
+
+    The clock is rounded to round_digits decimals after every slice; pass
+    None for integer tick times, which need no rounding.
+    """
+    _fork_state = ("remaining", "ready_queue")
+
+    def __init__(self, quantum: float = 2, record_trace: bool = True, count_decisions: bool = False,
+                 round_digits: Optional[int] = 1):
+        super().__init__(record_trace, count_decisions)
+        self.quantum = quantum
+        self.round_digits = round_digits
+        self.remaining: List[float] = []  # Remaining burst per process
+        self.ready_queue = deque()
+
+    def _on_added(self, first: int):
+        self.remaining.extend(self.burst_times[first:])
+
+    def _unfinished(self) -> List[int]:
+        return list(self.ready_queue) + self.pending[self.next_index:]
+
+    def _on_compacted(self, keep: List[int], new_id: Dict[int, int]):
+        self.remaining = [self.remaining[old] for old in keep]
+        self.ready_queue = deque(new_id[pid] for pid in self.ready_queue)
+
+    def run(self, until: Optional[float] = None) -> "RoundRobinEngine":
+        arrival_times, burst_times, remaining = self.arrival_times, self.burst_times, self.remaining
+        pending, next_index = self.pending, self.next_index
+        num_pending = len(pending)
+        ready_queue = self.ready_queue
+        quantum = self.quantum
+        round_digits = self.round_digits
+        if self.clock is None and pending:
+            self.clock = arrival_times[pending[0]]  # Start at first arrival
+        time = self.clock
+        total_turnaround, total_waiting = self.total_turnaround, self.total_waiting
+        completed = self.completed
+        idle_jumps = self.idle_jumps
+        record_slice = self.execution_order.append
+        if self.count_decisions:
+            record_slice = self._counting(record_slice)
+
+        while next_index < num_pending or ready_queue:
+            if until is not None and time >= until:
+                break
+            # Add newly arrived processes to queue
+            while next_index < num_pending and arrival_times[pending[next_index]] <= time:
+                ready_queue.append(pending[next_index])
+                next_index += 1
+
+            if not ready_queue:
+                time = arrival_times[pending[next_index]]  # Jump to next arrival
+                idle_jumps += 1
+                continue
+
+            current = ready_queue.popleft()
+
+            # Execute for quantum or remaining time
+            exec_start = time
+            exec_time = min(quantum, remaining[current])
+            time += exec_time
+            if round_digits is not None:
+                time = round(time, round_digits)
+            remaining[current] -= exec_time
+            record_slice(current, exec_start, time)
+
+            # Check for new arrivals during execution
+            while next_index < num_pending and arrival_times[pending[next_index]] <= time:
+                ready_queue.append(pending[next_index])
+                next_index += 1
+
+            if remaining[current] > 0:
+                ready_queue.append(current)  # Requeue if not finished
+            else:
+                completed += 1
+                turnaround = time - arrival_times[current]
+                total_turnaround += turnaround
+                total_waiting += turnaround - burst_times[current]
+
+        self.next_index = next_index
+        self.clock = time
+        self.completed = completed
+        self.idle_jumps = idle_jumps
+        self.total_turnaround, self.total_waiting = total_turnaround, total_waiting
+        return self
+
+class SRTFEngine(SchedulerEngine):
+    """
+    Preemptive Shortest Remaining Time First.
+
+    Event-driven: the clock jumps straight to the next arrival or completion,
+    and ready processes wait in a heap keyed on (remaining, pid).
+    """
+    _fork_state = ("ready",)
+
+    def __init__(self, record_trace: bool = True, count_decisions: bool = False):
+        super().__init__(record_trace, count_decisions)
+        self.ready: List[Tuple[float, int]] = []
+
+    def run(self, until: Optional[float] = None) -> "SRTFEngine":
+        arrival_times, burst_times = self.arrival_times, self.burst_times
+        pending, next_index = self.pending, self.next_index
+        num_pending = len(pending)
+        ready = self.ready
+        if self.clock is None and pending:
+            self.clock = arrival_times[pending[0]]  # Start at first arrival
+        current_time = self.clock
+        total_turnaround, total_waiting = self.total_turnaround, self.total_waiting
+        completed = self.completed
+        idle_jumps = self.idle_jumps
+        record_slice = self.execution_order.append
+        if self.count_decisions:
+            record_slice = self._counting(record_slice)
+
+        while next_index < num_pending or ready:
+            if until is not None and current_time >= until:
+                break
+            # Jump over idle gaps to the next arrival
+            if not ready and arrival_times[pending[next_index]] > current_time:
+                current_time = arrival_times[pending[next_index]]
+                idle_jumps += 1
+
+            # Admit every process that has arrived by now
+            while next_index < num_pending and arrival_times[pending[next_index]] <= current_time:
+                i = pending[next_index]
+                heapq.heappush(ready, (burst_times[i], i))
+                next_index += 1
+
+            remaining, current = heapq.heappop(ready)
+            next_arrival = arrival_times[pending[next_index]] if next_index < num_pending else math.inf
+            finish_time = current_time + remaining
+
+            if finish_time <= next_arrival:
+                # Runs to completion before anything else can arrive
+                end_time = finish_time
+                turnaround = finish_time - arrival_times[current]
+                total_turnaround += turnaround
+                total_waiting += turnaround - burst_times[current]
+                completed += 1
+            else:
+                # Run until the next arrival, then re-evaluate
+                end_time = next_arrival
+                heapq.heappush(ready, (remaining - (next_arrival - current_time), current))
+
+            # Continuing slices of the same process are merged by the trace
+            record_slice(current, current_time, end_time)
+            current_time = end_time
+
+        self.next_index = next_index
+        self.clock = current_time
+        self.completed = completed
+        self.idle_jumps = idle_jumps
+        self.total_turnaround, self.total_waiting = total_turnaround, total_waiting
+        return self
+
+class MLFQEngine(SchedulerEngine):
+    """
+    Multilevel feedback queue.
+
+    Level 0 has the highest priority and level i runs slices of quanta[i].
+    New processes enter level 0. A process that uses its whole quantum without
+    finishing is demoted one level; the last level is plain Round Robin.
+    Every boost_interval time units every process goes back to level 0, so
+    long jobs cannot starve.
+
+    Levels are deques, and a bitmap of non-empty levels gives the highest
+    non-empty one with a lowest-set-bit trick, so picking is O(1) whatever
+    the number of levels. Level 0 is a deque of segments: a boost appends the
+    lower levels' deques to it as segments instead of moving their
+    processes, so it costs O(levels) however many processes wait.
+
+    A new level-0 process does not preempt a lower level's slice: processes
+    arriving during a slice join level 0 once it ends, before the process
+    that ran is requeued. The clock is rounded to round_digits decimals after every slice
+    (None for integer ticks).
+    """
+    _fork_state = ("remaining", "top", "lower")
+
+    def __init__(self, quanta: Sequence[float] = (2, 4, 8), boost_interval: Optional[float] = 100,
+                 record_trace: bool = True, count_decisions: bool = False, round_digits: Optional[int] = 1):
+        if not quanta:
+            raise ValueError("MLFQ needs at least one level")
+        super().__init__(record_trace, count_decisions)
+        self.quanta = list(quanta)
+        self.boost_interval = boost_interval
+        self.round_digits = round_digits
+        self.remaining: List[float] = []
+        self.top = deque([deque()])  # Level 0 segments, never holding an empty one ahead of a full one
+        self.lower = [deque() for _ in self.quanta[1:]]  # Levels 1 and up
+        self.mask = 0  # Bit i set when level i is non-empty
+        self.next_boost: Optional[float] = None
+        self.boosts = 0
+
+    def _on_added(self, first: int):
+        self.remaining.extend(self.burst_times[first:])
+
+    def run(self, until: Optional[float] = None) -> "MLFQEngine":
+        arrival_times, burst_times, remaining = self.arrival_times, self.burst_times, self.remaining
+        pending, next_index = self.pending, self.next_index
+        num_pending = len(pending)
+        quanta, round_digits, boost_interval = self.quanta, self.round_digits, self.boost_interval
+        last_level = len(quanta) - 1
+        top, lower = self.top, self.lower
+        mask = self.mask
+        if self.clock is None and pending:
+            self.clock = arrival_times[pending[0]]  # Start at first arrival
+        time = self.clock
+        next_boost = self.next_boost
+        if next_boost is None and time is not None:  # The clock is unset until a process is added
+            next_boost = time + boost_interval if boost_interval else math.inf
+        total_turnaround, total_waiting = self.total_turnaround, self.total_waiting
+        completed = self.completed
+        idle_jumps, boosts = self.idle_jumps, self.boosts
+        record_slice = self.execution_order.append
+        if self.count_decisions:
+            record_slice = self._counting(record_slice)
+        inf = math.inf
+        stop_at = inf if until is None else until
+        next_arrival = arrival_times[pending[next_index]] if next_index < num_pending else inf
+
+        while next_arrival < inf or mask:
+            if time >= stop_at:
+                break
+            # Add newly arrived processes to level 0
+            if next_arrival <= time:
+                segment = top[-1]
+                while next_index < num_pending and arrival_times[pending[next_index]] <= time:
+                    segment.append(pending[next_index])
+                    next_index += 1
+                next_arrival = arrival_times[pending[next_index]] if next_index < num_pending else inf
+                mask |= 1
+
+            if not mask:
+                time = next_arrival  # Jump to next arrival
+                idle_jumps += 1
+                continue
+
+            # Highest non-empty level from the lowest set bit
+            level = (mask & -mask).bit_length() - 1
+            if level == 0:
+                segment = top[0]
+                current = segment.popleft()
+                if not segment:
+                    if len(top) > 1:
+                        top.popleft()
+                    else:
+                        mask &= ~1
+            else:
+                queue = lower[level - 1]
+                current = queue.popleft()
+                if not queue:
+                    mask &= ~(1 << level)
+
+            # Execute for the level's quantum or the remaining time
+            exec_start = time
+            exec_time = quanta[level]
+            if remaining[current] < exec_time:
+                exec_time = remaining[current]
+            time += exec_time
+            if round_digits is not None:
+                time = round(time, round_digits)
+            remaining[current] -= exec_time
+            record_slice(current, exec_start, time)
+
+            # Check for new arrivals during execution
+            if next_arrival <= time:
+                segment = top[-1]
+                while next_index < num_pending and arrival_times[pending[next_index]] <= time:
+                    segment.append(pending[next_index])
+                    next_index += 1
+                next_arrival = arrival_times[pending[next_index]] if next_index < num_pending else inf
+                mask |= 1
+
+            boosted = time >= next_boost
+            if boosted:
+                # Lower levels become segments of level 0, in level order
+                if not top[0]:
+                    top.popleft()
+                for index, queue in enumerate(lower):
+                    if queue:
+                        top.append(queue)
+                        lower[index] = deque()
+                if not top:
+                    top.append(deque())
+                mask = 1 if top[0] else 0
+                next_boost += boost_interval * ((time - next_boost) // boost_interval + 1)
+                boosts += 1
+
+            if remaining[current] > 0:
+                # Demote after a full quantum, unless a boost just lifted everything
+                new_level = 0 if boosted else min(level + 1, last_level)
+                if new_level == 0:
+                    top[-1].append(current)
+                    mask |= 1
+                else:
+                    lower[new_level - 1].append(current)
+                    mask |= 1 << new_level
+            else:
+                completed += 1
+                turnaround = time - arrival_times[current]
+                total_turnaround += turnaround
+                total_waiting += turnaround - burst_times[current]
+
+        self.next_index = next_index
+        self.clock = time
+        self.mask = mask
+        self.next_boost = next_boost
+        self.completed = completed
+        self.idle_jumps, self.boosts = idle_jumps, boosts
+        self.total_turnaround, self.total_waiting = total_turnaround, total_waiting
+        return self
+
+    def counters(self) -> Dict[str, int]:
+        counters = super().counters()
+        counters["boosts"] = self.boosts
+        return counters
+
+def _period_start(period: int, interval: float) -> float:
+    """Earliest time t with t // interval >= period (guards float rounding of period * interval)"""
+    time = period * interval
+    while time // interval < period:
+        time = math.nextafter(time, math.inf)
+    return time
+
+class AgingPriorityEngine(SchedulerEngine):
+    """
+    Preemptive priority with aging (higher number = higher priority).
+
+    A waiting process gains one priority level every aging_interval time
+    units (counted on the global clock, so G(t) = t // aging_interval aging
+    periods have passed by time t). Its effective priority after waiting
+    since e is priority + G(t) - G(e), and the G(t) term is shared by every
+    waiting process, so the ready heap can keep the static key
+    (G(e) - priority, arrival, pid) instead of updating keys as they age:
+    the heap top is always the waiting process with the highest effective
+    priority. Each decision is one O(log n) heap operation.
+
+    The running process keeps the effective priority it was dispatched with
+    and is preempted only by a strictly higher one: by an arrival, or at the
+    start of the aging period in which the best waiting process overtakes
+    it, which is computed directly as the next event. A preempted process
+    waits again from its base priority. aging_interval=None disables aging,
+    leaving plain preemptive priority.
+
+    max_starvation is the longest single wait of any process in the ready
+    queue (from arrival or preemption until dispatch).
+    """
+    _fork_state = ("remaining", "enqueued_at", "ready")
+
+    def __init__(self, aging_interval: Optional[float] = 5, record_trace: bool = True, count_decisions: bool = False):
+        if aging_interval is not None and aging_interval <= 0:
+            raise ValueError(f"aging_interval must be positive, got {aging_interval}")
+        super().__init__(record_trace, count_decisions)
+        self.aging_interval = aging_interval
+        self.remaining: List[float] = []
+        self.enqueued_at: List[float] = []  # Start of each process's current wait
+        self.ready: List[Tuple[int, float, int]] = []  # (G(enqueued) - priority, arrival, pid)
+        self.running = -1
+        self.run_priority = 0  # Effective priority of the running process at dispatch
+        self.run_start = 0
+        self.preemptions = 0
+        self.max_starvation = 0
+
+    def _on_added(self, first: int):
+        self.remaining.extend(self.burst_times[first:])
+        self.enqueued_at.extend(self.arrival_times[first:])
+
+    def run(self, until: Optional[float] = None) -> "AgingPriorityEngine":
+        arrival_times, burst_times, priorities = self.arrival_times, self.burst_times, self.priorities
+        remaining, enqueued_at, ready = self.remaining, self.enqueued_at, self.ready
+        pending, next_index = self.pending, self.next_index
+        num_pending = len(pending)
+        interval = self.aging_interval
+        heappush, heappop = heapq.heappush, heapq.heappop
+        inf = math.inf
+        if self.clock is None and pending:
+            self.clock = arrival_times[pending[0]]  # Start at first arrival
+        time = self.clock
+        running, run_priority, run_start = self.running, self.run_priority, self.run_start
+        total_turnaround, total_waiting = self.total_turnaround, self.total_waiting
+        completed, decisions = self.completed, self.decisions
+        idle_jumps, preemptions, max_starvation = self.idle_jumps, self.preemptions, self.max_starvation
+        record_slice = self.execution_order.append
+
+        while next_index < num_pending or ready or running >= 0:
+            if until is not None and time >= until:
+                break
+            period = time // interval if interval else 0  # Aging periods so far
+
+            # Queue every process that has arrived by now
+            while next_index < num_pending and arrival_times[pending[next_index]] <= time:
+                i = pending[next_index]
+                next_index += 1
+                heappush(ready, (period - priorities[i], arrival_times[i], i))
+
+            if running < 0:
+                if not ready:
+                    time = arrival_times[pending[next_index]]  # Jump to next arrival
+                    idle_jumps += 1
+                    continue
+                key, _, running = heappop(ready)
+                run_priority, run_start = period - key, time
+                if time - enqueued_at[running] > max_starvation:
+                    max_starvation = time - enqueued_at[running]
+                decisions += 1
+            elif ready and period - ready[0][0] > run_priority:
+                # Preempted by an arrival or by an aged process
+                record_slice(running, run_start, time)
+                remaining[running] -= time - run_start
+                enqueued_at[running] = time
+                heappush(ready, (period - priorities[running], arrival_times[running], running))
+                key, _, running = heappop(ready)
+                run_priority, run_start = period - key, time
+                if time - enqueued_at[running] > max_starvation:
+                    max_starvation = time - enqueued_at[running]
+                preemptions += 1
+                decisions += 1
+
+            # Next event: completion, arrival, or the best waiting process overtaking by aging
+            finish = run_start + remaining[running]
+            next_time = arrival_times[pending[next_index]] if next_index < num_pending else inf
+            if interval and ready:
+                overtake = _period_start(run_priority + ready[0][0] + 1, interval)
+                if overtake < next_time:
+                    next_time = overtake
+            if finish <= next_time:
+                record_slice(running, run_start, finish)
+                remaining[running] = 0
+                completed += 1
+                turnaround = finish - arrival_times[running]
+                total_turnaround += turnaround
+                total_waiting += turnaround - burst_times[running]
+                running = -1
+                time = finish
+            else:
+                time = next_time
+
+        self.next_index = next_index
+        self.clock = time
+        self.running, self.run_priority, self.run_start = running, run_priority, run_start
+        self.completed, self.decisions = completed, decisions
+        self.idle_jumps, self.preemptions, self.max_starvation = idle_jumps, preemptions, max_starvation
+        self.total_turnaround, self.total_waiting = total_turnaround, total_waiting
+        return self
+
+    def counters(self) -> Dict[str, int]:
+        """Scheduling counters plus max_starvation (in time units, not a count)"""
+        return {
+            "decisions": self.decisions,
+            "queue_ops": 2 * self.decisions,
+            "preemptions": self.preemptions,
+            "idle_jumps": self.idle_jumps,
+            "max_starvation": self.max_starvation
+        }
+
+# Weight ratio between adjacent priorities (as between adjacent Linux nice levels)
+PRIORITY_WEIGHT_RATIO = 1.25
+
+def priority_weight(priority: float) -> float:
+    """Fair-share weight of a priority (higher number = higher priority = larger share)"""
+    return PRIORITY_WEIGHT_RATIO ** priority
+
+class CFSEngine(SchedulerEngine):
+    """
+    Weighted fair sharing in the style of Linux CFS.
+
+    Every process has a weight priority_weight(priority) and a virtual
+    runtime that advances by its run time divided by its weight, so heavier
+    processes age more slowly and get proportionally more CPU. Each dispatch
+    runs the ready process with the smallest (vruntime, pid). The heap holds
+    plain float vruntimes, one entry per distinct value, and a dict maps each
+    to a heap of the pids waiting at it (all arrivals admitted together share
+    the vruntime floor), so heap comparisons are float comparisons rather
+    than tuple ones. A process whose slice ends while it is still the minimum
+    runs on without touching either.
+
+    A dispatched process runs for its share of target_latency,
+    target_latency * weight / total runnable weight, but never less than
+    min_granularity (nor more than it needs). New processes start at the
+    queue's min_vruntime, a monotonic floor, so they neither jump ahead of
+    everyone by starting from zero nor wait behind the whole queue.
+
+    Slice lengths are fixed at dispatch from the runnable weight at that
+    moment; a process arriving mid-slice only joins the heap, and shortens
+    later slices through the larger total weight, when the slice ends. With
+    whole_ticks=True (integer tick times) slice lengths are truncated to
+    whole ticks.
+    """
+    _fork_state = ("remaining", "weights", "vruntime", "ready", "tied")
+
+    def __init__(self, target_latency: float = 20, min_granularity: float = 1, record_trace: bool = True,
+                 count_decisions: bool = False, whole_ticks: bool = False):
+        if min_granularity <= 0:
+            raise ValueError(f"min_granularity must be positive, got {min_granularity}")
+        super().__init__(record_trace, count_decisions)
+        self.target_latency = target_latency
+        self.min_granularity = min_granularity
+        self.whole_ticks = whole_ticks
+        self.remaining: List[float] = []
+        self.weights: List[float] = []
+        self.vruntime: List[float] = []
+        self.ready: List[float] = []  # Heap of the distinct vruntimes of waiting processes
+        self.tied: Dict[float, List[int]] = {}  # Vruntime -> heap of the pids waiting at it
+        self.min_vruntime = 0.0
+        self.total_weight = 0.0  # Of runnable processes (ready or running)
+
+    def _on_added(self, first: int):
+        self.remaining.extend(self.burst_times[first:])
+        self.weights.extend(priority_weight(priority) for priority in self.priorities[first:])
+        self.vruntime.extend(0.0 for _ in self.burst_times[first:])
+
+    def run(self, until: Optional[float] = None) -> "CFSEngine":
+        arrival_times, burst_times = self.arrival_times, self.burst_times
+        remaining, weights, vruntime = self.remaining, self.weights, self.vruntime
+        ready, tied = self.ready, self.tied
+        pending, next_index = self.pending, self.next_index
+        num_pending = len(pending)
+        target_latency, min_granularity, whole_ticks = self.target_latency, self.min_granularity, self.whole_ticks
+        heappush, heappop = heapq.heappush, heapq.heappop
+        inf = math.inf
+        stop_at = inf if until is None else until
+        if self.clock is None and pending:
+            self.clock = arrival_times[pending[0]]  # Start at first arrival
+        time = self.clock
+        min_vruntime, total_weight = self.min_vruntime, self.total_weight
+        # The process whose slice just ended; it runs on without touching the
+        # heap while it is still the minimum
+        carried = -1
+        carried_vruntime = 0.0
+        total_turnaround, total_waiting = self.total_turnaround, self.total_waiting
+        completed = self.completed
+        idle_jumps = self.idle_jumps
+        record_slice = self.execution_order.append
+        if self.count_decisions:
+            record_slice = self._counting(record_slice)
+        next_arrival = arrival_times[pending[next_index]] if next_index < num_pending else inf
+
+        while next_arrival < inf or ready or carried >= 0:
+            if time >= stop_at:
+                break
+            # Admit arrived processes at the current vruntime floor
+            if next_arrival <= time:
+                group = tied.get(min_vruntime)
+                if group is None:
+                    group = tied[min_vruntime] = []
+                    heappush(ready, min_vruntime)
+                while next_index < num_pending and arrival_times[pending[next_index]] <= time:
+                    i = pending[next_index]
+                    next_index += 1
+                    vruntime[i] = min_vruntime
+                    heappush(group, i)
+                    total_weight += weights[i]
+                next_arrival = arrival_times[pending[next_index]] if next_index < num_pending else inf
+
+            if carried >= 0 and not (ready and (ready[0] < carried_vruntime or
+                                                (ready[0] == carried_vruntime and tied[ready[0]][0] < carried))):
+                current, current_vruntime = carried, carried_vruntime
+            elif ready:
+                # Pop the smallest (vruntime, pid), then queue the carried process
+                current_vruntime = ready[0]
+                group = tied[current_vruntime]
+                if len(group) == 1:
+                    current = group[0]
+                    del tied[current_vruntime]
+                    heappop(ready)
+                else:
+                    current = heappop(group)
+                if carried >= 0:
+                    group = tied.get(carried_vruntime)
+                    if group is None:
+                        tied[carried_vruntime] = [carried]
+                        heappush(ready, carried_vruntime)
+                    else:
+                        heappush(group, carried)
+            else:
+                time = next_arrival  # Jump to next arrival
+                idle_jumps += 1
+                total_weight = 0.0  # Drop float residue of the additions and removals
+                continue
+            carried = -1
+
+            if current_vruntime > min_vruntime:
+                min_vruntime = current_vruntime
+
+            # Weighted share of the target latency, within [min_granularity, remaining]
+            weight = weights[current]
+            length = target_latency * weight / total_weight
+            if whole_ticks:
+                length = int(length)
+            if length < min_granularity:
+                length = min_granularity
+            if length > remaining[current]:
+                length = remaining[current]
+            exec_start = time
+            time += length
+            remaining[current] -= length
+            vruntime[current] = current_vruntime + length / weight
+            record_slice(current, exec_start, time)
+
+            if remaining[current] > 0:
+                carried, carried_vruntime = current, vruntime[current]
+            else:
+                total_weight -= weight
+                completed += 1
+                turnaround = time - arrival_times[current]
+                total_turnaround += turnaround
+                total_waiting += turnaround - burst_times[current]
+
+        if carried >= 0:
+            group = tied.get(carried_vruntime)
+            if group is None:
+                tied[carried_vruntime] = [carried]
+                heappush(ready, carried_vruntime)
+            else:
+                heappush(group, carried)
+        self.next_index = next_index
+        self.clock = time
+        self.min_vruntime, self.total_weight = min_vruntime, total_weight
+        self.completed = completed
+        self.idle_jumps = idle_jumps
+        self.total_turnaround, self.total_waiting = total_turnaround, total_waiting
+        return self
+
+# Policies an SMPEngine can run, by their SCHEDULERS names
+SMP_POLICIES = ("FCFS", "Round Robin", "Preemptive SRTF", "Priority Scheduling")
+
+# Run queue layouts of an SMPEngine
+SMP_QUEUES = ("global", "per-core")
+
+class SMPEngine(SchedulerEngine):
+    """
+    A scheduling policy on several CPUs.
+
+    Event-driven over two heaps: slice stop events (time, core, version) and
+    idle core ids, so time jumps straight to the next arrival or stop and
+    idle cores are filled lowest id first. A core's version changes on every
+    dispatch, which invalidates the stop event of a preempted slice lazily.
+
+    With queue="global" every core takes work from one run queue: a deque for
+    FCFS and Round Robin, a heap keyed on (-priority, arrival, pid) for
+    priority and on (remaining, pid) for SRTF. An arriving SRTF process
+    preempts the running process with the most remaining time, found through
+    a lazy max-heap of finish times, if it has less; the heap is compacted to
+    the live entries (at most one per core) whenever it outgrows 4 * cpus, as
+    stale entries of finished slices sink and would otherwise pile up for the
+    whole run. With queue="per-core"
+    each process is queued on core pid % cpus, a Round Robin or preempted
+    process goes back to the core it ran on, SRTF preempts within a core only,
+    and a core whose queue is empty steals the head of the queue that has had
+    work waiting longest (kept in a FIFO of cores, validated lazily, so a
+    steal is O(1) amortized).
+
+    With cpus=1 the schedule is the one of the single-CPU algorithm (SRTF up
+    to float rounding of remaining times, which it updates less often).
+    """
+    _fork_state = ("remaining", "queues", "backlog", "running", "run_start", "run_slice", "versions",
+                   "stops", "idle", "longest")
+
+    def __init__(self, policy: str = "FCFS", cpus: int = 4, queue: str = "global", quantum: float = 2,
+                 record_trace: bool = True, round_digits: Optional[int] = 1):
+        if policy not in SMP_POLICIES:
+            raise ValueError(f"Unknown policy {policy!r}; expected one of {', '.join(SMP_POLICIES)}")
+        if queue not in SMP_QUEUES:
+            raise ValueError(f"Unknown queue layout {queue!r}; expected one of {', '.join(SMP_QUEUES)}")
+        if cpus < 1:
+            raise ValueError(f"cpus must be at least 1, got {cpus}")
+        super().__init__(record_trace)
+        self.execution_order = ExecutionTrace(record=record_trace, cores=True)
+        self.policy = policy
+        self.cpus = cpus
+        self.per_core = queue == "per-core"
+        self.quantum = quantum
+        self.round_digits = round_digits
+        self.remaining: List[float] = []
+        fifo = policy in ("FCFS", "Round Robin")
+        self.queues = [deque() if fifo else [] for _ in range(cpus if self.per_core else 1)]
+        self.ready_count = 0
+        self.running = [-1] * cpus  # Pid per core, -1 when idle
+        self.run_start = [0] * cpus  # Start of the current slice per core
+        self.run_slice = [0] * cpus  # Planned length of the current slice per core
+        self.versions = [0] * cpus
+        self.stops: List[Tuple[float, int, int]] = []  # (time, core, version)
+        self.idle = list(range(cpus))  # Heap of idle cores
+        self.longest: List[Tuple[float, int, int, int]] = []  # Global SRTF: (-finish, -pid, core, version)
+        self.backlog = deque()  # Per-core: cores in the order their queue became non-empty
+        self.preemptions = 0
+        self.steals = 0
+
+    def _on_added(self, first: int):
+        self.remaining.extend(self.burst_times[first:])
+
+    def run(self, until: Optional[float] = None) -> "SMPEngine":
+        arrival_times, burst_times, priorities = self.arrival_times, self.burst_times, self.priorities
+        remaining = self.remaining
+        pending, next_index = self.pending, self.next_index
+        num_pending = len(pending)
+        cpus, per_core, queues = self.cpus, self.per_core, self.queues
+        shared = queues[0]
+        running, run_start, run_slice, versions = self.running, self.run_start, self.run_slice, self.versions
+        stops, idle, longest, backlog = self.stops, self.idle, self.longest, self.backlog
+        quantum, round_digits = self.quantum, self.round_digits
+        round_robin = self.policy == "Round Robin"
+        srtf = self.policy == "Preemptive SRTF"
+        by_priority = self.policy == "Priority Scheduling"
+        heappush, heappop = heapq.heappush, heapq.heappop
+        inf = math.inf
+        longest_limit = 4 * cpus
+        if self.clock is None and pending:
+            self.clock = arrival_times[pending[0]]  # Start at first arrival
+        time = self.clock
+        ready_count = self.ready_count
+        total_turnaround, total_waiting = self.total_turnaround, self.total_waiting
+        completed, decisions = self.completed, self.decisions
+        idle_jumps, preemptions, steals = self.idle_jumps, self.preemptions, self.steals
+        record_slice = self.execution_order.append_core
+        touched = set()  # Per-core SRTF: cores whose queue got an arrival at this time
+
+        # Queue operations bound once per policy
+        if isinstance(shared, deque):
+            enqueue, dequeue = deque.append, deque.popleft
+        else:
+            if srtf:
+                def enqueue(queue, pid):
+                    heappush(queue, (remaining[pid], pid))
+            else:
+                def enqueue(queue, pid):
+                    heappush(queue, (-priorities[pid], arrival_times[pid], pid))
+            def dequeue(queue) -> int:
+                return heappop(queue)[-1]
+
+        def start(core, pid, now):
+            length = remaining[pid]
+            if round_robin:
+                if quantum < length:
+                    length = quantum
+                stop = now + length
+                if round_digits is not None:
+                    stop = round(stop, round_digits)
+            else:
+                stop = now + length
+            if running[core] != pid:
+                running[core] = pid
+                run_start[core] = now  # A core rerunning its process continues the same slice
+            run_slice[core] = length
+            if srtf:
+                versions[core] += 1
+                heappush(stops, (stop, core, versions[core]))
+                if not per_core:
+                    heappush(longest, (-stop, -pid, core, versions[core]))
+                    if len(longest) > longest_limit:
+                        longest[:] = [entry for entry in longest
+                                      if entry[3] == versions[entry[2]] and running[entry[2]] >= 0]
+                        heapq.heapify(longest)
+            else:
+                heappush(stops, (stop, core, 0))  # Never invalidated without preemption
+
+        def preempt(core, now) -> int:
+            pid = running[core]
+            record_slice(core, pid, run_start[core], now)
+            remaining[pid] -= now - run_start[core]
+            running[core] = -1
+            return pid
+
+        next_arrival = arrival_times[pending[next_index]] if next_index < num_pending else inf
+        while True:
+            if srtf:
+                # Drop stop events of preempted slices
+                while stops and stops[0][2] != versions[stops[0][1]]:
+                    heappop(stops)
+            now = stops[0][0] if stops and stops[0][0] < next_arrival else next_arrival
+            if now == inf or (until is not None and now >= until):
+                break
+            if not stops and not ready_count and now > time:
+                idle_jumps += 1  # Every core was idle
+            time = now
+
+            # Admit every process that has arrived by now
+            if next_arrival <= time:
+                while next_index < num_pending and arrival_times[pending[next_index]] <= time:
+                    pid = pending[next_index]
+                    next_index += 1
+                    if per_core:
+                        core = pid % cpus
+                        if not queues[core]:
+                            backlog.append(core)
+                        enqueue(queues[core], pid)
+                        if srtf:
+                            touched.add(core)
+                    else:
+                        enqueue(shared, pid)
+                    ready_count += 1
+                next_arrival = arrival_times[pending[next_index]] if next_index < num_pending else inf
+
+            # End the slices that stop now
+            while stops and stops[0][0] <= time:
+                stop, core, version = heappop(stops)
+                if srtf and version != versions[core]:
+                    continue
+                pid = running[core]
+                start_time = run_start[core]
+                remaining[pid] -= run_slice[core]
+                queue = queues[core] if per_core else shared
+                if round_robin and remaining[pid] > 0:
+                    if per_core and not queue:
+                        backlog.append(core)
+                    enqueue(queue, pid)  # Requeue for another quantum
+                    ready_count += 1
+                    preemptions += 1
+                else:
+                    completed += 1
+                    turnaround = stop - arrival_times[pid]
+                    total_turnaround += turnaround
+                    # Same arithmetic as the single-CPU engines
+                    total_waiting += start_time - arrival_times[pid] if by_priority else turnaround - burst_times[pid]
+                if queue and not idle:
+                    # Refill at once; the same choice the idle-core pass below would make
+                    next_pid = dequeue(queue)
+                    if next_pid != pid:
+                        record_slice(core, pid, start_time, stop)
+                    start(core, next_pid, time)
+                    ready_count -= 1
+                    decisions += 1
+                else:
+                    record_slice(core, pid, start_time, stop)
+                    running[core] = -1
+                    heappush(idle, core)
+
+            # Fill idle cores, lowest id first
+            while idle and ready_count:
+                core = heappop(idle)
+                queue = queues[core] if per_core else shared
+                if not queue:
+                    # Work stealing; ready_count > 0 keeps a non-empty queue in the backlog
+                    while not queues[backlog[0]]:
+                        backlog.popleft()
+                    queue = queues[backlog[0]]
+                    steals += 1
+                start(core, dequeue(queue), time)
+                ready_count -= 1
+                decisions += 1
+
+            # SRTF: shorter arrivals preempt the longest running process
+            if srtf and not per_core:
+                while shared and not idle:
+                    while longest[0][3] != versions[longest[0][2]]:
+                        heappop(longest)
+                    core = longest[0][2]
+                    running_pid = running[core]
+                    if shared[0] >= (remaining[running_pid] - (time - run_start[core]), running_pid):
+                        break
+                    enqueue(shared, preempt(core, time))
+                    start(core, dequeue(shared), time)
+                    preemptions += 1
+                    decisions += 1
+            elif srtf and touched:
+                for core in touched:
+                    queue = queues[core]
+                    running_pid = running[core]
+                    if queue and running_pid >= 0 and queue[0] < (remaining[running_pid] - (time - run_start[core]), running_pid):
+                        enqueue(queue, preempt(core, time))
+                        start(core, dequeue(queue), time)
+                        preemptions += 1
+                        decisions += 1
+                touched.clear()
+
+        self.next_index = next_index
+        self.clock = time
+        self.ready_count = ready_count
+        self.completed, self.decisions = completed, decisions
+        self.idle_jumps, self.preemptions, self.steals = idle_jumps, preemptions, steals
+        self.total_turnaround, self.total_waiting = total_turnaround, total_waiting
+        return self
+
+    def counters(self) -> Dict[str, int]:
+        """Scheduling counters; preemptions are counted directly, since slices migrate between cores"""
+        return {
+            "decisions": self.decisions,
+            "queue_ops": 2 * self.decisions,
+            "preemptions": self.preemptions,
+            "idle_jumps": self.idle_jumps,
+            "steals": self.steals
+        }
@@ -0,0 +1,227 @@
+"""Columnar storage for execution traces."""
+from typing import TYPE_CHECKING, Iterator, List, Tuple, Union
+
+if TYPE_CHECKING:
+    import numpy as np  # Imported on first use, so importing the engines never loads NumPy
+
+class ExecutionTrace:
+    """
+    Execution slices stored column-wise in growable NumPy arrays.
+
+    Columns are pid (int32), start and end (float64). A slice that continues
+    the previous one (same pid, starting where it ended) is merged into it on
+    append. Iterating yields (pid, start, end) tuples, so a trace can be used
+    wherever a list of such tuples was expected.
+
+    With record=False nothing is stored: the trace only counts slices and
+    context switches and tracks the makespan, in O(1) memory. This is for
+    callers that need metrics but not Gantt data.
+
+    With cores=True the trace describes several CPUs: slices are added with
+    append_core(), an int16 core column is kept, and merging and context
+    switches are per core.
+    """
+    def __init__(self, capacity: int = 1024, record: bool = True, cores: bool = False):
+        self.record = record
+        self.has_cores = cores
+        import numpy as np
+        capacity = max(capacity, 1) if record else 0
+        self._pids = np.empty(capacity, dtype=np.int32)
+        self._starts = np.empty(capacity, dtype=np.float64)
+        self._ends = np.empty(capacity, dtype=np.float64)
+        self._cores = np.empty(capacity if cores else 0, dtype=np.int16)
+        self._core_last = {}  # Core -> (index, pid, end) of its last slice
+        self._size = 0
+        # Last slice as Python values, so merging never reads back from NumPy
+        self._last_pid = -1
+        self._last_end = None
+        # Running metrics, used only when not recording
+        self._slice_count = 0
+        self._context_switches = 0
+        self._makespan = 0.0
+        if not record:
+            self.append = self._count
+
+    @classmethod
+    def from_slices(cls, slices) -> "ExecutionTrace":
+        """Build a trace from an iterable of (pid, start, end) tuples"""
+        trace = cls()
+        for pid, start, end in slices:
+            trace.append(pid, start, end)
+        return trace
+
+    def append(self, pid: int, start: float, end: float):
+        """Add a slice, merging it into the previous one if it is a continuation"""
+        if pid == self._last_pid and start == self._last_end:
+            self._ends[self._size - 1] = end
+            self._last_end = end
+            return
+
+        size = self._size
+        if size == len(self._pids):
+            self._grow()
+        self._pids[size] = pid
+        self._starts[size] = start
+        self._ends[size] = end
+        self._size = size + 1
+        self._last_pid = pid
+        self._last_end = end
+
+    def append_core(self, core: int, pid: int, start: float, end: float):
+        """Add a slice run on a core, merging it into that core's previous slice if it is a continuation"""
+        last = self._core_last.get(core)
+        if end > self._makespan:
+            self._makespan = end
+        if last is not None and last[1] == pid and last[2] == start:
+            if self.record:
+                self._ends[last[0]] = end
+            self._core_last[core] = (last[0], pid, end)
+            return
+        if not self.record:
+            if last is not None and last[1] != pid:
+                self._context_switches += 1
+            self._slice_count += 1
+            self._core_last[core] = (0, pid, end)
+            return
+
+        size = self._size
+        if size == len(self._pids):
+            self._grow()
+        self._pids[size] = pid
+        self._starts[size] = start
+        self._ends[size] = end
+        self._cores[size] = core
+        self._size = size + 1
+        self._core_last[core] = (size, pid, end)
+
+    def _count(self, pid: int, start: float, end: float):
+        """append() for traces that are not recorded: update running metrics only"""
+        if end > self._makespan:
+            self._makespan = end
+        if pid == self._last_pid and start == self._last_end:
+            self._last_end = end
+            return
+        if pid != self._last_pid and self._last_pid != -1:
+            self._context_switches += 1
+        self._slice_count += 1
+        self._last_pid = pid
+        self._last_end = end
+
+    def copy(self) -> "ExecutionTrace":
+        """Independent copy that can be appended to without affecting this trace"""
+        trace = ExecutionTrace(max(self._size, 1), record=self.record)
+        trace._pids[:self._size] = self.pids
+        trace._starts[:self._size] = self.starts
+        trace._ends[:self._size] = self.ends
+        for name in ("_size", "_last_pid", "_last_end", "_slice_count", "_context_switches", "_makespan"):
+            setattr(trace, name, getattr(self, name))
+        if self.has_cores:
+            trace.has_cores = True
+            trace._cores = self._cores.copy()
+            trace._core_last = dict(self._core_last)
+        return trace
+
+    def divide_times(self, divisor: float):
+        """Divide every start and end by divisor in place (e.g. integer ticks back to time units)"""
+        self._starts[:self._size] /= divisor
+        self._ends[:self._size] /= divisor
+        if self._last_end is not None:
+            self._last_end /= divisor
+        self._core_last = {core: (index, pid, end / divisor) for core, (index, pid, end) in self._core_last.items()}
+        self._makespan /= divisor
+
+    def _grow(self):
+        """Double the capacity of every column"""
+        import numpy as np
+        capacity = 2 * len(self._pids)
+        for name in ("_pids", "_starts", "_ends", "_cores") if self.has_cores else ("_pids", "_starts", "_ends"):
+            column = getattr(self, name)
+            grown = np.empty(capacity, dtype=column.dtype)
+            grown[:self._size] = column[:self._size]
+            setattr(self, name, grown)
+
+    @property
+    def pids(self) -> "np.ndarray":
+        """Process id of each slice"""
+        return self._pids[:self._size]
+
+    @property
+    def starts(self) -> "np.ndarray":
+        """Start time of each slice"""
+        return self._starts[:self._size]
+
+    @property
+    def ends(self) -> "np.ndarray":
+        """End time of each slice"""
+        return self._ends[:self._size]
+
+    @property
+    def cores(self) -> "np.ndarray":
+        """Core of each slice (all zeros for a single-CPU trace)"""
+        if not self.has_cores:
+            import numpy as np
+            return np.zeros(self._size, dtype=np.int16)
+        return self._cores[:self._size]
+
+    @property
+    def slice_count(self) -> int:
+        """Number of (merged) slices, whether or not they were recorded"""
+        return self._size if self.record else self._slice_count
+
+    @property
+    def context_switches(self) -> int:
+        """Number of times a CPU switched from one process to another"""
+        import numpy as np
+        if self.record and self.has_cores:
+            # Slices of each core are in time order; switches happen within a core
+            order = np.argsort(self.cores, kind="stable")
+            pids, cores = self.pids[order], self.cores[order]
+            return int(np.count_nonzero((pids[1:] != pids[:-1]) & (cores[1:] == cores[:-1])))
+        if self.record:
+            return int(np.count_nonzero(self.pids[1:] != self.pids[:-1]))
+        return self._context_switches
+
+    @property
+    def makespan(self) -> float:
+        """Latest end time of any slice (0 for an empty trace)"""
+        if self.record:
+            return float(self.ends.max()) if self._size else 0.0
+        return self._makespan
+
+    @property
+    def nbytes(self) -> int:
+        """Memory used by the stored slices"""
+        itemsize = self._pids.itemsize + self._starts.itemsize + self._ends.itemsize
+        return self._size * (itemsize + self._cores.itemsize if self.has_cores else itemsize)
+
+    def __len__(self) -> int:
+        return self._size  # Stored slices; see slice_count for unrecorded traces
+
+    def __iter__(self) -> Iterator[Tuple[int, float, float]]:
+        return zip(self.pids.tolist(), self.starts.tolist(), self.ends.tolist())
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Tuple[int, float, float], List[Tuple[int, float, float]]]:
+        if isinstance(index, slice):
+            return list(zip(self.pids[index].tolist(), self.starts[index].tolist(), self.ends[index].tolist()))
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("execution trace index out of range")
+        return int(self._pids[index]), float(self._starts[index]), float(self._ends[index])
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, ExecutionTrace):
+            import numpy as np
+            return (np.array_equal(self.pids, other.pids) and np.array_equal(self.starts, other.starts)
+                    and np.array_equal(self.ends, other.ends) and np.array_equal(self.cores, other.cores))
+        try:
+            return list(self) == list(other)
+        except TypeError:
+            return NotImplemented
+
+    def __repr__(self) -> str:
+        preview = ", ".join(f"({pid}, {start:g}, {end:g})" for pid, start, end in self[:3])
+        more = ", ..." if self._size > 3 else ""
+        if not self.record:
+            return f"ExecutionTrace(record=False, slices={self._slice_count}, makespan={self._makespan:g})"
+        return f"ExecutionTrace([{preview}{more}], slices={self._size})"
@@ -0,0 +1,205 @@
+"""Scalable Gantt charts: one lane per process with level-of-detail aggregation."""
+from typing import TYPE_CHECKING, Callable, List, NamedTuple, Optional, Tuple
+import numpy as np
+from execution_trace import ExecutionTrace
+
+if TYPE_CHECKING:
+    from matplotlib.axes import Axes  # Imported lazily with the rest of matplotlib
+
+BAR_HEIGHT = 0.6  # Fraction of a lane covered by a bar
+BAR_COLOR = "#1f77b4"
+MIN_BAR_PX = 2  # Slices narrower than this are drawn as density bands
+BAND_PX = 2  # Width of one density band cell
+MIN_BAND_ALPHA = 0.35  # Opacity of the least busy non-empty band cell
+MAX_BARS = 20000  # More visible bars than this and the whole view is drawn as bands
+LABEL_CHAR_PX = 7  # Approximate width of one label character
+LABEL_MIN_LANE_PX = 12  # Lanes shorter than this get no labels
+MAX_LABELS = 300
+MAX_TICK_LABELS = 40
+
+class GanttLayers(NamedTuple):
+    """What to draw for one view of a trace"""
+    bar_lanes: np.ndarray  # Lane of each individually drawn slice
+    bar_starts: np.ndarray
+    bar_widths: np.ndarray
+    density: np.ndarray  # (rows, bins) busy fraction of each band cell, 0 to 1
+    density_extent: Tuple[float, float]  # x range covered by the bands
+    labels: List[Tuple[float, int, str]]  # (x, lane, text) of labels that fit
+
+class GanttLanes:
+    """
+    An execution trace arranged in one lane per process.
+
+    The lane layout is computed once per trace; layers() then decides, for a
+    given view and pixel size, which slices are wide enough to draw as bars
+    and aggregates the rest into density bands, so the cost of a redraw is
+    bounded by the screen size rather than the trace length.
+    """
+    def __init__(self, execution_order: ExecutionTrace):
+        if not isinstance(execution_order, ExecutionTrace):
+            execution_order = ExecutionTrace.from_slices(execution_order)
+        self.pids, lanes = np.unique(execution_order.pids, return_inverse=True)
+        self.lanes = lanes.astype(np.int32).ravel()
+        self.starts = execution_order.starts
+        self.ends = execution_order.ends
+        self.num_lanes = len(self.pids)
+        if len(self.starts):
+            self.time_range = (float(self.starts.min()), float(self.ends.max()))
+        else:
+            self.time_range = (0.0, 1.0)
+
+    def lane_label(self, lane: int) -> str:
+        """Process label of a lane"""
+        return f"P{self.pids[lane] + 1}" if 0 <= lane < self.num_lanes else ""
+
+    def layers(self, x_min: float, x_max: float, width_px: float, height_px: float) -> GanttLayers:
+        """
+        Split the slices visible in [x_min, x_max] into bars and density bands.
+
+        Args:
+            x_min: Left edge of the view in time units
+            x_max: Right edge of the view in time units
+            width_px: Width of the plot area in pixels
+            height_px: Height of the plot area in pixels
+
+        Returns:
+            GanttLayers for the view
+        """
+        span = max(x_max - x_min, 1e-12)
+        width_px = max(width_px, 1.0)
+        lane_px = max(height_px, 1.0) / max(self.num_lanes, 1)
+
+        visible = np.flatnonzero((self.ends > x_min) & (self.starts < x_max))
+        starts = self.starts[visible]
+        ends = self.ends[visible]
+        widths_px = (ends - starts) * (width_px / span)
+
+        # Bars need room both ways; otherwise everything goes to the bands
+        wide = widths_px >= MIN_BAR_PX
+        if lane_px < 1 or np.count_nonzero(wide) > MAX_BARS:
+            wide[:] = False
+        bars = visible[wide]
+        bar_widths = self.ends[bars] - self.starts[bars]
+
+        narrow = visible[~wide]
+        bins = max(int(width_px // BAND_PX), 1)
+        rows = min(self.num_lanes, max(int(height_px), 1))
+        density = np.zeros((rows, bins))
+        if len(narrow):
+            # A narrow slice spans at most a pixel or two: bin it by its midpoint
+            clipped_starts = np.maximum(self.starts[narrow], x_min)
+            clipped_ends = np.minimum(self.ends[narrow], x_max)
+            bin_width = span / bins
+            columns = np.minimum(((clipped_starts + clipped_ends) / 2 - x_min) / bin_width, bins - 1).astype(np.int64)
+            row_of_lane = self.lanes[narrow].astype(np.int64) * rows // self.num_lanes
+            busy = np.bincount(row_of_lane * bins + columns, weights=clipped_ends - clipped_starts, minlength=rows * bins)
+            lanes_per_row = self.num_lanes / rows
+            density = np.minimum(busy.reshape(rows, bins) / (bin_width * lanes_per_row), 1.0)
+
+        labels = []
+        if lane_px >= LABEL_MIN_LANE_PX:
+            for index, width in zip(bars.tolist(), bar_widths.tolist()):
+                text = f"{width:.1f}"
+                if width * width_px / span < len(text) * LABEL_CHAR_PX + 4:
+                    continue
+                left = max(self.starts[index], x_min)
+                right = min(self.ends[index], x_max)
+                if (right - left) * width_px / span >= len(text) * LABEL_CHAR_PX + 4:
+                    labels.append(((left + right) / 2, int(self.lanes[index]), text))
+                    if len(labels) == MAX_LABELS:
+                        break
+
+        return GanttLayers(self.lanes[bars], self.starts[bars], bar_widths, density, (x_min, x_max), labels)
+
+class GanttChart:
+    """
+    Draws GanttLanes on a matplotlib Axes and redraws its layers on zoom.
+
+    Bars are a single PolyCollection and density bands a single image, so
+    the number of artists stays constant however long the trace is.
+
+    Args:
+        ax: Axes to draw on
+        lanes: Lane layout of the trace
+        text_color: Color of labels
+        schedule: Runs a callable later (e.g. Tk after_idle), so a zoom that
+            changes both axis limits triggers one redraw; None redraws at once
+    """
+    def __init__(self, ax: "Axes", lanes: GanttLanes, text_color: str = "white",
+                 schedule: Optional[Callable[[Callable], None]] = None):
+        self.ax = ax
+        self.lanes = lanes
+        self.text_color = text_color
+        self.schedule = schedule
+        self._artists = []
+        self._pending = False
+
+        from matplotlib.ticker import FuncFormatter, MaxNLocator
+        num_lanes = max(lanes.num_lanes, 1)
+        x_min, x_max = lanes.time_range
+        margin = (x_max - x_min) * 0.01 or 0.5
+        ax.set_xlim(x_min - margin, x_max + margin)
+        ax.set_ylim(num_lanes - 0.5, -0.5)  # First process on top
+        ax.set_autoscale_on(False)
+        ax.yaxis.set_major_locator(MaxNLocator(nbins=min(num_lanes, MAX_TICK_LABELS), integer=True))
+        ax.yaxis.set_major_formatter(FuncFormatter(lambda y, _: lanes.lane_label(int(round(y)))))
+        ax.callbacks.connect("xlim_changed", self._on_limits_changed)
+        ax.callbacks.connect("ylim_changed", self._on_limits_changed)
+
+    def draw_layers(self):
+        """Replace the drawn layers with ones computed for the current view"""
+        from matplotlib.collections import PolyCollection
+        from matplotlib.colors import to_rgb
+
+        for artist in self._artists:
+            artist.remove()
+        self._artists = []
+
+        ax = self.ax
+        x_min, x_max = ax.get_xlim()
+        bbox = ax.get_window_extent()
+        layers = self.lanes.layers(x_min, x_max, bbox.width, bbox.height)
+
+        if len(layers.bar_lanes):
+            left = layers.bar_starts
+            right = left + layers.bar_widths
+            top = layers.bar_lanes - BAR_HEIGHT / 2
+            bottom = top + BAR_HEIGHT
+            verts = np.stack([
+                np.column_stack([left, top]), np.column_stack([left, bottom]),
+                np.column_stack([right, bottom]), np.column_stack([right, top])
+            ], axis=1)
+            bars = PolyCollection(verts, facecolors=BAR_COLOR, edgecolors="none")
+            ax.add_collection(bars, autolim=False)
+            self._artists.append(bars)
+
+        if layers.density.any():
+            rgba = np.empty(layers.density.shape + (4,))
+            rgba[..., :3] = to_rgb(BAR_COLOR)
+            # Any activity stays visible, denser cells are more opaque
+            rgba[..., 3] = np.where(layers.density > 0, MIN_BAND_ALPHA + (1 - MIN_BAND_ALPHA) * layers.density, 0)
+            band_min, band_max = layers.density_extent
+            image = ax.imshow(rgba, aspect="auto", interpolation="nearest", origin="upper",
+                              extent=(band_min, band_max, self.lanes.num_lanes - 0.5, -0.5))
+            self._artists.append(image)
+
+        for x, lane, text in layers.labels:
+            self._artists.append(ax.text(x, lane, text, ha="center", va="center",
+                                         color=self.text_color, fontsize=8, clip_on=True))
+
+    def _on_limits_changed(self, ax):
+        """Recompute the layers after a zoom or pan"""
+        if self._pending:
+            return
+        self._pending = True
+        if self.schedule is None:
+            self._redraw()
+        else:
+            self.schedule(self._redraw)
+
+    def _redraw(self):
+        """Deferred redraw of the layers"""
+        self._pending = False
+        self.draw_layers()
+        if self.schedule is not None:
+            self.ax.figure.canvas.draw_idle()
@@ -0,0 +1,90 @@
+"""Optional run instrumentation: scheduling counters and timing spans."""
+import json
+import time
+from contextlib import contextmanager, nullcontext
+from typing import Dict, Iterator, List, Optional
+
+# Counters filled by every algorithm given a counters dict; some engines add
+# their own (MLFQ boosts, aging max_starvation, SMP steals)
+COUNTER_NAMES = ("decisions", "queue_ops", "preemptions", "idle_jumps")
+
+# Timing span phases
+PHASES = ("simulate", "report-write", "render")
+
+_NO_SPAN = nullcontext()
+
+def _format_counter(value) -> str:
+    """One counter cell: '-' for a counter the algorithm does not keep"""
+    if value is None:
+        return "-"
+    return f"{value:.2f}" if isinstance(value, float) else str(value)
+
+class Profiler:
+    """
+    Counters and timing spans collected over one run.
+
+    A disabled profiler costs next to nothing: span() returns a shared no-op
+    context manager and counters_for() returns None, so algorithms skip
+    counting altogether.
+
+    Args:
+        enabled: Whether to collect anything
+    """
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self.spans: List[Dict] = []  # {"phase", "label", "seconds"} in completion order
+        self.counters: Dict[str, Dict[str, int]] = {}  # Algorithm -> counters
+
+    def span(self, phase: str, label: str = ""):
+        """Context manager timing one phase of the run (e.g. simulate of one algorithm)"""
+        if not self.enabled:
+            return _NO_SPAN
+        return self._span(phase, label)
+
+    @contextmanager
+    def _span(self, phase: str, label: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.spans.append({"phase": phase, "label": label, "seconds": time.perf_counter() - start})
+
+    def counters_for(self, algorithm: str) -> Optional[Dict[str, int]]:
+        """The dict to pass as an algorithm's counters argument, or None when disabled"""
+        if not self.enabled:
+            return None
+        return self.counters.setdefault(algorithm, {})
+
+    def phase_totals(self) -> Dict[str, float]:
+        """Total seconds per phase"""
+        totals: Dict[str, float] = {}
+        for span in self.spans:
+            totals[span["phase"]] = totals.get(span["phase"], 0.0) + span["seconds"]
+        return totals
+
+    def as_dict(self) -> Dict:
+        """JSON-ready summary: spans, totals per phase and counters per algorithm"""
+        return {"phase_totals": self.phase_totals(), "spans": list(self.spans), "counters": dict(self.counters)}
+
+    def write_json(self, path: str):
+        """Write as_dict() to a JSON file"""
+        with open(path, "w") as f:
+            json.dump(self.as_dict(), f, indent=2)
+
+    def format_report(self) -> str:
+        """Counters and span times as a text table, with a column for every counter any algorithm filled"""
+        names = list(COUNTER_NAMES)
+        for counters in self.counters.values():
+            names.extend(name for name in counters if name not in names)
+        lines = [f"{'Algorithm':<20} " + " ".join(f"{name:>14}" for name in names) + f" {'Simulate s':>12}"]
+        simulate = {span["label"]: span["seconds"] for span in self.spans if span["phase"] == "simulate"}
+        for algorithm, counters in self.counters.items():
+            if counters:
+                values = " ".join(f"{_format_counter(counters.get(name)):>14}" for name in names)
+            else:
+                values = f"{'(cached result, nothing simulated)':>{15 * len(names) - 1}}"
+            seconds = simulate.get(algorithm)
+            lines.append(f"{algorithm:<20} {values} {'-' if seconds is None else f'{seconds:.4f}':>12}")
+        totals = self.phase_totals()
+        lines.append("Phases: " + ", ".join(f"{phase} {totals[phase]:.4f} s" for phase in PHASES if phase in totals))
+        return "\n".join(lines)
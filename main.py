@@ -1,17 +1,22 @@
 """Main application entry point for the Process Scheduler."""
+import time
+STARTUP_BEGIN = time.perf_counter()  # Reference point for time-to-first-window
+
 import customtkinter as ctk  # Enhanced UI library
 import os
-import numpy as np
 import sys
-from algorithms import (  # Import scheduling algorithms
-    first_come_first_serve,
-    round_robin,
-    preemptive_shortest_remaining_time_first,
-    non_preemptive_priority
-)
-from views import InputTab, ResultsTab, VisualizationTab, ComparisonTab  # UI components
-from utils import show_error, save_results_to_file  # Helper functions
-import matplotlib.pyplot as plt
+from functools import partial
+from algorithms import SCHEDULERS, run_scheduler  # Import scheduling algorithms
+from views import InputTab, ResultsTab, VisualizationTab, ComparisonTab, StatusBar  # UI components
+from utils import show_error  # Helper functions
+from cache import SimulationCache, workload_digest  # Result cache
+from instrumentation import Profiler  # Optional counters and timing spans
+from runner import SimulationRunner  # Background execution
+from engines import SimulationCancelled  # Raised by runs stopped midway
+from workload import read_config, generate_workload  # Workload generation
+
+# Time-to-first-window above this is reported as a regression
+STARTUP_BUDGET_MS = 1000
 
 class ProcessSchedulerApp(ctk.CTk):
     def __init__(self):
@@ -29,6 +34,8 @@ class ProcessSchedulerApp(ctk.CTk):
         self.arrival_times = None
         self.burst_times = None
         self.priorities = None
+        self.workload = None  # List copies of the arrays, converted once
+        self.workload_digest = None
         
         # Create data directory if not exists
         self.data_dir = os.path.join(os.path.dirname(__file__), "data")
@@ -38,27 +45,44 @@ class ProcessSchedulerApp(ctk.CTk):
         self.protocol("WM_DELETE_WINDOW", self.on_closing)
         
         # Available scheduling algorithms
-        self.algorithms = {
-            "FCFS": first_come_first_serve,
-            "Round Robin": round_robin,
-            "Preemptive SRTF": preemptive_shortest_remaining_time_first,
-            "Priority Scheduling": non_preemptive_priority
+        self.algorithms = dict(SCHEDULERS)
+        self.algorithm_params = {
+            "Round Robin": {"quantum": 2},
+            "MLFQ": {"quanta": (2, 4, 8), "boost_interval": 100},
+            "CFS": {"target_latency": 20, "min_granularity": 1},
+            "Preemptive Priority": {"aging_interval": 5}
         }
+        self.cache = SimulationCache()
+        self.runner = SimulationRunner(self)
+        
+        # Visualization and Comparison tabs are built on first activation;
+        # until then their latest data is kept here
+        self.visualization_tab = None
+        self.comparison_tab = None
+        self.pending_visualization = None
+        self.pending_comparison = None
+        self.pending_profile = None
         
         self.create_widgets()  # Build the UI
+        
+        # Measure time to first window once it is mapped and drawn
+        self.startup_ms = None
+        self.bind("<Map>", self.on_first_map)
     
     def on_closing(self):
         """Handle window closing event"""
         # Clean up any resources if needed
-        if hasattr(self, 'visualization_tab'):
-            plt.close('all')  # Close any matplotlib figures
+        self.runner.shutdown()
         self.destroy()  # Destroy the window
         sys.exit()  # Exit the application
     
     def create_widgets(self):
         """Create all UI components"""
+        # Status bar for background runs, packed first so it keeps its space
+        self.status_bar = StatusBar(master=self, on_cancel=self.cancel_run)
+        
         # Create tabbed interface
-        self.tabview = ctk.CTkTabview(master=self)
+        self.tabview = ctk.CTkTabview(master=self, command=self.on_tab_changed)
         self.tabview.pack(fill="both", expand=True)
         
         # Add tabs
@@ -77,46 +101,128 @@ class ProcessSchedulerApp(ctk.CTk):
             master=self.tabview.tab("Results"),
             on_run=self.run_selected_algorithm
         )
-        
+
+    def on_tab_changed(self):
+        """Build deferred tabs the first time they are shown"""
+        selected_tab = self.tabview.get()
+        if selected_tab == "Visualization":
+            self.build_visualization_tab()
+        elif selected_tab == "Comparison":
+            self.build_comparison_tab()
+
+    def build_visualization_tab(self):
+        """Create the Visualization tab and show any data it missed"""
+        if self.visualization_tab is not None:
+            return
         self.visualization_tab = VisualizationTab(
             master=self.tabview.tab("Visualization"),
             algorith_var=self.results_tab.algorithm_var,
             on_run=self.run_selected_algorithm
         )
-        
+        if self.pending_visualization is not None:
+            self.visualization_tab.update_visualization(*self.pending_visualization)
+            self.pending_visualization = None
+
+    def build_comparison_tab(self):
+        """Create the Comparison tab and show any data it missed"""
+        if self.comparison_tab is not None:
+            return
         self.comparison_tab = ComparisonTab(
             master=self.tabview.tab("Comparison"), 
             algorithms=self.algorithms
         )
+        if self.pending_comparison is not None:
+            self.comparison_tab.update_data(*self.pending_comparison)
+            self.pending_comparison = None
+        if self.pending_profile is not None:
+            self.comparison_tab.show_profile(self.pending_profile)
+            self.pending_profile = None
+
+    def show_visualization(self, execution_order, title):
+        """Update the Visualization tab, or keep the data until it is built"""
+        if self.visualization_tab is None:
+            self.pending_visualization = (execution_order, title)
+        else:
+            self.visualization_tab.update_visualization(execution_order, title)
+
+    def show_comparison(self, simulations, tails=None):
+        """Update the Comparison tab, or keep the data until it is built"""
+        data = (self.arrival_times, self.burst_times, self.priorities, simulations, tails)
+        if self.comparison_tab is None:
+            self.pending_comparison = data
+        else:
+            self.comparison_tab.update_data(*data)
+
+    def show_profile(self, profiler):
+        """Show a run's profile in the Comparison tab overlay and data/profile.json, or hide the overlay"""
+        report = None
+        if profiler.enabled:
+            report = profiler.format_report()
+            profiler.write_json(os.path.join(self.data_dir, "profile.json"))
+        if self.comparison_tab is None:
+            self.pending_profile = report
+        else:
+            self.comparison_tab.show_profile(report)
+
+    def new_profiler(self):
+        """Profiler for the next run, enabled by the status bar switch"""
+        return Profiler(enabled=self.status_bar.profile_var.get())
+
+    def on_first_map(self, event):
+        """Schedule the startup report once the main window is mapped"""
+        if event.widget is not self:
+            return
+        self.unbind("<Map>")
+        self.after_idle(self.report_startup_time)
+
+    def report_startup_time(self):
+        """Report time from process start to the first drawn window"""
+        self.startup_ms = (time.perf_counter() - STARTUP_BEGIN) * 1000
+        print(f"Time to first window: {self.startup_ms:.0f} ms", file=sys.stderr)
+        if self.startup_ms > STARTUP_BUDGET_MS:
+            print(f"Startup is over its {STARTUP_BUDGET_MS} ms budget", file=sys.stderr)
+        self.status_bar.show_idle(f"Ready (started in {self.startup_ms:.0f} ms)")
 
     def generate_processes(self):
         """Generate random processes using normal distribution"""
+        input_file = os.path.join(self.data_dir, "input.txt")
         try:
-            input_file = os.path.join(self.data_dir, "input.txt")
-            # Read configuration from file
-            with open(input_file) as file:
-                num_processes = int(file.readline())
-                arrival_mean, arrival_sd = map(float, file.readline().split())
-                burst_mean, burst_sd = map(float, file.readline().split())
-                priority_lambda = float(file.readline())
+            config = read_config(input_file)  # Read configuration from file
+        except Exception as e:
+            show_error(f"Error reading from {input_file}: {str(e)}")
+            return
 
+        def generate():
             # Generate random process data
-            self.arrival_times = np.abs(np.random.normal(arrival_mean, arrival_sd, num_processes))
-            self.burst_times = np.abs(np.random.normal(burst_mean, burst_sd, num_processes))
-            self.priorities = np.abs(np.random.poisson(priority_lambda, num_processes))
-
-            # Update input tab display
-            self.input_tab.update_process_table(self.arrival_times, self.burst_times, self.priorities)
-
-            # Update comparison data
-            self.comparison_tab.update_data(
-                self.arrival_times.tolist(),
-                self.burst_times.tolist(),
-                self.priorities.tolist()
-            )
+            arrival_times, burst_times, priorities = generate_workload(config)
+            workload = (arrival_times.tolist(), burst_times.tolist(), priorities.tolist())
+            digest = workload_digest(arrival_times, burst_times, priorities)
+            return arrival_times, burst_times, priorities, workload, digest
 
-        except Exception as e:
-            show_error(f"Error reading from {input_file}: {str(e)}")
+        self.run_in_background([("Generating processes", generate)], self.on_processes_generated)
+
+    def on_processes_generated(self, results):
+        """Store a freshly generated workload and refresh the views"""
+        (self.arrival_times, self.burst_times, self.priorities,
+         self.workload, self.workload_digest) = results["Generating processes"]
+
+        # Update input tab display
+        self.input_tab.update_process_table(self.arrival_times, self.burst_times, self.priorities)
+
+        # Update comparison data
+        workload, digest = self.workload, self.workload_digest
+        profiler = self.new_profiler()
+        # The comparison only needs metrics, so skip recording execution traces
+        steps = [(f"Running {name}", partial(self.simulate, name, workload, digest, record_trace=False, profiler=profiler))
+                 for name in self.algorithms]
+        self.run_in_background(steps, partial(self.on_comparison_ready, profiler))
+
+    def on_comparison_ready(self, profiler, results):
+        """Show comparison results for the current workload"""
+        simulations = {name: results[f"Running {name}"] for name in self.algorithms}
+        with profiler.span("render", "comparison"):
+            self.show_comparison(simulations)
+        self.show_profile(profiler)
 
     def run_selected_algorithm(self):
         """Execute the selected scheduling algorithm"""
@@ -125,67 +231,107 @@ class ProcessSchedulerApp(ctk.CTk):
             return
 
         selected_algorithm = self.results_tab.get_selected_algorithm()
-        output_file = os.path.join(self.data_dir, "output.txt")
-        
-        if os.path.exists(output_file):
-            os.remove(output_file)
-        
-        # Run all algorithms for comparison
-        self.run_algorithm("First Come First Serve", first_come_first_serve, 
-                          self.arrival_times.tolist(), self.burst_times.tolist())
-        
-        self.run_algorithm("Non-Preemptive Highest Priority First", non_preemptive_priority,
-                          self.arrival_times.tolist(), self.burst_times.tolist(), self.priorities.tolist())
-        
-        self.run_algorithm("Round Robin", round_robin,
-                          self.arrival_times.tolist(), self.burst_times.tolist())
-        
-        self.run_algorithm("Preemptive Shortest Remaining Time First", preemptive_shortest_remaining_time_first,
-                          self.arrival_times.tolist(), self.burst_times.tolist())
-        
-        # Run selected algorithm for display
-        if selected_algorithm == "FCFS":
-            execution_order, avg_tat, avg_wt = first_come_first_serve(self.arrival_times.tolist(), self.burst_times.tolist())
-        elif selected_algorithm == "Round Robin":
-            execution_order, avg_tat, avg_wt = round_robin(self.arrival_times.tolist(), self.burst_times.tolist())
-        elif selected_algorithm == "Preemptive SRTF":
-            execution_order, avg_tat, avg_wt = preemptive_shortest_remaining_time_first(self.arrival_times.tolist(), self.burst_times.tolist())
-        elif selected_algorithm == "Priority Scheduling":
-            execution_order, avg_tat, avg_wt = non_preemptive_priority(
-                self.arrival_times.tolist(), self.burst_times.tolist(), self.priorities.tolist())
+        workload, digest = self.workload, self.workload_digest
+        profiler = self.new_profiler()
+
+        # Run every algorithm once (the report covers all of them), then write the report
+        steps = [(f"Running {name}", partial(self.simulate, name, workload, digest, profiler=profiler))
+                 for name in self.algorithms]
+        steps.append(("Writing report", partial(self.write_report, workload, digest, profiler, selected_algorithm)))
+        self.run_in_background(steps, partial(self.on_algorithms_done, selected_algorithm, profiler))
+
+    def on_algorithms_done(self, selected_algorithm, profiler, results):
+        """Display the selected algorithm's results once the background run finishes"""
+        simulations = {name: results[f"Running {name}"] for name in self.algorithms}
+        execution_order, avg_tat, avg_wt = simulations[selected_algorithm]
+        # Metrics were computed on the worker while writing the report; only display them here
+        per_process, tails = results["Writing report"]
         
-        # Prepare results for display
-        results = []
-        for i, start, end in execution_order:
-            arrival = self.arrival_times[i]
-            turnaround = end - arrival
-            results.append((i, arrival, start, end, turnaround))
+        with profiler.span("render", "results"):
+            self.results_tab.display_results(self.arrival_times, per_process)
+            self.results_tab.update_averages(avg_tat, avg_wt)
+            self.results_tab.update_tail_metrics(tails[selected_algorithm])
         
-        # Update all views
-        self.results_tab.display_results(results)
-        self.results_tab.update_averages(avg_tat, avg_wt)
-        self.visualization_tab.update_visualization(execution_order, selected_algorithm)
-        self.comparison_tab.update_data(
-            self.arrival_times.tolist(),
-            self.burst_times.tolist(),
-            self.priorities.tolist()
-        )
+        # Update the other views
+        with profiler.span("render", "visualization"):
+            self.show_visualization(execution_order, selected_algorithm)
+        with profiler.span("render", "comparison"):
+            self.show_comparison(simulations, tails)
+        self.show_profile(profiler)
+
+    def run_in_background(self, steps, on_done):
+        """Run steps on the worker thread, reporting progress in the status bar"""
+        def done(results):
+            self.status_bar.show_idle()
+            on_done(results)
+
+        def failed(error):
+            self.status_bar.show_idle("Failed")
+            show_error(f"Simulation failed: {str(error)}")
+
+        self.runner.submit(steps, done, on_progress=self.status_bar.show_progress, on_error=failed)
+
+    def cancel_run(self):
+        """Cancel the background run in progress"""
+        self.runner.cancel()
+        self.status_bar.show_idle("Cancelled")
     
-    def run_algorithm(self, algorithm_name, algorithm_func, *args):
-        """Run a specific algorithm and save results"""
-        execution_order, avg_tat, avg_wt = algorithm_func(*args)
-        output_file = os.path.join(self.data_dir, "output.txt")
-        
-        save_results_to_file(
-            execution_order, 
-            avg_tat, 
-            avg_wt, 
-            output_file, 
-            algorithm_name,
-            self.arrival_times.tolist(),
-            self.burst_times.tolist(),
-            self.priorities.tolist() if algorithm_name == "Priority Scheduling" else None
-        )
+    def simulate(self, name, workload=None, digest=None, record_trace=True, profiler=None):
+        """
+        Return (execution_order, avg_tat, avg_wt) for an algorithm, by default on the current workload.
+
+        With an enabled profiler the run is timed and its counters recorded;
+        a cache hit shows up as a span with empty counters.
+        """
+        if workload is None:
+            workload, digest = self.workload, self.workload_digest
+        if profiler is None:
+            profiler = Profiler(enabled=False)
+        params = dict(self.algorithm_params.get(name, {}))
+        if not record_trace:
+            params["record_trace"] = False  # Metrics-only results are cached separately
+        # Counters and the cancel check are not part of the cache key
+        with profiler.span("simulate", name):
+            return self.cache.get_or_run(
+                digest,
+                name,
+                partial(run_scheduler, name, counters=profiler.counters_for(name), should_stop=self.runner.cancelled),
+                workload,
+                params
+            )
+    
+    def write_report(self, workload, digest, profiler=None, selected=None):
+        """
+        Write every algorithm's results to data/output.txt, output.csv and output.jsonl.
+
+        Returns (per_process, tails): the per-process and fairness arrays of
+        the selected algorithm (None without one) and each algorithm's tail
+        summary, so the Results and Comparison tabs need not recompute them.
+        """
+        from metrics import fairness_metrics, process_metrics, tail_summary  # NumPy-backed, imported on first use
+        from report import REPORT_NAMES, ReportWriter
+        arrival_times, burst_times, priorities = workload
+        if profiler is None:
+            profiler = Profiler(enabled=False)
+        selected_per_process, tails = None, {}
+        with profiler.span("report-write", "report"), ReportWriter(
+            os.path.join(self.data_dir, "output.txt"),
+            csv_file=os.path.join(self.data_dir, "output.csv"),
+            jsonl_file=os.path.join(self.data_dir, "output.jsonl")
+        ) as writer:
+            writer.write_processes(arrival_times, burst_times, priorities)
+            for name in REPORT_NAMES:
+                if self.runner.cancelled():
+                    raise SimulationCancelled()
+                execution_order, avg_tat, avg_wt = self.simulate(name, workload, digest)
+                # Per-process results (correct for preemptive algorithms too), shared with the tail summary
+                per_process = process_metrics(arrival_times, burst_times, execution_order)
+                if name == selected:
+                    per_process.update(fairness_metrics(arrival_times, burst_times, priorities, execution_order, per_process))
+                    selected_per_process = per_process
+                tails[name] = tail_summary(arrival_times, burst_times, execution_order, priorities, per_process)
+                writer.write_result(name, execution_order, avg_tat, avg_wt, tails[name])
+        return selected_per_process, tails
 
 if __name__ == "__main__":
     app = ProcessSchedulerApp()  # Create application instance
@@ -0,0 +1,146 @@
+"""Per-process and tail-latency metrics computed from execution traces."""
+from typing import Dict, Optional, Sequence
+import numpy as np
+from engines import PRIORITY_WEIGHT_RATIO
+from execution_trace import ExecutionTrace
+
+PERCENTILES = (50, 95, 99)
+
+def process_metrics(arrival_times: Sequence[float], burst_times: Sequence[float], execution_order: ExecutionTrace) -> Dict[str, np.ndarray]:
+    """
+    Per-process timing vectors from a recorded execution trace.
+
+    Unlike per-slice figures, these are correct for preemptive algorithms
+    where a process runs in many slices.
+
+    Args:
+        arrival_times: Arrival time per process
+        burst_times: Burst time per process
+        execution_order: Recorded trace of the run
+
+    Slices of a process must appear in time order, as every engine appends
+    them; max_wait, the longest single wait between arrival or the end of
+    one slice and the start of the next, relies on it.
+
+    Returns:
+        Dict of arrays indexed by process id: first_start, completion,
+        turnaround, waiting, response and max_wait
+    """
+    if not execution_order.record:
+        raise ValueError("Per-process metrics need a recorded trace (record_trace=True)")
+
+    arrival = np.asarray(arrival_times, dtype=np.float64)
+    burst = np.asarray(burst_times, dtype=np.float64)
+    num_processes = len(arrival)
+
+    first_start = np.full(num_processes, np.inf)
+    completion = np.full(num_processes, -np.inf)
+    np.minimum.at(first_start, execution_order.pids, execution_order.starts)
+    np.maximum.at(completion, execution_order.pids, execution_order.ends)
+
+    # Slices grouped by process, in time order within a process (stable radix sort)
+    order = np.argsort(execution_order.pids, kind="stable")
+    pids = execution_order.pids[order]
+    starts = execution_order.starts[order]
+    previous_end = np.empty_like(starts)
+    previous_end[1:] = execution_order.ends[order][:-1]
+    first = np.ones(len(pids), dtype=bool)
+    first[1:] = pids[1:] != pids[:-1]
+    previous_end[first] = arrival[pids[first]]
+    max_wait = np.zeros(num_processes)
+    np.maximum.at(max_wait, pids, starts - previous_end)
+
+    turnaround = completion - arrival
+    return {
+        "first_start": first_start,
+        "completion": completion,
+        "turnaround": turnaround,
+        "waiting": turnaround - burst,
+        "response": first_start - arrival,
+        "max_wait": max_wait
+    }
+
+def fairness_metrics(arrival_times: Sequence[float], burst_times: Sequence[float], priorities: Sequence[int],
+                     execution_order: ExecutionTrace, per_process: Optional[Dict[str, np.ndarray]] = None) -> Dict[str, np.ndarray]:
+    """
+    Per-process fairness vectors from a recorded execution trace.
+
+    The service rate (burst / turnaround) is the share of its time in the
+    system a process spent running, and slowdown is its inverse. The
+    weighted share divides the service rate by the process's fair-share
+    weight (engines.priority_weight) and scales to a mean of 1: under ideal
+    weighted sharing every process gets 1, and a process below 1 got less
+    than its weight entitles it to relative to the others.
+
+    Pass per_process (a process_metrics() result for the same run) to reuse
+    it instead of recomputing it from the trace.
+
+    Returns:
+        Dict of arrays indexed by process id: slowdown, service_rate and
+        weighted_share
+    """
+    if per_process is None:
+        per_process = process_metrics(arrival_times, burst_times, execution_order)
+    burst = np.asarray(burst_times, dtype=np.float64)
+    service_rate = _service_rate(burst, per_process["turnaround"])
+    weighted = service_rate / PRIORITY_WEIGHT_RATIO ** np.asarray(priorities, dtype=np.float64)
+    mean = weighted.mean() if len(weighted) else 1.0
+    return {
+        "slowdown": 1 / service_rate,
+        "service_rate": service_rate,
+        "weighted_share": weighted / mean if mean > 0 else weighted
+    }
+
+def _service_rate(burst: np.ndarray, turnaround: np.ndarray) -> np.ndarray:
+    """burst / turnaround per process, 1 where the turnaround is zero"""
+    return np.divide(burst, turnaround, out=np.ones_like(burst), where=turnaround > 0)
+
+def jain_fairness(values: np.ndarray) -> float:
+    """Jain's fairness index: 1 when all values are equal, 1/n at worst"""
+    values = np.asarray(values, dtype=np.float64)
+    sum_of_squares = float(np.dot(values, values))
+    if sum_of_squares == 0:
+        return 1.0
+    return float(values.sum()) ** 2 / (len(values) * sum_of_squares)
+
+def tail_summary(arrival_times: Sequence[float], burst_times: Sequence[float], execution_order: ExecutionTrace,
+                 priorities: Optional[Sequence[int]] = None, per_process: Optional[Dict[str, np.ndarray]] = None) -> Dict:
+    """
+    Percentile summary of turnaround, waiting and response times.
+
+    All three distributions are summarised in one vectorized percentile call.
+    Fairness is Jain's index over each process's service rate
+    (burst / turnaround), the share of its time in the system spent running.
+    Given priorities, weighted fairness is Jain's index over the service rate
+    divided by each process's fair-share weight (see fairness_metrics).
+
+    Pass per_process (process_metrics() for the same run, optionally updated
+    with fairness_metrics()) to reuse the arrays instead of recomputing them.
+
+    Returns:
+        Dict with 'turnaround', 'waiting' and 'response' entries (each a dict
+        of p50, p95, p99 and max), plus 'fairness', 'max_starvation' (the
+        longest single wait of any process) and, given priorities,
+        'weighted_fairness'
+    """
+    if per_process is None:
+        per_process = process_metrics(arrival_times, burst_times, execution_order)
+    names = ("turnaround", "waiting", "response")
+    stacked = np.vstack([per_process[name] for name in names])
+    percentiles = np.percentile(stacked, PERCENTILES, axis=1)  # (len(PERCENTILES), 3)
+    maxima = stacked.max(axis=1)
+
+    summary = {}
+    for column, name in enumerate(names):
+        summary[name] = {f"p{p}": float(percentiles[row, column]) for row, p in enumerate(PERCENTILES)}
+        summary[name]["max"] = float(maxima[column])
+
+    burst = np.asarray(burst_times, dtype=np.float64)
+    service_rate = per_process.get("service_rate")
+    if service_rate is None:
+        service_rate = _service_rate(burst, per_process["turnaround"])
+    summary["fairness"] = jain_fairness(service_rate)
+    summary["max_starvation"] = float(per_process["max_wait"].max()) if len(burst) else 0.0
+    if priorities is not None:
+        summary["weighted_fairness"] = jain_fairness(service_rate / PRIORITY_WEIGHT_RATIO ** np.asarray(priorities, dtype=np.float64))
+    return summary
@@ -0,0 +1,343 @@
+"""Text, CSV and JSON-lines reports of scheduling results (no GUI dependencies)."""
+import csv
+import io
+import json
+import math
+import os
+from typing import Dict, List, Optional, Sequence, Tuple
+import numpy as np
+from execution_trace import ExecutionTrace
+
+# Report heading for each algorithm, in the order they appear in the report
+REPORT_NAMES = {
+    "FCFS": "First Come First Serve",
+    "Priority Scheduling": "Non-Preemptive Highest Priority First",
+    "Round Robin": "Round Robin",
+    "Preemptive SRTF": "Preemptive Shortest Remaining Time First",
+    "MLFQ": "Multilevel Feedback Queue",
+    "CFS": "Completely Fair Scheduler",
+    "Preemptive Priority": "Preemptive Highest Priority First with Aging"
+}
+
+CSV_HEADER = "algorithm,process,start,end\n"
+CSV_DECIMALS = 6  # Fixed decimals for CSV times
+
+# Rows rendered per block, bounding the temporary byte matrices
+FORMAT_BLOCK_ROWS = 65536
+
+# A rendered segment is an (n, width) matrix of ASCII bytes plus a mask of the
+# bytes that belong to the output; rows are joined by dropping masked-out bytes
+
+def _constant(n: int, text: str) -> Tuple[np.ndarray, np.ndarray]:
+    """Segment holding the same text in every row"""
+    encoded = text.encode("utf-8")
+    chars = np.broadcast_to(np.frombuffer(encoded, dtype=np.uint8), (n, len(encoded)))
+    return chars, np.ones(chars.shape, dtype=bool)
+
+def _digits(values: np.ndarray, min_digits: int = 1) -> Tuple[Tuple[np.ndarray, np.ndarray], np.ndarray]:
+    """
+    Segment of right-aligned decimal digits of non-negative integers.
+
+    Returns:
+        Tuple of (segment, number of digits per row)
+    """
+    largest = int(values.max()) if len(values) else 0
+    width = max(len(str(largest)), min_digits)
+    if largest < 2 ** 31:
+        values = values.astype(np.int32)  # 32-bit division is markedly faster
+    chars = np.empty((len(values), width), dtype=np.uint8)
+    remaining = values
+    for column in range(width - 1, -1, -1):
+        remaining, chars[:, column] = np.divmod(remaining, 10)
+    chars += ord("0")
+    # Keep the last min_digits digits and everything from the first non-zero one
+    powers = 10 ** np.arange(width, dtype=values.dtype)
+    lengths = np.maximum(np.searchsorted(powers, values, side="right"), min_digits)
+    mask = np.arange(width) >= (width - lengths)[:, None]
+    return (chars, mask), lengths
+
+def _sign(negative: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Segment holding '-' on negative rows"""
+    chars = np.full((len(negative), 1), ord("-"), dtype=np.uint8)
+    return chars, negative[:, None]
+
+def _pad(lengths: np.ndarray, width: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Segment of spaces that left-justifies a field of the given lengths to width"""
+    chars = np.full((len(lengths), width), ord(" "), dtype=np.uint8)
+    return chars, np.arange(width) < (width - lengths)[:, None]
+
+def _strings(texts: List[str]) -> Tuple[Tuple[np.ndarray, np.ndarray], np.ndarray]:
+    """
+    Segment of left-aligned per-row strings.
+
+    Returns:
+        Tuple of (segment, string length per row)
+    """
+    lengths = np.fromiter(map(len, texts), dtype=np.int64, count=len(texts))
+    width = int(lengths.max()) if len(texts) else 0
+    padded = "".join(text.ljust(width) for text in texts).encode("ascii")
+    chars = np.frombuffer(padded, dtype=np.uint8).reshape(len(texts), width)
+    return (chars, np.arange(width) < lengths[:, None]), lengths
+
+def _fixed(values: np.ndarray, decimals: int) -> Tuple[List[Tuple[np.ndarray, np.ndarray]], np.ndarray]:
+    """
+    Segments rendering floats like '%.{decimals}f'.
+
+    Values are scaled to integers and rendered digit by digit. Rows where the
+    scaled value is too close to a rounding tie (or too large to scale
+    exactly) are rounded by Python instead, so output matches '%.*f' exactly.
+    Rows whose scaled value does not fit in int64 are formatted by Python
+    as a whole.
+
+    Returns:
+        Tuple of (segments, field length per row)
+    """
+    values = np.asarray(values, dtype=np.float64)
+    scale = 10 ** decimals
+    scaled = np.abs(values) * scale
+    fraction = scaled - np.floor(scaled)
+    exact = (np.abs(fraction - 0.5) > 1e-6) & (scaled < 2.0 ** 52)
+    huge = scaled >= 2.0 ** 63
+    fixed = np.where(exact, np.rint(np.where(exact, scaled, 0)), 0).astype(np.int64)
+    for i in np.flatnonzero(~exact & ~huge):
+        fixed[i] = int(f"{abs(values[i]):.{decimals}f}".replace(".", ""))
+
+    negative = np.signbit(values)
+    integer_segment, lengths = _digits(fixed // scale)
+    segments = [_sign(negative), integer_segment]
+    lengths = lengths + negative
+    if decimals:
+        segments += [_constant(len(values), "."), _digits(fixed % scale, decimals)[0]]
+        lengths += decimals + 1
+    if huge.any():
+        # Mask the digit segments out of huge rows and append their Python rendering
+        segments = [(chars, mask & ~huge[:, None]) for chars, mask in segments]
+        text_segment, text_lengths = _strings([f"{value:.{decimals}f}" if is_huge else ""
+                                               for value, is_huge in zip(values, huge)])
+        segments.append(text_segment)
+        lengths = np.where(huge, text_lengths, lengths)
+    return segments, lengths
+
+def _render(segments: List[Tuple[np.ndarray, np.ndarray]]) -> bytes:
+    """Join segments row by row, keeping only masked-in bytes"""
+    n = len(segments[0][0])
+    width = sum(chars.shape[1] for chars, _ in segments)
+    chars = np.empty((n, width), dtype=np.uint8)
+    mask = np.empty((n, width), dtype=bool)
+    column = 0
+    for segment_chars, segment_mask in segments:
+        end = column + segment_chars.shape[1]
+        chars[:, column:end] = segment_chars
+        mask[:, column:end] = segment_mask
+        column = end
+    return np.compress(mask.ravel(), chars.ravel()).tobytes()
+
+def _csv_field(text: str) -> str:
+    """text as a CSV field, quoted by the csv module's rules when it holds a comma, quote or newline"""
+    buffer = io.StringIO()
+    csv.writer(buffer, lineterminator="").writerow([text])
+    return buffer.getvalue()
+
+def _json_safe(value):
+    """value with non-finite floats (which JSON cannot represent) replaced by None"""
+    if isinstance(value, dict):
+        return {key: _json_safe(item) for key, item in value.items()}
+    if isinstance(value, float) and not math.isfinite(value):
+        return None
+    return value
+
+def _ensure_trace(execution_order) -> ExecutionTrace:
+    """Accept an ExecutionTrace or any iterable of (pid, start, end) tuples"""
+    if isinstance(execution_order, ExecutionTrace):
+        return execution_order
+    return ExecutionTrace.from_slices(execution_order)
+
+class ReportWriter:
+    """
+    Writes the report of one run, opening each output file once.
+
+    The text report keeps the historical output.txt layout. Optionally the
+    same results are written as CSV (one row per execution slice) and JSON
+    lines (one summary object per algorithm) for downstream tooling. Slice
+    rows are rendered in vectorized blocks and written through a large
+    buffer, so a 1M-slice trace takes a fraction of a second.
+
+    Use as a context manager:
+
+        with ReportWriter("output.txt", csv_file="output.csv") as writer:
+            writer.write_processes(arrival_times, burst_times, priorities)
+            writer.write_result("FCFS", execution_order, avg_tat, avg_wt)
+    """
+    def __init__(
+        self,
+        output_file: str,
+        csv_file: Optional[str] = None,
+        jsonl_file: Optional[str] = None,
+        append: bool = False,
+        buffer_size: int = 1 << 20
+    ):
+        mode = "ab" if append else "wb"
+        self.text = open(output_file, mode, buffering=buffer_size)
+        self.csv = None
+        self.jsonl = None
+        try:
+            if csv_file:
+                write_header = not (append and os.path.exists(csv_file) and os.path.getsize(csv_file))
+                self.csv = open(csv_file, mode, buffering=buffer_size)
+                if write_header:
+                    self.csv.write(CSV_HEADER.encode("ascii"))
+            if jsonl_file:
+                self.jsonl = open(jsonl_file, mode, buffering=buffer_size)
+        except OSError:
+            self.close()
+            raise
+
+    def __enter__(self) -> "ReportWriter":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """Flush and close every output file"""
+        for file in (self.text, self.csv, self.jsonl):
+            if file is not None and not file.closed:
+                file.close()
+
+    def write_processes(self, arrival_times: Sequence[float], burst_times: Sequence[float], priorities: Optional[Sequence[int]] = None):
+        """Write the process table that opens the text report"""
+        arrival = np.asarray(arrival_times, dtype=np.float64)
+        burst = np.asarray(burst_times, dtype=np.float64)
+        priority = np.zeros(len(arrival), dtype=np.int64) if priorities is None else np.asarray(priorities, dtype=np.int64)
+
+        self.text.write(f"Number of processes: {len(arrival)}\n\n".encode("ascii"))
+        self.text.write(b"ID   ArrivalTime  BurstTime  Priority\n")
+        for start in range(0, len(arrival), FORMAT_BLOCK_ROWS):
+            block = slice(start, start + FORMAT_BLOCK_ROWS)
+            ids = np.arange(start + 1, start + 1 + len(arrival[block]), dtype=np.int64)
+            arrival_segments, arrival_lengths = _fixed(arrival[block], 1)
+            burst_segments, burst_lengths = _fixed(burst[block], 1)
+            priority_segments, priority_lengths = _fixed(priority[block], 0)
+            id_segment, id_lengths = _digits(ids)
+            n = len(ids)
+            # Same layout as f"{id:<4} {arrival:<12.1f} {burst:<10.1f} {priority:<10}\n"
+            self.text.write(_render(
+                [id_segment, _pad(id_lengths, 4), _constant(n, " ")]
+                + arrival_segments + [_pad(arrival_lengths, 12), _constant(n, " ")]
+                + burst_segments + [_pad(burst_lengths, 10), _constant(n, " ")]
+                + priority_segments + [_pad(priority_lengths, 10), _constant(n, "\n")]
+            ))
+        self.text.write(b"\n")
+
+    def write_result(
+        self,
+        algorithm: str,
+        execution_order,
+        avg_tat: float,
+        avg_wt: float,
+        tail_metrics: Optional[Dict] = None,
+        heading: Optional[str] = None
+    ):
+        """
+        Write one algorithm's results to every open output.
+
+        Args:
+            algorithm: Algorithm name (a SCHEDULERS key)
+            execution_order: ExecutionTrace or list of (process_id, start_time, end_time)
+            avg_tat: Average turnaround time
+            avg_wt: Average waiting time
+            tail_metrics: Optional metrics.tail_summary() for the run
+            heading: Text report heading (default: REPORT_NAMES entry)
+        """
+        trace = _ensure_trace(execution_order)
+        heading = heading or REPORT_NAMES.get(algorithm, algorithm)
+
+        self.text.write(f"=== {heading} ===\nProcess Execution Order:\n".encode("ascii"))
+        for start in range(0, len(trace), FORMAT_BLOCK_ROWS):
+            block = slice(start, start + FORMAT_BLOCK_ROWS)
+            self._write_slices(algorithm, trace.pids[block], trace.starts[block], trace.ends[block])
+
+        lines = [
+            "\nPerformance Metrics:",
+            f"Average Turnaround Time: {avg_tat:.2f}",
+            f"Average Waiting Time: {avg_wt:.2f}"
+        ]
+        if tail_metrics is not None:
+            for name in ("turnaround", "waiting", "response"):
+                values = tail_metrics[name]
+                lines.append(f"{name.capitalize()} Time p50/p95/p99/max: {values['p50']:.2f} / {values['p95']:.2f} / "
+                             f"{values['p99']:.2f} / {values['max']:.2f}")
+            lines.append(f"Jain's Fairness Index: {tail_metrics['fairness']:.4f}")
+            lines.append(f"Max Starvation Time: {tail_metrics['max_starvation']:.2f}")
+            if "weighted_fairness" in tail_metrics:
+                lines.append(f"Weighted Fairness Index: {tail_metrics['weighted_fairness']:.4f}")
+        self.text.write(("\n".join(lines) + "\n\n\n").encode("ascii"))
+
+        if self.jsonl is not None:
+            record = {
+                "algorithm": algorithm,
+                "avg_turnaround": avg_tat,
+                "avg_waiting": avg_wt,
+                "slices": trace.slice_count,
+                "context_switches": trace.context_switches,
+                "makespan": trace.makespan
+            }
+            if tail_metrics is not None:
+                record.update(tail_metrics)
+            self.jsonl.write((json.dumps(_json_safe(record), allow_nan=False) + "\n").encode("ascii"))
+
+    def _write_slices(self, algorithm: str, pids: np.ndarray, starts: np.ndarray, ends: np.ndarray):
+        """Write one block of slices to the text report and the CSV"""
+        n = len(pids)
+        pid_segment, _ = _digits(pids.astype(np.int64) + 1)
+
+        # Text: P{pid} ({start:.1f} - {end:.1f})
+        start_segments, _ = _fixed(starts, 1)
+        end_segments, _ = _fixed(ends, 1)
+        self.text.write(_render(
+            [_constant(n, "P"), pid_segment, _constant(n, " (")] + start_segments
+            + [_constant(n, " - ")] + end_segments + [_constant(n, ")\n")]
+        ))
+
+        if self.csv is not None:
+            start_segments, _ = _fixed(starts, CSV_DECIMALS)
+            end_segments, _ = _fixed(ends, CSV_DECIMALS)
+            self.csv.write(_render(
+                [_constant(n, f"{_csv_field(algorithm)},"), pid_segment, _constant(n, ",")] + start_segments
+                + [_constant(n, ",")] + end_segments + [_constant(n, "\n")]
+            ))
+
+def save_results_to_file(
+    execution_order: Sequence[Tuple[int, float, float]],
+    avg_tat: float,
+    avg_wt: float,
+    output_file: str,
+    algorithm_name: str,
+    arrival_times: Optional[List[float]] = None,
+    burst_times: Optional[List[float]] = None,
+    priorities: Optional[List[int]] = None,
+    tail_metrics: Optional[Dict] = None
+):
+    """
+    Append one algorithm's results to a text report.
+
+    Kept for callers that write one result at a time; writing a whole run
+    through a single ReportWriter avoids reopening the file per algorithm.
+
+    Args:
+        execution_order: ExecutionTrace or list of (process_id, start_time, end_time)
+        avg_tat: Average turnaround time
+        avg_wt: Average waiting time
+        output_file: Path to output file
+        algorithm_name: Name of algorithm used
+        arrival_times: Optional arrival times
+        burst_times: Optional burst times
+        priorities: Optional priorities
+        tail_metrics: Optional metrics.tail_summary() for the run
+    """
+    file_exists = os.path.exists(output_file)
+    with ReportWriter(output_file, append=file_exists) as writer:
+        # Write process data if new file
+        if not file_exists and arrival_times is not None and burst_times is not None:
+            writer.write_processes(arrival_times, burst_times, priorities)
+        writer.write_result(algorithm_name, execution_order, avg_tat, avg_wt, tail_metrics, heading=algorithm_name)
@@ -0,0 +1,130 @@
+"""Background execution of simulations for the Tk application."""
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+class SimulationRunner:
+    """
+    Run simulation jobs off the Tk main loop.
+
+    A job is a list of (label, step) pairs executed in order on a worker
+    thread. Progress, results and errors are queued and delivered on the
+    main loop by polling with after(), since Tk is not thread-safe.
+    Submitting a new job supersedes the current one: it is cancelled at
+    the next step boundary and anything it still reports is dropped. Long
+    steps can stop sooner by polling cancelled(), e.g. as the should_stop
+    argument of the scheduling algorithms; whatever a step raises after its
+    job was cancelled is dropped too.
+    """
+    def __init__(self, widget, poll_ms: int = 50):
+        self.widget = widget  # Any Tk widget, used for after()
+        self.poll_ms = poll_ms
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="simulation")
+        self._messages: "queue.Queue[Tuple[int, str, Any]]" = queue.Queue()
+        self._generation = 0  # Id of the job whose messages are still wanted
+        self._cancel_event: Optional[threading.Event] = None
+        self._callbacks: Dict[str, Optional[Callable]] = {}
+        self._polling = False
+        self._worker = threading.local()  # cancel_event of the job running on the worker thread
+
+    @property
+    def busy(self) -> bool:
+        """Whether a job is running and has not been cancelled"""
+        return self._cancel_event is not None and not self._cancel_event.is_set()
+
+    def submit(
+        self,
+        steps: List[Tuple[str, Callable[[], Any]]],
+        on_done: Callable[[Dict[str, Any]], None],
+        on_progress: Optional[Callable[[int, int, str], None]] = None,
+        on_error: Optional[Callable[[Exception], None]] = None
+    ) -> int:
+        """
+        Start a job, superseding any job still in flight.
+
+        Args:
+            steps: (label, callable) pairs run in order on the worker thread
+            on_done: Called with {label: result} once every step finished
+            on_progress: Called with (completed, total, label) after each step
+            on_error: Called with the exception if a step raises
+
+        Returns:
+            The id of the submitted job
+        """
+        self.cancel()
+        self._generation += 1
+        self._cancel_event = threading.Event()
+        self._callbacks = {"done": on_done, "progress": on_progress, "error": on_error}
+        self._executor.submit(self._work, self._generation, steps, self._cancel_event)
+        if on_progress:
+            on_progress(0, len(steps), steps[0][0] if steps else "")
+        self._schedule_poll()
+        return self._generation
+
+    def cancelled(self) -> bool:
+        """Whether the job running on the calling worker thread has been cancelled"""
+        cancel_event = getattr(self._worker, "cancel_event", None)
+        return cancel_event is not None and cancel_event.is_set()
+
+    def cancel(self):
+        """Cancel the current job and drop anything it still reports"""
+        if self._cancel_event is not None:
+            self._cancel_event.set()
+            self._cancel_event = None
+        self._generation += 1
+
+    def shutdown(self):
+        """Cancel outstanding work and release the worker thread"""
+        self.cancel()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _work(self, generation: int, steps: List[Tuple[str, Callable[[], Any]]], cancel_event: threading.Event):
+        """Worker thread body: run steps, stopping at the first boundary after a cancel"""
+        results = {}
+        self._worker.cancel_event = cancel_event
+        try:
+            for index, (label, step) in enumerate(steps):
+                if cancel_event.is_set():
+                    return
+                results[label] = step()
+                next_label = steps[index + 1][0] if index + 1 < len(steps) else label
+                self._messages.put((generation, "progress", (index + 1, len(steps), next_label)))
+            if not cancel_event.is_set():
+                self._messages.put((generation, "done", results))
+        except Exception as e:
+            if not cancel_event.is_set():
+                self._messages.put((generation, "error", e))
+        finally:
+            self._worker.cancel_event = None
+
+    def _schedule_poll(self):
+        """Start polling the message queue if not already polling"""
+        if not self._polling:
+            self._polling = True
+            self.widget.after(self.poll_ms, self._poll)
+
+    def _poll(self):
+        """Deliver queued messages on the main loop, dropping stale ones"""
+        while True:
+            try:
+                generation, kind, payload = self._messages.get_nowait()
+            except queue.Empty:
+                break
+            if generation != self._generation:
+                continue  # Superseded or cancelled job
+
+            callback = self._callbacks.get(kind)
+            if kind == "progress":
+                if callback:
+                    callback(*payload)
+                continue
+
+            self._cancel_event = None  # Job finished
+            if callback:
+                callback(payload)
+
+        if self.busy:
+            self.widget.after(self.poll_ms, self._poll)
+        else:
+            self._polling = False
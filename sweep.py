@@ -0,0 +1,185 @@
+"""Monte Carlo parameter sweeps over seeded random workloads."""
+import argparse
+import json
+import math
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from itertools import product
+from typing import Dict, List, Optional, Sequence, Tuple
+import numpy as np
+from algorithms import SCHEDULERS, run_scheduler
+from workload import WorkloadConfig, generate_workload, read_config
+
+METRICS = ("avg_tat", "avg_wt", "throughput", "context_switches")
+
+# Two-sided 95% Student t critical values by degrees of freedom
+T_CRITICAL_95 = {
+    1: 12.706, 2: 4.303, 3: 3.182, 4: 2.776, 5: 2.571, 6: 2.447, 7: 2.365,
+    8: 2.306, 9: 2.262, 10: 2.228, 11: 2.201, 12: 2.179, 13: 2.160, 14: 2.145,
+    15: 2.131, 16: 2.120, 17: 2.110, 18: 2.101, 19: 2.093, 20: 2.086,
+    25: 2.060, 30: 2.042, 40: 2.021, 60: 2.000, 120: 1.980
+}
+
+def t_critical(df: int) -> float:
+    """95% two-sided t critical value, conservative between table entries"""
+    if df <= 0:
+        return math.nan
+    if df > max(T_CRITICAL_95):
+        return 1.960
+    return T_CRITICAL_95[max(d for d in T_CRITICAL_95 if d <= df)]
+
+def run_task(task: Tuple[WorkloadConfig, int, int, Tuple[float, ...], Tuple[str, ...]]) -> List[Dict]:
+    """
+    Simulate one seeded workload under every algorithm and parameter.
+
+    Runs in a worker process. The workload is regenerated from its seed so only
+    the small task tuple and metric rows cross the process boundary.
+
+    Args:
+        task: (config, base_seed, seed_index, quantums, algorithms)
+
+    Returns:
+        One metrics row per (algorithm, quantum) run
+    """
+    config, base_seed, seed_index, quantums, algorithms = task
+    rng = np.random.default_rng((base_seed, seed_index))
+    arrival, burst, priorities = generate_workload(config, rng)
+    arrival_times, burst_times, priority_list = arrival.tolist(), burst.tolist(), priorities.tolist()
+    first_arrival = min(arrival_times)
+
+    rows = []
+    for name in algorithms:
+        # Only Round Robin depends on the quantum
+        params_list = [{"quantum": q} for q in quantums] if name == "Round Robin" else [{}]
+        for params in params_list:
+            execution_order, avg_tat, avg_wt = run_scheduler(name, arrival_times, burst_times, priority_list,
+                                                             record_trace=False, **params)
+            makespan = execution_order.makespan - first_arrival
+            rows.append({
+                "algorithm": name,
+                "num_processes": config.num_processes,
+                "quantum": params.get("quantum"),
+                "seed": seed_index,
+                "avg_tat": avg_tat,
+                "avg_wt": avg_wt,
+                "throughput": config.num_processes / makespan if makespan > 0 else 0.0,
+                "context_switches": execution_order.context_switches
+            })
+    return rows
+
+def aggregate(rows: List[Dict]) -> List[Dict]:
+    """
+    Summarise sweep rows per (algorithm, num_processes, quantum).
+
+    Returns:
+        Rows with sample count and, for each metric, its mean and the
+        half-width of a 95% confidence interval
+    """
+    groups: Dict[Tuple, List[Dict]] = {}
+    for row in rows:
+        groups.setdefault((row["algorithm"], row["num_processes"], row["quantum"]), []).append(row)
+
+    summary = []
+    for (algorithm, num_processes, quantum), group in groups.items():
+        entry = {"algorithm": algorithm, "num_processes": num_processes, "quantum": quantum, "samples": len(group)}
+        for metric in METRICS:
+            values = np.array([row[metric] for row in group], dtype=np.float64)
+            entry[f"{metric}_mean"] = float(values.mean())
+            if len(values) > 1:
+                sem = values.std(ddof=1) / math.sqrt(len(values))
+                entry[f"{metric}_ci95"] = float(t_critical(len(values) - 1) * sem)
+            else:
+                entry[f"{metric}_ci95"] = math.nan
+        summary.append(entry)
+    return summary
+
+def run_sweep(
+    config: WorkloadConfig,
+    seeds: int,
+    quantums: Sequence[float] = (2,),
+    process_counts: Optional[Sequence[int]] = None,
+    algorithms: Optional[Sequence[str]] = None,
+    base_seed: int = 0,
+    workers: Optional[int] = None
+) -> List[Dict]:
+    """
+    Run every algorithm over seeded workloads and a parameter grid.
+
+    Each (process count, seed) pair is one task; tasks are spread across a
+    ProcessPoolExecutor. The same seed index yields the same random stream for
+    every grid point, so algorithms and parameters are compared on common
+    workloads.
+
+    Args:
+        config: Base workload parameters
+        seeds: Number of seeded workloads per grid point
+        quantums: Round Robin quantum values to sweep
+        process_counts: Process counts to sweep (default: config.num_processes)
+        algorithms: Algorithm names (default: all of SCHEDULERS)
+        base_seed: Seed shared by the whole sweep
+        workers: Worker processes (default: all cores); 1 runs in-process
+
+    Returns:
+        One metrics row per (algorithm, process count, quantum, seed)
+    """
+    algorithms = tuple(algorithms or SCHEDULERS)
+    unknown = [name for name in algorithms if name not in SCHEDULERS]
+    if unknown:
+        raise ValueError(f"Unknown algorithms: {', '.join(unknown)}")
+    process_counts = process_counts or [config.num_processes]
+    tasks = [
+        (config._replace(num_processes=n), base_seed, seed, tuple(quantums), algorithms)
+        for n, seed in product(process_counts, range(seeds))
+    ]
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        return [row for task_rows in map(run_task, tasks) for row in task_rows]
+
+    # A few chunks per worker keeps scheduling overhead low while balancing load
+    chunksize = max(1, len(tasks) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return [row for task_rows in executor.map(run_task, tasks, chunksize=chunksize) for row in task_rows]
+
+def format_summary(summary: List[Dict]) -> str:
+    """Format aggregated rows as a text table"""
+    lines = [f"{'Algorithm':<20} {'N':>8} {'Quantum':>8} {'Runs':>6} "
+             f"{'Avg Turnaround':>22} {'Avg Waiting':>22} {'Throughput':>20} {'Switches':>10}"]
+    for entry in sorted(summary, key=lambda e: (e["num_processes"], e["algorithm"], e["quantum"] or 0)):
+        quantum = "-" if entry["quantum"] is None else f"{entry['quantum']:g}"
+        lines.append(
+            f"{entry['algorithm']:<20} {entry['num_processes']:>8} {quantum:>8} {entry['samples']:>6} "
+            f"{entry['avg_tat_mean']:>12.2f} ± {entry['avg_tat_ci95']:<7.2f} "
+            f"{entry['avg_wt_mean']:>12.2f} ± {entry['avg_wt_ci95']:<7.2f} "
+            f"{entry['throughput_mean']:>10.4f} ± {entry['throughput_ci95']:<7.4f} "
+            f"{entry['context_switches_mean']:>10.1f}"
+        )
+    return "\n".join(lines)
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(description="Monte Carlo sweep of scheduling algorithms")
+    parser.add_argument("--config", default=os.path.join(os.path.dirname(__file__), "data", "input.txt"),
+                        help="workload configuration file (default: data/input.txt)")
+    parser.add_argument("--seeds", type=int, default=100, help="seeded workloads per grid point")
+    parser.add_argument("--quantum", type=float, nargs="+", default=[2], help="Round Robin quantum values")
+    parser.add_argument("--processes", type=int, nargs="+", help="process counts (default: from config)")
+    parser.add_argument("--algorithms", nargs="+", choices=list(SCHEDULERS), help="algorithms to run (default: all)")
+    parser.add_argument("--base-seed", type=int, default=0, help="seed shared by the whole sweep")
+    parser.add_argument("--workers", type=int, help="worker processes (default: all cores)")
+    parser.add_argument("--json", help="write per-run rows and summary to this JSON file")
+    args = parser.parse_args(argv)
+
+    config = read_config(args.config)
+    rows = run_sweep(config, args.seeds, args.quantum, args.processes, args.algorithms, args.base_seed, args.workers)
+    summary = aggregate(rows)
+    print(format_summary(summary))
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"rows": rows, "summary": summary}, f, indent=2)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
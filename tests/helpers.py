@@ -0,0 +1,48 @@
+"""Shared helpers for the scheduler tests."""
+import random
+
+import pytest
+
+def random_workload(seed: int, granularity: float = 0.1, max_processes: int = 40):
+    """(arrival, burst, priority) lists on a time grid of the given granularity"""
+    rng = random.Random(seed)
+    n = rng.randint(1, max_processes)
+    steps = round(1 / granularity)
+    arrival = [rng.randint(0, 40 * steps) / steps for _ in range(n)]
+    burst = [rng.randint(1, 8 * steps) / steps for _ in range(n)]
+    priority = [rng.randint(0, 6) for _ in range(n)]
+    return arrival, burst, priority
+
+def assert_same_schedule(got, expected):
+    """Traces are identical and the averages agree"""
+    assert got[0] == expected[0]
+    assert got[1] == pytest.approx(expected[1], abs=1e-9)
+    assert got[2] == pytest.approx(expected[2], abs=1e-9)
+
+def assert_resume_equals_full_run(make_engine, seed: int):
+    """
+    Run part of a random workload, fork it, add later arrivals to the fork
+    and check both the fork and the original against uninterrupted runs.
+    """
+    arrival, burst, priority = random_workload(seed)
+    k = random.Random(seed).randint(1, len(arrival))
+    engine = make_engine()
+    engine.add_processes(arrival[:k], burst[:k], priority[:k])
+    engine.run(until=random.Random(-seed).uniform(0, 40))
+    fork = engine.checkpoint()
+
+    # Late arrivals join the fork only; the original keeps going unchanged
+    late = [process for process in zip(arrival[k:], burst[k:], priority[k:]) if process[0] > fork.clock]
+    if late:
+        fork.add_processes(*zip(*late))
+    engine.run()
+
+    full = make_engine()
+    full.add_processes(arrival[:k], burst[:k], priority[:k])
+    if late:
+        full.add_processes(*zip(*late))
+    assert_same_schedule(fork.run().result(), full.run().result())
+
+    alone = make_engine()
+    alone.add_processes(arrival[:k], burst[:k], priority[:k])
+    assert_same_schedule(engine.result(), alone.run().result())
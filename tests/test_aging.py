@@ -0,0 +1,81 @@
+"""Tests for preemptive priority with aging."""
+import random
+
+import pytest
+
+from algorithms import preemptive_priority
+from engines import AgingPriorityEngine
+from execution_trace import ExecutionTrace
+from helpers import assert_resume_equals_full_run
+
+def reference_aging(arrival, burst, priority, interval):
+    """Tick-by-tick preemptive priority with aging on integer times"""
+    n = len(arrival)
+    remaining = list(burst)
+    enqueued = list(arrival)
+    level = (lambda t: t // interval) if interval else (lambda t: 0)
+    key = lambda i: (level(enqueued[i]) - priority[i], arrival[i], i)
+    ready = set()
+    arrived = [False] * n
+    running, running_key = -1, None
+    trace = ExecutionTrace()
+    time, done = min(arrival), 0
+    while done < n:
+        for i in range(n):
+            if not arrived[i] and arrival[i] <= time:
+                arrived[i] = True
+                ready.add(i)
+        if ready:
+            best = min(ready, key=key)
+            # Effective priority: static priority plus the levels gained while waiting
+            if running < 0 or level(time) - key(best)[0] > running_key:
+                if running >= 0:
+                    ready.add(running)
+                    enqueued[running] = time
+                ready.remove(best)
+                running, running_key = best, level(time) - key(best)[0]
+        if running >= 0:
+            trace.append(running, time, time + 1)
+            remaining[running] -= 1
+            if remaining[running] == 0:
+                done += 1
+                running = -1
+        time += 1
+    return trace
+
+@pytest.mark.parametrize("seed", range(100))
+def test_aging_equals_reference(seed):
+    rng = random.Random(seed)
+    n = rng.randint(1, 25)
+    arrival = [rng.randint(0, 80) for _ in range(n)]
+    burst = [rng.randint(1, 30) for _ in range(n)]
+    priority = [rng.randint(0, 10) for _ in range(n)]
+    interval = rng.choice([None, 1, 3, 10])
+    expected = reference_aging(arrival, burst, priority, interval)
+
+    assert preemptive_priority(arrival, burst, priority, interval)[0] == expected
+    ticks, _, _ = preemptive_priority([t / 10 for t in arrival], [t / 10 for t in burst], priority,
+                                      interval / 10 if interval else None, ticks_per_unit=10)
+    assert [(pid, round(start * 10), round(end * 10)) for pid, start, end in ticks] == list(expected)
+
+@pytest.mark.parametrize("interval", [None, 3])
+@pytest.mark.parametrize("seed", range(40))
+def test_resume_equals_full_run(interval, seed):
+    assert_resume_equals_full_run(lambda: AgingPriorityEngine(interval), seed)
+
+def test_aging_bounds_starvation():
+    # P1 gains a level per time unit and overtakes P0 (priority 5) once it is strictly higher, at t=6
+    counters, unaged = {}, {}
+    trace, _, _ = preemptive_priority([0, 0], [10, 1], [5, 0], 1, counters=counters)
+    assert list(trace) == [(0, 0, 6), (1, 6, 7), (0, 7, 11)]
+    assert counters["max_starvation"] == 6 and counters["preemptions"] == 1
+    preemptive_priority([0, 0], [10, 1], [5, 0], None, counters=unaged)
+    assert unaged["max_starvation"] == 10 and unaged["preemptions"] == 0
+
+def test_higher_priority_arrival_preempts():
+    trace, _, _ = preemptive_priority([0, 2], [5, 1], [1, 4], None)
+    assert list(trace) == [(0, 0, 2), (1, 2, 3), (0, 3, 6)]
+
+def test_rejects_non_positive_interval():
+    with pytest.raises(ValueError, match="aging_interval"):
+        AgingPriorityEngine(0)
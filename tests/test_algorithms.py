@@ -0,0 +1,147 @@
+"""Tests for the one-shot scheduling algorithms against straightforward references."""
+import random
+
+import numpy as np
+import pytest
+
+from algorithms import (first_come_first_serve, first_come_first_serve_batch, non_preemptive_priority,
+                        preemptive_shortest_remaining_time_first, round_robin)
+from execution_trace import ExecutionTrace
+
+def integer_workload(seed: int, max_processes: int = 25):
+    """Integer arrival and burst times, exact in float arithmetic"""
+    rng = random.Random(seed)
+    n = rng.randint(1, max_processes)
+    arrival = [rng.randint(0, 60) for _ in range(n)]
+    burst = [rng.randint(1, 12) for _ in range(n)]
+    priority = [rng.randint(0, 5) for _ in range(n)]
+    return arrival, burst, priority
+
+def averages(arrival, burst, trace):
+    """Average turnaround and waiting time from a trace's completion times"""
+    completion = {}
+    for pid, _, end in trace:
+        completion[pid] = end
+    turnaround = [completion[i] - arrival[i] for i in range(len(arrival))]
+    return sum(turnaround) / len(arrival), sum(t - b for t, b in zip(turnaround, burst)) / len(arrival)
+
+def reference_srtf(arrival, burst):
+    """Unit-step SRTF: every tick runs the arrived process with the least remaining time (ties by pid)"""
+    remaining = list(burst)
+    trace = ExecutionTrace()
+    time, done = min(arrival), 0
+    while done < len(arrival):
+        ready = [i for i in range(len(arrival)) if arrival[i] <= time and remaining[i] > 0]
+        if not ready:
+            time += 1
+            continue
+        current = min(ready, key=lambda i: (remaining[i], i))
+        trace.append(current, time, time + 1)
+        remaining[current] -= 1
+        done += remaining[current] == 0
+        time += 1
+    return trace
+
+@pytest.mark.parametrize("seed", range(60))
+def test_srtf_equals_unit_step_reference(seed):
+    arrival, burst, _ = integer_workload(seed)
+    expected = reference_srtf(arrival, burst)
+    trace, avg_tat, avg_wt = preemptive_shortest_remaining_time_first(arrival, burst)
+    assert trace == expected
+    assert (avg_tat, avg_wt) == pytest.approx(averages(arrival, burst, expected))
+
+def test_srtf_preempts_for_shorter_arrival():
+    trace, avg_tat, avg_wt = preemptive_shortest_remaining_time_first([0, 1, 2], [8, 2, 4])
+    assert list(trace) == [(0, 0, 1), (1, 1, 3), (2, 3, 7), (0, 7, 14)]
+    assert avg_tat == pytest.approx((14 + 2 + 5) / 3)
+    assert avg_wt == pytest.approx((6 + 0 + 1) / 3)
+
+def test_srtf_skips_idle_gaps():
+    trace, _, _ = preemptive_shortest_remaining_time_first([0, 1000], [1, 1])
+    assert list(trace) == [(0, 0, 1), (1, 1000, 1001)]
+
+def reference_round_robin(arrival, burst, quantum):
+    """List-based Round Robin; processes arriving during a slice queue ahead of the preempted one"""
+    order = sorted(range(len(arrival)), key=lambda i: arrival[i])
+    remaining = list(burst)
+    queue = []
+    trace = ExecutionTrace()
+    time = arrival[order[0]]
+    while order or queue:
+        while order and arrival[order[0]] <= time:
+            queue.append(order.pop(0))
+        if not queue:
+            time = arrival[order[0]]
+            continue
+        current = queue.pop(0)
+        run = min(quantum, remaining[current])
+        trace.append(current, time, time + run)
+        time += run
+        remaining[current] -= run
+        while order and arrival[order[0]] <= time:
+            queue.append(order.pop(0))
+        if remaining[current] > 0:
+            queue.append(current)
+    return trace
+
+@pytest.mark.parametrize("quantum", [0.5, 2, 5])
+@pytest.mark.parametrize("seed", range(40))
+def test_round_robin_equals_list_reference(seed, quantum):
+    arrival, burst, _ = integer_workload(seed)
+    expected = reference_round_robin(arrival, burst, quantum)
+    trace, avg_tat, avg_wt = round_robin(arrival, burst, quantum)
+    assert trace == expected
+    assert (avg_tat, avg_wt) == pytest.approx(averages(arrival, burst, expected))
+
+def test_round_robin_rounds_the_clock_to_a_tenth():
+    # Without rounding, 0.1 + 0.2 would end the first slice at 0.30000000000000004
+    trace, _, _ = round_robin([0.1, 0.1], [0.2, 0.2], 2)
+    assert list(trace) == [(0, 0.1, 0.3), (1, 0.3, 0.5)]
+
+def reference_priority(arrival, burst, priority):
+    """Non-preemptive priority by linear scan: highest priority first, then earliest arrival, then lowest pid"""
+    waiting = set(range(len(arrival)))
+    trace = ExecutionTrace()
+    time = min(arrival)
+    while waiting:
+        ready = [i for i in waiting if arrival[i] <= time]
+        if not ready:
+            time = min(arrival[i] for i in waiting)
+            continue
+        current = min(ready, key=lambda i: (-priority[i], arrival[i], i))
+        waiting.remove(current)
+        trace.append(current, time, time + burst[current])
+        time += burst[current]
+    return trace
+
+@pytest.mark.parametrize("seed", range(60))
+def test_priority_equals_linear_scan_reference(seed):
+    arrival, burst, priority = integer_workload(seed)
+    expected = reference_priority(arrival, burst, priority)
+    trace, avg_tat, avg_wt = non_preemptive_priority(arrival, burst, priority)
+    assert trace == expected
+    assert (avg_tat, avg_wt) == pytest.approx(averages(arrival, burst, expected))
+
+def test_priority_jumps_idle_gaps_without_stepping():
+    trace, avg_tat, avg_wt = non_preemptive_priority([0, 1e9], [2, 3], [1, 5])
+    assert list(trace) == [(0, 0, 2), (1, 1e9, 1e9 + 3)]
+    assert (avg_tat, avg_wt) == (2.5, 0)
+
+def test_fcfs_batch_matches_fcfs_per_workload():
+    rng = np.random.default_rng(4)
+    arrival = rng.uniform(0, 50, (8, 30)).round(1)
+    burst = rng.uniform(0.1, 5, (8, 30)).round(1)
+    start, finish, avg_tat, avg_wt = first_come_first_serve_batch(arrival, burst)
+    assert start.shape == finish.shape == (8, 30) and avg_tat.shape == avg_wt.shape == (8,)
+    for row in range(8):
+        trace, tat, wt = first_come_first_serve(arrival[row].tolist(), burst[row].tolist())
+        np.testing.assert_allclose(start[row, trace.pids], trace.starts)
+        np.testing.assert_allclose(finish[row, trace.pids], trace.ends)
+        assert (avg_tat[row], avg_wt[row]) == pytest.approx((tat, wt))
+
+def test_fcfs_batch_accepts_one_workload_and_rejects_mismatched_shapes():
+    start, finish, avg_tat, avg_wt = first_come_first_serve_batch([2, 0, 0], [1, 3, 1])
+    np.testing.assert_array_equal(start, [[4, 0, 3]])
+    np.testing.assert_array_equal(finish, [[5, 3, 4]])
+    with pytest.raises(ValueError, match="same shape"):
+        first_come_first_serve_batch(np.zeros((2, 3)), np.zeros((3, 2)))
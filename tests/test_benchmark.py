@@ -0,0 +1,69 @@
+"""Tests for the benchmark suite's bookkeeping."""
+import inspect
+import json
+import os
+
+import pytest
+
+import algorithms
+import benchmark
+from engines import SMP_QUEUES
+from workload import read_config
+
+def row(name, n, seconds, events=100, peak_bytes=1000):
+    return {"benchmark": name, "num_processes": n, "seconds": seconds, "events": events, "peak_bytes": peak_bytes}
+
+def test_every_scheduling_function_is_benchmarked():
+    functions = {name for name, value in inspect.getmembers(algorithms, inspect.isfunction)
+                 if value.__module__ == "algorithms" and not name.startswith("_") and name != "run_scheduler"}
+    benchmarks = benchmark.make_benchmarks(quantums=(1, 4))
+    assert {b.function for b in benchmarks} == functions
+    names = [b.name for b in benchmarks]
+    assert len(set(names)) == len(names)
+    assert {"round_robin[q=1]", "round_robin_stream[q=4]"} <= set(names)
+    assert {f"multi_cpu[{queue}]" for queue in SMP_QUEUES} <= set(names)
+
+def test_run_benchmarks_counts_events_per_size():
+    config = read_config(os.path.join(benchmark.DATA_DIR, "input.txt"))
+    selected = [b for b in benchmark.make_benchmarks(quantums=(2,)) if b.name.startswith("round_robin")]
+    rows = benchmark.run_benchmarks(config, sizes=(10, 50), benchmarks=selected, min_time=0, max_repeat=1)
+    assert [(r["benchmark"], r["num_processes"]) for r in rows] == [
+        ("round_robin[q=2]", 10), ("round_robin_stream[q=2]", 10), ("round_robin[q=2]", 50), ("round_robin_stream[q=2]", 50)]
+    # The batch and streaming engines process the same arrivals and slices
+    assert rows[0]["events"] == rows[1]["events"] and rows[2]["events"] == rows[3]["events"]
+    assert all(r["events"] > r["num_processes"] and r["peak_bytes"] > 0 for r in rows)
+
+def test_fit_exponents_recovers_the_slope():
+    rows = [row("linear", n, n * 1e-6) for n in (1e3, 1e4, 1e5)]
+    rows += [row("quadratic", n, n * n * 1e-9) for n in (1e3, 1e4, 1e5)]
+    rows += [row("too fast", n, 1e-5) for n in (1e3, 1e4, 1e5)]
+    exponents = benchmark.fit_exponents(rows)
+    assert exponents["linear"] == pytest.approx(1.0)
+    assert exponents["quadratic"] == pytest.approx(2.0)
+    assert exponents["too fast"] is None
+
+def test_compare_to_baseline_flags_regressions_beyond_tolerance():
+    baseline = [row("a", 10, 1.0), row("b", 10, 0.01), row("c", 10, 1.0)]
+    rows = [
+        row("a", 10, 1.5, peak_bytes=1300),  # Slower and bigger
+        row("b", 10, 0.04),  # Under the noise floor
+        row("c", 10, 1.2, events=99),  # Within tolerance, but a different schedule
+        row("d", 10, 9.0),  # Not in the baseline
+    ]
+    messages = benchmark.compare_to_baseline(rows, baseline)
+    assert len(messages) == 3
+    assert messages[0].startswith("a n=10: 1.5000 s") and "+50%" in messages[0]
+    assert messages[1].startswith("a n=10: peak") and "+30%" in messages[1]
+    assert messages[2] == "c n=10: 99 events vs baseline 100 (schedule changed)"
+
+def test_main_writes_and_checks_a_baseline(tmp_path, capsys):
+    baseline = str(tmp_path / "baseline.json")
+    args = ["--sizes", "10", "20", "--benchmarks", "first_come_first_serve_batch", "--min-time", "0",
+            "--repeat", "1", "--no-memory", "--baseline", baseline]
+    assert benchmark.main(args + ["--update-baseline"]) == 0
+    with open(baseline) as f:
+        results = json.load(f)
+    assert [r["num_processes"] for r in results["results"]] == [10, 20]
+    assert set(results["exponents"]) == {"first_come_first_serve_batch"}
+    assert benchmark.main(args) == 0
+    assert "0 regression(s)" in capsys.readouterr().out
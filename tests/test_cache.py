@@ -0,0 +1,44 @@
+"""Tests for the keyed simulation result cache."""
+import numpy as np
+import pytest
+
+from cache import SimulationCache, workload_digest
+
+def test_digest_covers_contents_dtype_and_shape():
+    arrival = np.array([0.0, 1.5, 3.0])
+    digest = workload_digest(arrival, None)
+    assert digest == workload_digest(arrival.copy(), None)
+    assert digest != workload_digest(np.array([0.0, 1.5, 3.5]), None)
+    assert digest != workload_digest(arrival.astype(np.float32), None)
+    assert digest != workload_digest(arrival.reshape(3, 1), None)
+    assert digest != workload_digest(arrival)
+
+def test_each_simulation_runs_once_per_key():
+    calls = []
+    def simulate(*args, quantum=2):
+        calls.append((args, quantum))
+        return len(calls)
+
+    cache = SimulationCache()
+    assert cache.get_or_run("w", "Round Robin", simulate, (1,), {"quantum": 2}) == 1
+    assert cache.get_or_run("w", "Round Robin", simulate, (1,), {"quantum": 2}) == 1
+    assert cache.get_or_run("w", "Round Robin", simulate, (1,), {"quantum": 4}) == 2
+    assert cache.get_or_run("other", "Round Robin", simulate, (1,), {"quantum": 2}) == 3
+    assert (cache.hits, cache.misses) == (1, 3)
+    assert SimulationCache.make_key("w", "Round Robin", {"quantum": 4}) in cache
+
+def test_least_recently_used_entry_is_evicted():
+    cache = SimulationCache(max_entries=2)
+    for name in ("a", "b"):
+        cache.get_or_run("w", name, lambda: name, ())
+    cache.get_or_run("w", "a", lambda: "recomputed", ())  # Hit: "a" becomes most recent
+    cache.get_or_run("w", "c", lambda: "c", ())
+    assert len(cache) == 2
+    assert cache.make_key("w", "b") not in cache
+    assert cache.get_or_run("w", "a", lambda: "recomputed", ()) == "a"
+    cache.clear()
+    assert len(cache) == 0
+
+def test_rejects_empty_capacity():
+    with pytest.raises(ValueError):
+        SimulationCache(max_entries=0)
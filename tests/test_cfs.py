@@ -0,0 +1,60 @@
+"""Tests for the weighted fair-share scheduler."""
+import numpy as np
+import pytest
+
+from algorithms import completely_fair, round_robin
+from engines import PRIORITY_WEIGHT_RATIO, CFSEngine, priority_weight
+from helpers import assert_resume_equals_full_run
+from metrics import fairness_metrics, tail_summary
+
+SEEDS = range(40)
+
+def cpu_time_until(trace, time):
+    """CPU time of each process in [0, time]"""
+    return np.bincount(trace.pids, np.clip(trace.ends, None, time) - np.clip(trace.starts, None, time))
+
+def test_cpu_share_follows_the_weights():
+    trace, _, _ = completely_fair([0, 0], [1000, 1000], [0, 3], target_latency=20, min_granularity=0.1)
+    low, high = cpu_time_until(trace, 1000)  # Both still runnable
+    assert high / low == pytest.approx(PRIORITY_WEIGHT_RATIO ** 3, rel=0.02)
+    assert priority_weight(3) / priority_weight(0) == PRIORITY_WEIGHT_RATIO ** 3
+
+def test_equal_weights_alternate_slices():
+    trace, avg_tat, _ = completely_fair([0, 0], [4, 4], [0, 0], target_latency=2, min_granularity=1)
+    assert list(trace) == [(0, 0, 1), (1, 1, 2), (0, 2, 3), (1, 3, 4), (0, 4, 5), (1, 5, 6), (0, 6, 7), (1, 7, 8)]
+    assert avg_tat == 7.5
+
+def test_ties_on_vruntime_run_in_pid_order():
+    # Listed out of order; all three arrive together at the same vruntime floor
+    trace, _, _ = completely_fair([5, 0, 5, 5], [1, 1, 1, 1], [0, 0, 0, 0], target_latency=3, min_granularity=1)
+    assert trace.pids.tolist() == [1, 0, 2, 3]
+
+def test_late_arrival_starts_at_the_vruntime_floor():
+    # P1 arrives at the floor reached by P0, not at 0, so it shares the CPU instead of monopolising it
+    trace, _, _ = completely_fair([0, 50], [100, 10], [0, 0], target_latency=4, min_granularity=1)
+    assert cpu_time_until(trace, 60)[1] == pytest.approx(5, abs=2)
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_resume_equals_full_run(seed):
+    assert_resume_equals_full_run(lambda: CFSEngine(6, 0.5), seed)
+
+def test_checkpoint_copies_tied_groups():
+    engine = CFSEngine(4, 1)
+    engine.add_processes([0, 0, 0, 0], [5, 5, 5, 5])
+    fork = engine.run(until=1).checkpoint()
+    assert fork.tied == engine.tied and all(fork.tied[v] is not engine.tied[v] for v in engine.tied)
+    assert fork.run().result()[1:] == engine.run().result()[1:]
+
+def test_weighting_trades_plain_fairness_for_weighted_fairness():
+    # Equal jobs, different priorities: Round Robin ignores the weights, CFS follows them
+    arrival, burst, priority = [0] * 6, [50] * 6, list(range(6))
+    cfs = tail_summary(arrival, burst, completely_fair(arrival, burst, priority, 6, 0.5)[0], priority)
+    rr = tail_summary(arrival, burst, round_robin(arrival, burst, 2)[0], priority)
+    assert cfs["weighted_fairness"] > rr["weighted_fairness"]
+    assert cfs["fairness"] < rr["fairness"]
+    shares = fairness_metrics(arrival, burst, priority, completely_fair(arrival, burst, priority, 6, 0.5)[0])
+    assert np.all(np.diff(shares["service_rate"]) > 0)  # Higher priority, faster service
+
+def test_rejects_non_positive_granularity():
+    with pytest.raises(ValueError, match="min_granularity"):
+        CFSEngine(min_granularity=0)
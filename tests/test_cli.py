@@ -0,0 +1,46 @@
+"""Tests for the headless command line interface."""
+import os
+import subprocess
+import sys
+
+import cli
+
+CLI = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "cli.py")
+
+def write_trace(tmp_path):
+    trace = tmp_path / "trace.txt"
+    trace.write_text("0 5 1\n1 3 2\n2 8 0\n3 6 3\n")
+    return str(trace)
+
+def test_run_writes_the_report_without_gui_modules(tmp_path):
+    # A fresh interpreter, so modules loaded by other tests do not count
+    output = tmp_path / "output.txt"
+    completed = subprocess.run(
+        [sys.executable, CLI, "run", "--trace", write_trace(tmp_path), "--output", str(output), "--check-headless"],
+        capture_output=True, text=True)
+    assert completed.returncode == 0, completed.stderr
+    assert "FCFS" in completed.stdout
+    report = output.read_text()
+    assert all(heading in report for heading in cli.REPORT_NAMES.values())
+
+def test_run_selected_algorithms_with_exports(tmp_path, capsys):
+    csv_file, jsonl_file = tmp_path / "slices.csv", tmp_path / "summary.jsonl"
+    assert cli.main(["run", "--trace", write_trace(tmp_path), "--algorithms", "FCFS", "Round Robin",
+                     "--output", str(tmp_path / "output.txt"), "--csv", str(csv_file),
+                     "--jsonl", str(jsonl_file)]) == 0
+    printed = capsys.readouterr().out.splitlines()
+    assert [line.split("  ")[0] for line in printed] == ["FCFS", "Round Robin"]
+    assert len(jsonl_file.read_text().splitlines()) == 2
+    assert csv_file.read_text().count("\n") > 2
+
+def test_run_generated_workload_is_seeded(tmp_path, capsys):
+    args = ["run", "--processes", "30", "--seed", "4", "--algorithms", "FCFS", "--output", str(tmp_path / "out.txt")]
+    cli.main(args)
+    first = capsys.readouterr().out
+    cli.main(args)
+    assert capsys.readouterr().out == first
+
+def test_cpus_rejects_policies_without_smp_support(tmp_path, capsys):
+    assert cli.main(["run", "--trace", write_trace(tmp_path), "--algorithms", "CFS", "--cpus", "2",
+                     "--output", str(tmp_path / "out.txt")]) == 2
+    assert "--cpus supports" in capsys.readouterr().err
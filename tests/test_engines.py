@@ -0,0 +1,58 @@
+"""Tests for the resumable scheduling engines."""
+import pytest
+
+from algorithms import (first_come_first_serve, non_preemptive_priority, preemptive_shortest_remaining_time_first,
+                        round_robin)
+from engines import FCFSEngine, PriorityEngine, RoundRobinEngine, SRTFEngine
+from helpers import assert_resume_equals_full_run, assert_same_schedule, random_workload
+
+SEEDS = range(40)
+
+# Engine factory and the one-shot algorithm it backs
+ENGINES = {
+    "FCFS": (FCFSEngine, lambda a, b, p: first_come_first_serve(a, b)),
+    "Priority": (PriorityEngine, non_preemptive_priority),
+    "Round Robin": (lambda: RoundRobinEngine(2), lambda a, b, p: round_robin(a, b, 2)),
+    "SRTF": (SRTFEngine, lambda a, b, p: preemptive_shortest_remaining_time_first(a, b)),
+}
+
+@pytest.mark.parametrize("name", ENGINES)
+@pytest.mark.parametrize("seed", SEEDS)
+def test_resume_equals_full_run(name, seed):
+    assert_resume_equals_full_run(ENGINES[name][0], seed)
+
+@pytest.mark.parametrize("name", ENGINES)
+@pytest.mark.parametrize("seed", SEEDS)
+def test_stepped_engine_equals_algorithm(name, seed):
+    make_engine, algorithm = ENGINES[name]
+    arrival, burst, priority = random_workload(seed)
+    engine = make_engine()
+    engine.add_processes(arrival, burst, priority)
+    until = 0.0
+    while not engine.finished:
+        until += 3.7
+        engine.run(until=until)
+    assert_same_schedule(engine.result(), algorithm(arrival, burst, priority))
+
+def test_checkpoint_is_independent():
+    engine = RoundRobinEngine(2)
+    engine.add_processes([0, 1, 2], [5, 5, 5])
+    fork = engine.run(until=4).checkpoint()
+    fork.add_processes([20], [1])
+    fork.run()
+    assert not engine.finished and engine.num_processes == 3
+    assert fork.execution_order.slice_count > engine.execution_order.slice_count
+    assert_same_schedule(engine.run().result(), round_robin([0, 1, 2], [5, 5, 5], 2))
+
+def test_rejects_arrivals_at_or_before_the_clock():
+    engine = FCFSEngine()
+    engine.add_processes([0, 1], [3, 3])
+    engine.run(until=2)
+    with pytest.raises(ValueError, match="after the engine clock"):
+        engine.add_processes([engine.clock], [1])
+
+def test_result_needs_a_finished_run():
+    engine = PriorityEngine()
+    engine.add_processes([0, 0], [4, 4], [1, 2])
+    with pytest.raises(ValueError, match="have completed"):
+        engine.result()
@@ -0,0 +1,62 @@
+"""Tests for the columnar execution trace."""
+import numpy as np
+import pytest
+
+from execution_trace import ExecutionTrace
+
+def test_contiguous_slices_of_a_process_are_merged():
+    trace = ExecutionTrace(capacity=1)
+    for pid, start, end in [(0, 0, 2), (0, 2, 4), (1, 4, 5), (0, 5, 6), (0, 7, 8)]:
+        trace.append(pid, start, end)
+    assert list(trace) == [(0, 0, 4), (1, 4, 5), (0, 5, 6), (0, 7, 8)]  # A gap is not a continuation
+    assert trace.context_switches == 2
+    assert trace.makespan == 8
+
+def test_columns_and_indexing():
+    trace = ExecutionTrace.from_slices([(3, 0.5, 1.5), (1, 1.5, 4.0), (3, 4.0, 6.25)])
+    assert (trace.pids.dtype, trace.starts.dtype, trace.ends.dtype) == (np.int32, np.float64, np.float64)
+    assert trace.pids.tolist() == [3, 1, 3]
+    assert trace[0] == (3, 0.5, 1.5) and trace[-1] == (3, 4.0, 6.25)
+    assert trace[1:] == [(1, 1.5, 4.0), (3, 4.0, 6.25)]
+    with pytest.raises(IndexError):
+        trace[3]
+    assert len(trace) == trace.slice_count == 3
+    assert trace.nbytes == 3 * (4 + 8 + 8)
+
+def test_grows_past_its_capacity():
+    trace = ExecutionTrace(capacity=2)
+    for i in range(1000):
+        trace.append(i % 2, i, i + 1)
+    assert len(trace) == 1000
+    assert trace[999] == (1, 999, 1000)
+
+def test_equality_with_traces_and_tuple_lists():
+    slices = [(0, 0, 1), (1, 1, 3)]
+    trace = ExecutionTrace.from_slices(slices)
+    assert trace == ExecutionTrace.from_slices(slices) and trace == slices
+    assert trace != ExecutionTrace.from_slices([(0, 0, 1), (1, 1, 2)])
+    assert trace != [(0, 0, 1)]
+
+def test_copy_is_independent():
+    trace = ExecutionTrace.from_slices([(0, 0, 1), (1, 1, 2)])
+    copy = trace.copy()
+    copy.append(1, 2, 3)  # Continues the last slice of the copy only
+    copy.append(2, 3, 4)
+    assert list(trace) == [(0, 0, 1), (1, 1, 2)]
+    assert list(copy) == [(0, 0, 1), (1, 1, 3), (2, 3, 4)]
+
+def test_divide_times_converts_ticks_back_to_time_units():
+    trace = ExecutionTrace.from_slices([(0, 0, 15), (1, 15, 20)])
+    trace.divide_times(10)
+    assert list(trace) == [(0, 0, 1.5), (1, 1.5, 2.0)]
+    trace.append(1, 2.0, 2.5)  # Merging still works in the new units
+    assert trace[-1] == (1, 1.5, 2.5)
+
+def test_unrecorded_trace_keeps_only_totals():
+    slices = [(0, 0, 2), (0, 2, 4), (1, 4, 5), (0, 5, 6), (0, 7, 8)]
+    recorded, totals = ExecutionTrace.from_slices(slices), ExecutionTrace(record=False)
+    for pid, start, end in slices:
+        totals.append(pid, start, end)
+    assert len(totals) == 0 and totals.nbytes == 0
+    assert (totals.slice_count, totals.context_switches, totals.makespan) == \
+        (recorded.slice_count, recorded.context_switches, recorded.makespan)
@@ -0,0 +1,53 @@
+"""Tests for the level-of-detail Gantt lanes."""
+import numpy as np
+import pytest
+
+from execution_trace import ExecutionTrace
+from gantt import BAND_PX, LABEL_MIN_LANE_PX, MAX_BARS, MAX_LABELS, GanttLanes
+
+def test_one_lane_per_process_in_id_order():
+    lanes = GanttLanes([(7, 0, 1), (2, 1, 3), (7, 3, 4)])
+    assert lanes.num_lanes == 2 and lanes.lanes.tolist() == [1, 0, 1]
+    assert [lanes.lane_label(lane) for lane in (0, 1, 2)] == ["P3", "P8", ""]
+    assert lanes.time_range == (0.0, 4.0)
+    assert GanttLanes(ExecutionTrace()).time_range == (0.0, 1.0)
+
+def test_wide_slices_are_bars_and_narrow_ones_are_bands():
+    # 100 px for 100 time units: the 10-unit slice is a bar, the 0.5-unit slices are bands
+    lanes = GanttLanes([(0, 0, 10), (1, 10, 10.5), (1, 20, 20.5), (0, 200, 210)])
+    layers = lanes.layers(0, 100, 100, 100)
+    assert layers.bar_lanes.tolist() == [0] and layers.bar_starts.tolist() == [0] and layers.bar_widths.tolist() == [10]
+    assert layers.density.shape == (2, 100 // BAND_PX)
+    # Each narrow slice fills a quarter of its 2-unit band cell in lane 1
+    assert layers.density[1].sum() == pytest.approx(0.5) and not layers.density[0].any()
+    assert layers.density_extent == (0, 100)
+
+def test_zooming_in_turns_bands_into_bars():
+    lanes = GanttLanes([(0, 0, 10), (1, 10, 10.5)])
+    layers = lanes.layers(9, 11, 100, 100)
+    assert layers.bar_lanes.tolist() == [0, 1]
+    assert not layers.density.any()
+
+def test_too_many_bars_draws_the_whole_view_as_bands():
+    count = MAX_BARS + 1
+    lanes = GanttLanes(ExecutionTrace.from_slices([(i % 4, i, i + 1) for i in range(count)]))
+    layers = lanes.layers(0, count, 2 * count, 400)  # 2 px per slice: wide enough for bars
+    assert len(layers.bar_lanes) == 0
+    # Every lane is busy a quarter of the time
+    assert layers.density.mean() == pytest.approx(0.25, rel=0.01)
+
+def test_many_lanes_share_density_rows():
+    lanes = GanttLanes([(pid, pid, pid + 0.01) for pid in range(1000)])
+    layers = lanes.layers(0, 1000, 200, 50)
+    assert layers.density.shape == (50, 100)
+    assert np.all(layers.density <= 1.0)
+
+def test_labels_need_room():
+    lanes = GanttLanes([(0, 0, 50), (1, 50, 51)])
+    layers = lanes.layers(0, 100, 1000, 2 * LABEL_MIN_LANE_PX)
+    assert layers.labels == [(25, 0, "50.0")]  # The 10 px bar is too narrow for its label
+    assert lanes.layers(0, 100, 1000, 2 * LABEL_MIN_LANE_PX - 1).labels == []  # Lanes too short
+
+def test_labels_are_capped():
+    lanes = GanttLanes([(i % 2, 10 * i, 10 * i + 10) for i in range(2 * MAX_LABELS)])
+    assert len(lanes.layers(0, 20 * MAX_LABELS, 2000 * MAX_LABELS, 100).labels) == MAX_LABELS
@@ -0,0 +1,64 @@
+"""Tests for the scheduling counters and the profiler."""
+import json
+
+import numpy as np
+import pytest
+
+from algorithms import SCHEDULERS, multi_cpu, run_scheduler
+from helpers import random_workload
+from instrumentation import COUNTER_NAMES, Profiler
+
+@pytest.mark.parametrize("name", SCHEDULERS)
+@pytest.mark.parametrize("seed", range(10))
+def test_counters_do_not_depend_on_recording(name, seed):
+    arrival, burst, priority = random_workload(seed)
+    recorded, unrecorded = {}, {}
+    trace, tat, wt = run_scheduler(name, arrival, burst, priority, counters=recorded)
+    bare, bare_tat, bare_wt = run_scheduler(name, arrival, burst, priority, record_trace=False, counters=unrecorded)
+    assert (bare_tat, bare_wt) == (tat, wt)
+    assert recorded == unrecorded
+    assert set(COUNTER_NAMES) <= set(recorded)
+    assert (bare.slice_count, bare.context_switches) == (trace.slice_count, trace.context_switches)
+    assert len(bare) == 0 and np.isclose(bare.makespan, trace.makespan)
+
+def test_disabled_profiler_collects_nothing():
+    profiler = Profiler(enabled=False)
+    with profiler.span("simulate", "FCFS"):
+        pass
+    assert profiler.counters_for("FCFS") is None
+    assert profiler.as_dict() == {"phase_totals": {}, "spans": [], "counters": {}}
+
+def test_spans_and_phase_totals(tmp_path):
+    profiler = Profiler()
+    for label in ("FCFS", "CFS"):
+        with profiler.span("simulate", label):
+            pass
+    with pytest.raises(KeyError):
+        with profiler.span("render", "results"):
+            raise KeyError("spans are recorded even when the body fails")
+    assert [(span["phase"], span["label"]) for span in profiler.spans] == [
+        ("simulate", "FCFS"), ("simulate", "CFS"), ("render", "results")]
+    totals = profiler.phase_totals()
+    assert totals["simulate"] == pytest.approx(profiler.spans[0]["seconds"] + profiler.spans[1]["seconds"])
+    path = tmp_path / "profile.json"
+    profiler.write_json(str(path))
+    assert json.loads(path.read_text())["phase_totals"] == totals
+
+def test_report_has_a_column_for_every_counter_present():
+    profiler = Profiler()
+    arrival, burst, priority = random_workload(5)
+    for name in ("FCFS", "MLFQ", "Preemptive Priority"):
+        with profiler.span("simulate", name):
+            run_scheduler(name, arrival, burst, priority, counters=profiler.counters_for(name))
+    multi_cpu("FCFS", arrival, burst, priority, cpus=2, queue="per-core", counters=profiler.counters_for("SMP"))
+    profiler.counters_for("Round Robin")  # A cache hit leaves its counters empty
+
+    header, *rows, phases = profiler.format_report().splitlines()
+    assert header.split()[1:] == [*COUNTER_NAMES, "boosts", "max_starvation", "steals", "Simulate", "s"]
+    cells = {row[:20].strip(): row[20:].split() for row in rows}
+    assert cells["FCFS"][4:7] == ["-", "-", "-"]
+    assert cells["MLFQ"][4] == str(profiler.counters["MLFQ"]["boosts"])
+    assert cells["Preemptive Priority"][5] == f"{profiler.counters['Preemptive Priority']['max_starvation']:.2f}"
+    assert cells["SMP"][6] == str(profiler.counters["SMP"]["steals"]) and cells["SMP"][-1] == "-"
+    assert "(cached result, nothing simulated)" in rows[-1]
+    assert phases.startswith("Phases: simulate")
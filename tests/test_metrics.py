@@ -0,0 +1,49 @@
+"""Tests for the per-process and tail metrics."""
+import numpy as np
+import pytest
+
+from algorithms import completely_fair, first_come_first_serve, round_robin
+from metrics import fairness_metrics, process_metrics, tail_summary
+
+def test_precomputed_per_process_arrays_are_reused():
+    arrival = [0, 0.5, 1, 4, 4.2, 9]
+    burst = [5, 2.5, 7, 1, 3, 0.4]
+    priorities = [0, 3, 1, 5, 2, 0]
+    trace, _, _ = completely_fair(arrival, burst, priorities, 6, 0.5)
+
+    per_process = process_metrics(arrival, burst, trace)
+    fairness = fairness_metrics(arrival, burst, priorities, trace, per_process)
+    for name, values in fairness_metrics(arrival, burst, priorities, trace).items():
+        np.testing.assert_array_equal(fairness[name], values)
+
+    per_process.update(fairness)
+    assert tail_summary(arrival, burst, trace, priorities, per_process) == tail_summary(arrival, burst, trace, priorities)
+
+def test_process_metrics_follow_preempted_processes():
+    # Round Robin (quantum 2): P0 runs 0-2, P1 runs 2-4, P0 finishes 4-5
+    trace, avg_tat, avg_wt = round_robin([0, 1], [3, 2], 2)
+    per_process = process_metrics([0, 1], [3, 2], trace)
+    assert per_process["first_start"].tolist() == [0, 2]
+    assert per_process["completion"].tolist() == [5, 4]
+    assert per_process["turnaround"].tolist() == [5, 3]
+    assert per_process["waiting"].tolist() == [2, 1]
+    assert per_process["response"].tolist() == [0, 1]
+    assert per_process["max_wait"].tolist() == [2, 1]
+    assert (avg_tat, avg_wt) == (per_process["turnaround"].mean(), per_process["waiting"].mean())
+
+def test_process_metrics_need_a_recorded_trace():
+    trace, _, _ = round_robin([0, 1], [3, 2], 2, record_trace=False)
+    with pytest.raises(ValueError, match="recorded trace"):
+        process_metrics([0, 1], [3, 2], trace)
+
+def test_tail_summary_percentiles_and_fairness():
+    # FCFS: turnarounds 4, 5, 6, 7; waiting 0, 3, 4, 5
+    arrival, burst = [0, 1, 2, 3], [4, 2, 2, 2]
+    trace, _, _ = first_come_first_serve(arrival, burst)
+    tail = tail_summary(arrival, burst, trace, [0, 0, 0, 0])
+    assert tail["turnaround"] == {"p50": 5.5, "p95": pytest.approx(6.85), "p99": pytest.approx(6.97), "max": 7}
+    assert tail["waiting"]["max"] == tail["max_starvation"] == 5
+    rates = np.array(burst) / np.array([4, 5, 6, 7])
+    assert tail["fairness"] == pytest.approx(rates.sum() ** 2 / (len(rates) * (rates ** 2).sum()))
+    assert tail["weighted_fairness"] == pytest.approx(tail["fairness"])  # Equal priorities weigh equally
+    assert "weighted_fairness" not in tail_summary(arrival, burst, trace)
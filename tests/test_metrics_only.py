@@ -0,0 +1,17 @@
+"""Tests for the metrics-only record_trace=False mode of the algorithms."""
+import pytest
+
+from algorithms import SCHEDULERS, run_scheduler
+from helpers import random_workload
+
+@pytest.mark.parametrize("name", SCHEDULERS)
+@pytest.mark.parametrize("seed", range(20))
+def test_metrics_only_run_matches_recorded_run(name, seed):
+    workload = random_workload(seed)
+    recorded, avg_tat, avg_wt = run_scheduler(name, *workload)
+    totals, totals_tat, totals_wt = run_scheduler(name, *workload, record_trace=False)
+    assert not totals.record and len(totals) == 0
+    assert (totals_tat, totals_wt) == (avg_tat, avg_wt)
+    assert totals.slice_count == recorded.slice_count
+    assert totals.context_switches == recorded.context_switches
+    assert totals.makespan == recorded.makespan
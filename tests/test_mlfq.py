@@ -0,0 +1,56 @@
+"""Tests for the multilevel feedback queue."""
+import pytest
+
+from algorithms import multilevel_feedback_queue, round_robin
+from engines import MLFQEngine
+from helpers import assert_resume_equals_full_run, assert_same_schedule, random_workload
+
+SEEDS = range(40)
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_one_level_is_round_robin(seed):
+    arrival, burst, _ = random_workload(seed)
+    assert_same_schedule(multilevel_feedback_queue(arrival, burst, (2,), None), round_robin(arrival, burst, 2))
+
+def test_arrivals_wait_for_the_running_slice_and_then_go_first():
+    # P0 drops to level 1 after one unit; P1 arrives during its 2-unit slice and runs next
+    trace, avg_tat, avg_wt = multilevel_feedback_queue([0, 1.5], [4, 1], (1, 2), None)
+    assert list(trace) == [(0, 0, 3), (1, 3, 4), (0, 4, 5)]
+    assert (avg_tat, avg_wt) == ((5 + 2.5) / 2, (1 + 1.5) / 2)
+
+def test_boost_lifts_every_level_back_to_the_top():
+    counters = {}
+    boosted, _, _ = multilevel_feedback_queue([0, 0, 0], [20, 20, 1], (1, 2, 4), 6, counters=counters)
+    unboosted, _, _ = multilevel_feedback_queue([0, 0, 0], [20, 20, 1], (1, 2, 4), None)
+    assert counters["boosts"] == boosted.makespan // 6
+    assert boosted.slice_count > unboosted.slice_count  # Boosted processes restart at the short level-0 quantum
+    assert boosted.makespan == unboosted.makespan == 41
+
+@pytest.mark.parametrize("boost_interval", [None, 10])
+@pytest.mark.parametrize("seed", SEEDS)
+def test_resume_equals_full_run(boost_interval, seed):
+    # Boosts leave several level-0 segments, which forks must copy too
+    assert_resume_equals_full_run(lambda: MLFQEngine((1, 2, 4), boost_interval), seed)
+
+@pytest.mark.parametrize("seed", SEEDS[:10])
+def test_stepped_engine_equals_algorithm(seed):
+    arrival, burst, _ = random_workload(seed)
+    engine = MLFQEngine((1, 2, 4), 10)
+    engine.add_processes(arrival, burst)
+    until = 0.0
+    while not engine.finished:
+        until += 2.3
+        engine.run(until=until)
+    assert_same_schedule(engine.result(), multilevel_feedback_queue(arrival, burst, (1, 2, 4), 10))
+
+def test_empty_run():
+    engine = MLFQEngine()
+    engine.run()
+    engine.add_processes([], [])
+    engine.run(until=10)
+    assert engine.finished
+    assert len(engine.execution_order) == 0
+
+def test_needs_a_level():
+    with pytest.raises(ValueError, match="at least one level"):
+        MLFQEngine(())
@@ -0,0 +1,42 @@
+"""Tests for the vectorized report writer."""
+import csv
+import json
+import math
+
+from report import CSV_DECIMALS, CSV_HEADER, ReportWriter
+
+def test_huge_times_match_fstring(tmp_path):
+    rows = [(0, 1e14, 2e14), (1, 2e14, 2e14 + 0.25), (0, 2e14 + 0.25, 9.5e18), (1, 9.5e18, 1e300)]
+    text_file, csv_file = tmp_path / "out.txt", tmp_path / "out.csv"
+    with ReportWriter(str(text_file), csv_file=str(csv_file)) as writer:
+        writer.write_result("FCFS", rows, 0.0, 0.0)
+
+    text = text_file.read_text()
+    for pid, start, end in rows:
+        assert f"P{pid + 1} ({start:.1f} - {end:.1f})\n" in text
+    expected = "".join(f"FCFS,{pid + 1},{start:.{CSV_DECIMALS}f},{end:.{CSV_DECIMALS}f}\n" for pid, start, end in rows)
+    assert csv_file.read_text() == CSV_HEADER + expected
+
+def test_csv_quotes_algorithm_names(tmp_path):
+    csv_file = tmp_path / "out.csv"
+    name = 'Round Robin, q="2"'
+    with ReportWriter(str(tmp_path / "out.txt"), csv_file=str(csv_file)) as writer:
+        writer.write_result(name, [(0, 0.0, 1.5), (1, 1.5, 2.0)], 0.0, 0.0)
+    with open(csv_file, newline="") as f:
+        rows = list(csv.reader(f))
+    assert rows[0] == CSV_HEADER.strip().split(",")
+    assert rows[1:] == [[name, "1", "0.000000", "1.500000"], [name, "2", "1.500000", "2.000000"]]
+
+def test_jsonl_maps_non_finite_values_to_null(tmp_path):
+    jsonl_file = tmp_path / "out.jsonl"
+    times = {"p50": 1.0, "p95": 1.0, "p99": 1.0, "max": math.inf}
+    tail = {"turnaround": times, "waiting": times, "response": times, "fairness": math.nan, "max_starvation": 0.0}
+    with ReportWriter(str(tmp_path / "out.txt"), jsonl_file=str(jsonl_file)) as writer:
+        writer.write_result("FCFS", [(0, 0.0, 1.0)], math.nan, 0.5, tail)
+
+    def reject(constant):
+        raise ValueError(f"non-standard JSON constant {constant}")
+    record = json.loads(jsonl_file.read_text(), parse_constant=reject)
+    assert record["avg_turnaround"] is None and record["avg_waiting"] == 0.5
+    assert record["turnaround"] == {"p50": 1.0, "p95": 1.0, "p99": 1.0, "max": None}
+    assert record["fairness"] is None and record["max_starvation"] == 0.0
@@ -0,0 +1,95 @@
+"""Tests for the background simulation runner."""
+import threading
+import time
+
+import pytest
+
+from algorithms import SCHEDULERS, run_scheduler
+from engines import SimulationCancelled
+from helpers import assert_same_schedule, random_workload
+from runner import SimulationRunner
+
+class FakeWidget:
+    """Stands in for a Tk widget: after() callbacks run when pump() is called"""
+    def __init__(self):
+        self.pending = []
+
+    def after(self, ms, callback):
+        self.pending.append(callback)
+
+    def pump(self, until, timeout: float = 5):
+        """Run after() callbacks until until() holds"""
+        deadline = time.monotonic() + timeout
+        while not until():
+            assert time.monotonic() < deadline, "runner did not deliver in time"
+            callbacks, self.pending = self.pending, []
+            for callback in callbacks:
+                callback()
+            time.sleep(0.001)
+
+@pytest.fixture
+def runner():
+    runner = SimulationRunner(FakeWidget(), poll_ms=1)
+    yield runner
+    runner.shutdown()
+
+def test_steps_run_in_order_and_report_progress(runner):
+    done, progress = [], []
+    runner.submit([("a", lambda: 1), ("b", lambda: 2)], done.append, on_progress=lambda *p: progress.append(p))
+    runner.widget.pump(lambda: done)
+    assert done == [{"a": 1, "b": 2}]
+    assert progress == [(0, 2, "a"), (1, 2, "b"), (2, 2, "b")]
+    assert not runner.busy
+
+def test_errors_are_delivered_on_the_main_loop(runner):
+    errors = []
+    def fail():
+        raise RuntimeError("boom")
+    runner.submit([("fail", fail)], lambda results: pytest.fail("no results expected"), on_error=errors.append)
+    runner.widget.pump(lambda: errors)
+    assert str(errors[0]) == "boom"
+
+def test_a_new_job_supersedes_the_running_one(runner):
+    started, release = threading.Event(), threading.Event()
+    first, second, ran = [], [], []
+    def slow():
+        started.set()
+        release.wait(5)
+        return "stale"
+    runner.submit([("slow", slow), ("next", lambda: ran.append("next"))], first.append)
+    started.wait(5)
+    runner.submit([("fast", lambda: "fresh")], second.append)
+    release.set()
+    runner.widget.pump(lambda: second)
+    assert second == [{"fast": "fresh"}]
+    assert first == [] and ran == []  # Stopped at the step boundary, results dropped
+
+@pytest.mark.parametrize("name", SCHEDULERS)
+@pytest.mark.parametrize("seed", range(10))
+def test_interruptible_run_equals_full_run(name, seed):
+    workload = random_workload(seed)
+    assert_same_schedule(run_scheduler(name, *workload, should_stop=lambda: False), run_scheduler(name, *workload))
+
+def test_interruptible_run_stops_between_steps():
+    checks = []
+    def should_stop():
+        checks.append(None)
+        return len(checks) > 3
+    with pytest.raises(SimulationCancelled):
+        run_scheduler("CFS", list(range(1000)), [5] * 1000, [0] * 1000, should_stop=should_stop)
+    assert len(checks) == 4
+
+def test_cancelled_stops_a_step_midway(runner):
+    started, done = threading.Event(), []
+    def long_step():
+        started.set()
+        while not runner.cancelled():
+            time.sleep(0.001)
+        raise SimulationCancelled()
+    assert not runner.cancelled()  # Not a worker thread
+    runner.submit([("long", long_step)], lambda results: pytest.fail("no results expected"),
+                  on_error=lambda e: pytest.fail("errors of cancelled jobs are dropped"))
+    started.wait(5)
+    runner.submit([("fast", lambda: "fresh")], done.append)
+    runner.widget.pump(lambda: done)
+    assert done == [{"fast": "fresh"}]
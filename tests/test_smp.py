@@ -0,0 +1,93 @@
+"""Tests for the multi-CPU engine."""
+import numpy as np
+import pytest
+
+from algorithms import SCHEDULERS, multi_cpu
+from engines import SMP_POLICIES, SMP_QUEUES, SMPEngine
+from execution_trace import ExecutionTrace
+from helpers import assert_resume_equals_full_run, assert_same_schedule, random_workload
+
+SEEDS = range(40)
+
+@pytest.mark.parametrize("queue", SMP_QUEUES)
+@pytest.mark.parametrize("policy", SMP_POLICIES)
+@pytest.mark.parametrize("seed", SEEDS)
+def test_one_cpu_equals_single_cpu_algorithm(policy, queue, seed):
+    arrival, burst, priority = random_workload(seed)
+    params = {"quantum": 2} if policy == "Round Robin" else {}
+    expected = SCHEDULERS[policy](arrival, burst, priority, **params) if policy == "Priority Scheduling" \
+        else SCHEDULERS[policy](arrival, burst, **params)
+    got = multi_cpu(policy, arrival, burst, priority, cpus=1, queue=queue, **params)
+    if policy == "Preemptive SRTF":
+        # Remaining times drift apart in float, which may reorder near-ties
+        assert got[1:] == pytest.approx(expected[1:], abs=1e-6)
+    else:
+        assert_same_schedule(got, expected)
+
+@pytest.mark.parametrize("queue", SMP_QUEUES)
+@pytest.mark.parametrize("policy", SMP_POLICIES)
+@pytest.mark.parametrize("seed", SEEDS[:10])
+def test_every_process_runs_its_burst_on_at_most_cpus_cores(policy, queue, seed):
+    arrival, burst, priority = random_workload(seed, max_processes=80)
+    trace, avg_tat, avg_wt = multi_cpu(policy, arrival, burst, priority, cpus=3, queue=queue)
+    assert set(trace.cores.tolist()) <= {0, 1, 2}
+    np.testing.assert_allclose(np.bincount(trace.pids, trace.ends - trace.starts, len(arrival)), burst, atol=1e-9)
+    assert np.all(trace.starts >= np.asarray(arrival)[trace.pids] - 1e-9)
+    # No core runs two slices at once
+    for core in range(3):
+        on_core = trace.cores == core
+        order = np.argsort(trace.starts[on_core], kind="stable")
+        assert np.all(trace.starts[on_core][order][1:] >= trace.ends[on_core][order][:-1] - 1e-9)
+    assert avg_tat - avg_wt == pytest.approx(np.mean(burst))
+
+def test_more_cores_never_wait_longer():
+    arrival, burst, priority = random_workload(7, max_processes=80)
+    waits = [multi_cpu("FCFS", arrival, burst, priority, cpus=cpus)[2] for cpus in (1, 2, 4, 80)]
+    assert waits == sorted(waits, reverse=True) and waits[-1] == pytest.approx(0, abs=1e-9)
+
+ENGINES = {
+    "FCFS global": lambda: SMPEngine("FCFS", 3, "global"),
+    "SRTF global": lambda: SMPEngine("Preemptive SRTF", 2, "global"),
+    "RR per-core": lambda: SMPEngine("Round Robin", 3, "per-core"),
+    "Priority per-core": lambda: SMPEngine("Priority Scheduling", 2, "per-core"),
+}
+
+@pytest.mark.parametrize("name", ENGINES)
+@pytest.mark.parametrize("seed", SEEDS)
+def test_resume_equals_full_run(name, seed):
+    assert_resume_equals_full_run(ENGINES[name], seed)
+
+def test_global_srtf_keeps_the_preemption_heap_small():
+    arrival, burst, _ = random_workload(11, max_processes=400)
+    engine = SMPEngine("Preemptive SRTF", 2, "global", record_trace=False)
+    engine.add_processes([a / 20 for a in arrival], burst)
+    engine.run()
+    assert engine.decisions > 100 and len(engine.longest) <= 4 * engine.cpus
+
+def test_idle_per_core_queue_steals_waiting_work():
+    # Processes queue on core pid % 2; core 1 runs out of work while P3 still waits on core 0
+    counters = {}
+    trace, _, _ = multi_cpu("FCFS", [0, 0, 0, 0], [4, 0.5, 4, 0.5], cpus=2, queue="per-core", counters=counters)
+    assert counters["steals"] == 1
+    assert list(zip(trace, trace.cores.tolist())) == [
+        ((1, 0.0, 0.5), 1), ((3, 0.5, 1.0), 1), ((0, 0.0, 4.0), 0), ((2, 1.0, 5.0), 1)]
+
+def test_per_core_traces_merge_and_count_switches_per_core():
+    trace = ExecutionTrace(cores=True)
+    trace.append_core(0, 0, 0, 1)
+    trace.append_core(1, 1, 0, 2)
+    trace.append_core(0, 0, 1, 3)  # Continues core 0's slice despite core 1 in between
+    trace.append_core(1, 0, 3, 4)
+    trace.append_core(0, 2, 3, 5)
+    assert list(trace) == [(0, 0, 3), (1, 0, 2), (0, 3, 4), (2, 3, 5)]
+    assert trace.cores.tolist() == [0, 1, 1, 0]
+    assert trace.context_switches == 2
+    assert trace.makespan == 5
+
+def test_rejects_bad_configurations():
+    with pytest.raises(ValueError, match="Unknown policy"):
+        SMPEngine("CFS")
+    with pytest.raises(ValueError, match="Unknown queue layout"):
+        SMPEngine("FCFS", queue="shared")
+    with pytest.raises(ValueError, match="at least 1"):
+        SMPEngine("FCFS", cpus=0)
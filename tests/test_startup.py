@@ -0,0 +1,45 @@
+"""Tests that heavy modules stay off the GUI startup path."""
+import ast
+import os
+import subprocess
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Modules imported before the first window is drawn
+GUI_STARTUP = ("main", "views", "utils", "virtual_table")
+
+# Modules that load NumPy or matplotlib when imported
+HEAVY = {"numpy", "matplotlib", "metrics", "report", "gantt", "sweep", "benchmark"}
+
+def loaded_after(code: str) -> set:
+    """Heavy modules in sys.modules after running code in a fresh interpreter"""
+    completed = subprocess.run(
+        [sys.executable, "-c", f"import sys\n{code}\nprint(' '.join(sorted(set(sys.modules) & {HEAVY!r})))"],
+        cwd=ROOT, capture_output=True, text=True, check=True)
+    return set(completed.stdout.split())
+
+def test_scheduling_modules_import_without_numpy():
+    assert loaded_after("import algorithms, cache, engines, execution_trace, instrumentation, runner, workload") == set()
+
+def test_numpy_is_loaded_on_first_simulation():
+    assert "numpy" in loaded_after("import algorithms\nalgorithms.first_come_first_serve([0, 1], [2, 2])")
+
+@pytest.mark.parametrize("module", GUI_STARTUP)
+def test_gui_modules_defer_heavy_imports(module):
+    with open(os.path.join(ROOT, f"{module}.py")) as f:
+        tree = ast.parse(f.read())
+    # Only top-level imports run at startup; imports inside functions run on first use
+    imported = set()
+    for node in tree.body:
+        if isinstance(node, ast.Import):
+            imported.update(alias.name.split(".")[0] for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            imported.add(node.module.split(".")[0])
+    assert not imported & HEAVY
+
+def test_main_imports_without_numpy():
+    pytest.importorskip("customtkinter")
+    assert loaded_after("import main") == set()
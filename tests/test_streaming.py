@@ -0,0 +1,103 @@
+"""Tests for chunked trace reading and the streaming schedulers."""
+import random
+
+import numpy as np
+import pytest
+
+from algorithms import first_come_first_serve, first_come_first_serve_stream, round_robin, round_robin_stream
+from engines import RoundRobinEngine
+from execution_trace import ExecutionTrace
+from helpers import random_workload
+from workload import iter_trace_chunks, read_trace
+
+def ordered_chunks(seed: int, ties: bool = False):
+    """Random workload sorted by arrival, and the same split into random-sized chunks"""
+    arrival, burst, _ = random_workload(seed, max_processes=60)
+    if ties:
+        arrival = [round(a) for a in arrival]
+    order = sorted(range(len(arrival)), key=lambda i: (arrival[i], i))
+    arrival, burst = [arrival[i] for i in order], [burst[i] for i in order]
+    size = random.Random(seed).randint(1, 7)
+    chunks = [(np.array(arrival[i:i + size]), np.array(burst[i:i + size])) for i in range(0, len(arrival), size)]
+    return arrival, burst, chunks
+
+def collect(slices):
+    """on_slices callback appending to a list of (pid, start, end)"""
+    return lambda pids, starts, ends: slices.extend(zip(pids.tolist(), starts.tolist(), ends.tolist()))
+
+@pytest.mark.parametrize("seed", range(30))
+def test_fcfs_stream_equals_fcfs(seed):
+    arrival, burst, chunks = ordered_chunks(seed)
+    slices = []
+    num_processes, avg_tat, avg_wt = first_come_first_serve_stream(chunks, on_slices=collect(slices))
+    expected = first_come_first_serve(arrival, burst)
+    assert num_processes == len(arrival)
+    assert (avg_tat, avg_wt) == pytest.approx(expected[1:])
+    # The closed form sums bursts in a different order, so times agree to rounding
+    streamed = ExecutionTrace.from_slices(slices)
+    assert streamed.pids.tolist() == expected[0].pids.tolist()
+    assert streamed.starts == pytest.approx(expected[0].starts) and streamed.ends == pytest.approx(expected[0].ends)
+
+@pytest.mark.parametrize("seed", range(60))
+@pytest.mark.parametrize("quantum, ticks_per_unit", [(2, None), (0.5, None), (0.5, 10)])
+def test_round_robin_stream_equals_round_robin(seed, quantum, ticks_per_unit):
+    # Every third workload has many equal arrivals, some split across chunks
+    arrival, burst, chunks = ordered_chunks(seed, ties=seed % 3 == 0)
+    slices = []
+    num_processes, avg_tat, avg_wt = round_robin_stream(chunks, quantum, on_slices=collect(slices),
+                                                        ticks_per_unit=ticks_per_unit)
+    expected = round_robin(arrival, burst, quantum, ticks_per_unit=ticks_per_unit)
+    assert num_processes == len(arrival)
+    assert (avg_tat, avg_wt) == pytest.approx(expected[1:], abs=1e-9)
+    assert ExecutionTrace.from_slices(slices) == expected[0]
+
+@pytest.mark.parametrize("stream", [first_come_first_serve_stream, round_robin_stream])
+def test_streams_reject_unordered_and_empty_input(stream):
+    with pytest.raises(ValueError, match="not ordered by arrival"):
+        stream([(np.array([0.0, 5.0]), np.array([1.0, 1.0])), (np.array([4.0]), np.array([1.0]))])
+    with pytest.raises(ValueError, match="empty"):
+        stream([(np.empty(0), np.empty(0))])
+
+def test_compact_drops_completed_processes():
+    arrival, burst, _ = random_workload(3)
+    order = sorted(range(len(arrival)), key=lambda i: (arrival[i], i))
+    arrival, burst = [arrival[i] for i in order], [burst[i] for i in order]
+    engine = RoundRobinEngine(2, record_trace=False)
+    engine.add_processes(arrival, burst)
+    engine.run(until=20)
+    completed = engine.completed
+    keep = engine.compact()
+    assert engine.num_processes == len(keep) == len(arrival) - completed
+    assert [arrival[old] for old in keep] == engine.arrival_times
+    assert engine.run().result()[1:] == pytest.approx(round_robin(arrival, burst, 2)[1:])
+
+TRACES = {
+    "header": "arrival,burst,priority\n0,5,1\n1,3,2\n2,8,0\n",
+    "comments and blanks": "# exported trace\n\n0 5\n1 3 2\n\n# tail\n2 8 1\n",
+    "extra columns": "0 5 1 x\n1 3 2 y\n",
+    "mixed widths": "0 5\n1 3 2\n2 4\n",
+}
+
+@pytest.mark.parametrize("text", TRACES.values(), ids=TRACES)
+@pytest.mark.parametrize("chunk_size", [1, 2, 65536])
+def test_trace_chunks_equal_read_trace(tmp_path, text, chunk_size):
+    path = tmp_path / "trace.txt"
+    path.write_text(text)
+    chunks = list(iter_trace_chunks(str(path), chunk_size))
+    assert all(chunk[0].dtype == np.float64 and chunk[2].dtype == np.int32 for chunk in chunks)
+    assert tuple(np.concatenate(column).tolist() for column in zip(*chunks)) == read_trace(str(path))
+
+BAD_TRACES = {
+    "header after a comment": ("# exported trace\narrival burst\n0 5\n", ":2: expected"),
+    "non-integer priority": ("0 5 1\n1 3 2.5\n", ":2: expected"),
+    "missing burst": ("0 5\n1\n", ":2: expected"),
+    "no processes": ("# nothing here\n", "no processes found"),
+}
+
+@pytest.mark.parametrize("text, message", BAD_TRACES.values(), ids=BAD_TRACES)
+@pytest.mark.parametrize("reader", [read_trace, lambda path: list(iter_trace_chunks(path, 1))])
+def test_malformed_traces_are_rejected_by_both_readers(tmp_path, reader, text, message):
+    path = tmp_path / "trace.txt"
+    path.write_text(text)
+    with pytest.raises(ValueError, match=message):
+        reader(str(path))
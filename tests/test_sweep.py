@@ -0,0 +1,59 @@
+"""Tests for the Monte Carlo parameter sweep."""
+import math
+
+import pytest
+
+from sweep import aggregate, format_summary, run_sweep, t_critical
+from workload import WorkloadConfig
+
+CONFIG = WorkloadConfig(num_processes=12, arrival_mean=8.5, arrival_sd=1.4, burst_mean=10, burst_sd=5.3,
+                        priority_lambda=7.9)
+
+def test_sweep_rows_cover_the_grid():
+    rows = run_sweep(CONFIG, seeds=3, quantums=(1, 4), process_counts=[5, 12],
+                     algorithms=["FCFS", "Round Robin"], workers=1)
+    # FCFS once and Round Robin per quantum, for every process count and seed
+    assert len(rows) == 2 * 3 * (1 + 2)
+    assert {(row["algorithm"], row["quantum"]) for row in rows} == {("FCFS", None), ("Round Robin", 1), ("Round Robin", 4)}
+    assert {row["num_processes"] for row in rows} == {5, 12}
+
+def test_sweep_is_reproducible_and_uses_common_workloads():
+    first = run_sweep(CONFIG, seeds=4, algorithms=["FCFS", "Priority Scheduling"], base_seed=7, workers=1)
+    assert run_sweep(CONFIG, seeds=4, algorithms=["FCFS", "Priority Scheduling"], base_seed=7, workers=1) == first
+    # Non-preemptive schedulers finish the same work at the same time on the same workload
+    makespans = {}
+    for row in first:
+        makespans.setdefault(row["seed"], set()).add(round(row["throughput"], 9))
+    assert all(len(values) == 1 for values in makespans.values())
+    assert run_sweep(CONFIG, seeds=4, algorithms=["FCFS"], base_seed=8, workers=1) != \
+        [row for row in first if row["algorithm"] == "FCFS"]
+
+def test_process_pool_matches_in_process_run():
+    in_process = run_sweep(CONFIG, seeds=3, algorithms=["Preemptive SRTF"], workers=1)
+    assert run_sweep(CONFIG, seeds=3, algorithms=["Preemptive SRTF"], workers=2) == in_process
+
+def test_unknown_algorithm_is_rejected():
+    with pytest.raises(ValueError, match="Unknown algorithms: Lottery"):
+        run_sweep(CONFIG, seeds=1, algorithms=["FCFS", "Lottery"])
+
+def test_aggregate_mean_and_confidence_interval():
+    rows = [{"algorithm": "FCFS", "num_processes": 3, "quantum": None, "seed": seed,
+             "avg_tat": tat, "avg_wt": 1.0, "throughput": 0.5, "context_switches": 2}
+            for seed, tat in enumerate([2.0, 4.0, 6.0])]
+    (entry,) = aggregate(rows)
+    assert entry["samples"] == 3
+    assert entry["avg_tat_mean"] == pytest.approx(4.0)
+    # Sample sd 2, standard error 2 / sqrt(3), t(2) = 4.303
+    assert entry["avg_tat_ci95"] == pytest.approx(4.303 * 2 / math.sqrt(3))
+    assert entry["avg_wt_ci95"] == 0
+    assert "FCFS" in format_summary([entry])
+
+def test_single_sample_has_no_interval():
+    (entry,) = aggregate(run_sweep(CONFIG, seeds=1, algorithms=["FCFS"], workers=1))
+    assert math.isnan(entry["avg_tat_ci95"])
+
+def test_t_critical_is_conservative_between_table_entries():
+    assert t_critical(1) == 12.706
+    assert t_critical(22) == t_critical(20)  # Rounded down to the larger value
+    assert t_critical(1000) == 1.960
+    assert math.isnan(t_critical(0))
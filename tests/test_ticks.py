@@ -0,0 +1,46 @@
+"""Tests for the integer fixed-point time base (ticks_per_unit)."""
+import pytest
+
+from algorithms import (completely_fair, multi_cpu, multilevel_feedback_queue, non_preemptive_priority,
+                        preemptive_priority, round_robin, run_scheduler)
+from helpers import assert_same_schedule, random_workload
+
+TICK_SCHEDULES = {
+    "FCFS": lambda a, b, p, **kw: run_scheduler("FCFS", a, b, **kw),
+    "Round Robin": lambda a, b, p, **kw: round_robin(a, b, 2, **kw),
+    "Preemptive SRTF": lambda a, b, p, **kw: run_scheduler("Preemptive SRTF", a, b, **kw),
+    "Priority Scheduling": lambda a, b, p, **kw: non_preemptive_priority(a, b, p, **kw),
+    "MLFQ": lambda a, b, p, **kw: multilevel_feedback_queue(a, b, (1, 2, 4), 10, **kw),
+    "Preemptive Priority": lambda a, b, p, **kw: preemptive_priority(a, b, p, 3, **kw),
+    "SMP FCFS": lambda a, b, p, **kw: multi_cpu("FCFS", a, b, p, cpus=3, **kw),
+    "SMP Round Robin": lambda a, b, p, **kw: multi_cpu("Round Robin", a, b, p, cpus=2, queue="per-core", **kw),
+}
+
+@pytest.mark.parametrize("name", TICK_SCHEDULES)
+@pytest.mark.parametrize("seed", range(40))
+def test_ticks_equal_float_times(name, seed):
+    # Halves are exact in binary, so float mode accumulates no rounding error
+    arrival, burst, priority = random_workload(seed, granularity=0.5)
+    schedule = TICK_SCHEDULES[name]
+    assert_same_schedule(schedule(arrival, burst, priority, ticks_per_unit=10), schedule(arrival, burst, priority))
+
+def test_tick_times_are_exact():
+    # 0.1 steps accumulate float error; ticks land exactly on the grid
+    trace, avg_tat, avg_wt = round_robin([0.0] * 3, [0.3, 0.7, 0.1], 0.1, ticks_per_unit=10)
+    assert trace.ends.tolist()[-1] == 1.1
+    assert (trace.ends * 10).tolist() == [round(end * 10) for end in trace.ends.tolist()]
+    assert avg_tat == pytest.approx((0.6 + 1.1 + 0.3) / 3, abs=1e-12)
+
+def test_completely_fair_on_ticks():
+    arrival, burst, priority = random_workload(3, granularity=0.5)
+    trace, _, _ = completely_fair(arrival, burst, priority, 6, 0.5, ticks_per_unit=2)
+    assert all((t * 2).is_integer() for t in trace.starts.tolist() + trace.ends.tolist())
+
+@pytest.mark.parametrize("ticks_per_unit", [-1, 2.5])
+def test_rejects_bad_tick_rates(ticks_per_unit):
+    with pytest.raises(ValueError, match="positive integer"):
+        round_robin([0, 1], [1, 1], 1, ticks_per_unit=ticks_per_unit)
+
+def test_rejects_quantum_below_one_tick():
+    with pytest.raises(ValueError, match="shorter than one tick"):
+        round_robin([0, 1], [1, 1], 0.01, ticks_per_unit=10)
@@ -0,0 +1,39 @@
+"""Tests for the virtualized table model."""
+import numpy as np
+import pytest
+
+pytest.importorskip("customtkinter")  # virtual_table builds on the GUI toolkit
+
+from virtual_table import ROW_INDEX, Column, TableModel
+
+COLUMNS = [Column(ROW_INDEX, "ID", "P{}"), Column("turnaround", "Turnaround"), Column("priority", "Priority", "{}")]
+
+@pytest.fixture
+def model():
+    model = TableModel(COLUMNS)
+    model.set_data({"turnaround": np.array([5.0, 1.25, 3.5, 1.25]), "priority": np.array([2, 0, 1, 3])})
+    return model
+
+def test_rows_are_formatted_per_window(model):
+    assert model.num_rows == 4
+    assert model.rows(1, 2) == [("P2", "1.25", "0"), ("P3", "3.50", "1")]
+    assert model.rows(3, 10) == [("P4", "1.25", "3")]  # Clipped to the last row
+    assert model.rows(10, 5) == []
+
+def test_sort_is_stable_and_keeps_row_ids(model):
+    model.sort("turnaround")
+    assert [row[0] for row in model.rows(0, 4)] == ["P2", "P4", "P3", "P1"]
+    model.sort("turnaround", descending=True)
+    assert [row[0] for row in model.rows(0, 4)] == ["P1", "P3", "P4", "P2"]
+    model.sort(ROW_INDEX, descending=True)
+    assert [row[0] for row in model.rows(0, 2)] == ["P4", "P3"]
+
+def test_new_data_keeps_the_sort_column(model):
+    model.sort("priority", descending=True)
+    model.set_data({"turnaround": np.array([1.0, 2.0]), "priority": np.array([0, 9])})
+    assert model.rows(0, 2) == [("P2", "2.00", "9"), ("P1", "1.00", "0")]
+
+def test_empty_data():
+    model = TableModel(COLUMNS)
+    model.set_data({"turnaround": np.empty(0), "priority": np.empty(0, dtype=int)})
+    assert model.num_rows == 0 and model.rows(0, 10) == []
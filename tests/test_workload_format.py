@@ -0,0 +1,58 @@
+"""Tests for the memory-mapped binary workload format."""
+import argparse
+
+import numpy as np
+import pytest
+
+from algorithms import first_come_first_serve, round_robin_stream
+from cli import load_workload
+from workload import (WORKLOAD_FLAG_SORTED, WORKLOAD_HEADER_SIZE, iter_workload_chunks, open_workload,
+                      write_workload)
+
+@pytest.fixture
+def workload_file(tmp_path):
+    path = str(tmp_path / "workload.psw")
+    write_workload(path, [0.0, 1.5, 1.5, 4.0], [3.0, 2.0, 1.0, 0.5], [2, 0, 7, 1])
+    return path
+
+def test_round_trip_is_memory_mapped(workload_file):
+    arrival, burst, priority = open_workload(workload_file)
+    assert all(isinstance(column, np.memmap) and not column.flags.writeable for column in (arrival, burst, priority))
+    assert (arrival.dtype, burst.dtype, priority.dtype) == (np.dtype("<f8"), np.dtype("<f8"), np.dtype("<i4"))
+    assert arrival.tolist() == [0.0, 1.5, 1.5, 4.0]
+    assert burst.tolist() == [3.0, 2.0, 1.0, 0.5]
+    assert priority.tolist() == [2, 0, 7, 1]
+
+def test_header_records_count_and_order(tmp_path, workload_file):
+    header = np.fromfile(workload_file, dtype=np.uint64, count=WORKLOAD_HEADER_SIZE // 8)
+    assert header[1] == 4 and header[2] & WORKLOAD_FLAG_SORTED
+    unsorted = str(tmp_path / "unsorted.psw")
+    write_workload(unsorted, [2.0, 1.0], [1.0, 1.0])
+    assert not np.fromfile(unsorted, dtype=np.uint64, count=3)[2] & WORKLOAD_FLAG_SORTED
+    assert open_workload(unsorted)[2].tolist() == [0, 0]  # Default priorities
+
+def test_rejects_other_files(tmp_path):
+    path = tmp_path / "trace.txt"
+    path.write_text("0 5 1\n" * 20)
+    with pytest.raises(ValueError, match="not a binary workload"):
+        open_workload(str(path))
+    with pytest.raises(ValueError, match="same length"):
+        write_workload(str(tmp_path / "bad.psw"), [0.0, 1.0], [1.0])
+
+def test_empty_workload(tmp_path):
+    path = str(tmp_path / "empty.psw")
+    write_workload(path, [], [])
+    assert [len(column) for column in open_workload(path)] == [0, 0, 0]
+
+def test_engines_and_streams_read_the_mapped_columns(workload_file):
+    workload = open_workload(workload_file)
+    expected = first_come_first_serve([0.0, 1.5, 1.5, 4.0], [3.0, 2.0, 1.0, 0.5])
+    assert first_come_first_serve(*workload[:2]) == expected
+    chunks = list(iter_workload_chunks(workload, chunk_size=3))
+    assert [len(chunk[0]) for chunk in chunks] == [3, 1]
+    assert all(np.shares_memory(chunk[0], workload[0]) for chunk in chunks)  # Views, not copies
+    assert round_robin_stream(chunks, quantum=1)[0] == 4
+
+def test_cli_keeps_binary_workloads_mapped(workload_file):
+    args = argparse.Namespace(trace=None, workload=workload_file)
+    assert all(isinstance(column, np.memmap) for column in load_workload(args))
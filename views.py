@@ -1,14 +1,17 @@
 """UI components for the scheduler application."""
 import customtkinter as ctk
 from tkinter import ttk
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-import matplotlib.pyplot as plt
-from typing import Callable, List, Tuple, Optional, Dict, Any
-import numpy as np
+from typing import TYPE_CHECKING, Callable, Tuple, Optional, Dict, Any
 from utils import configure_treeview_styles, create_title
+from algorithms import SCHEDULERS
+from execution_trace import ExecutionTrace
+from virtual_table import ROW_INDEX, Column, VirtualTable
+
+if TYPE_CHECKING:
+    import numpy as np
 
 # Available scheduling algorithms
-ALGORITHMS = ["FCFS", "Round Robin", "Preemptive SRTF", "Priority Scheduling"]
+ALGORITHMS = list(SCHEDULERS)
 
 class InputTab(ctk.CTkFrame):
     """Tab for process input generation and display"""
@@ -32,36 +35,18 @@ class InputTab(ctk.CTkFrame):
             command=self.on_generate
         ).pack(side="left")
 
-        # Process display table
-        self.tree = ttk.Treeview(
-            self,
-            columns=("ID", "Arrival", "Burst", "Priority"),
-            show="headings",
-            style="Enhanced.Treeview"
-        )
-
-        # Configure table columns
-        self.tree.heading("ID", text="Process ID")
-        self.tree.heading("Arrival", text="Arrival Time")
-        self.tree.heading("Burst", text="Burst Time")
-        self.tree.heading("Priority", text="Priority")
-        self.tree.pack(fill="both", expand=True, padx=20, pady=10)
-
-        configure_treeview_styles(self.tree)
+        # Process display table (only the visible rows exist as Treeview items)
+        self.table = VirtualTable(self, [
+            Column(ROW_INDEX, "Process ID", "P{}"),
+            Column("arrival", "Arrival Time"),
+            Column("burst", "Burst Time"),
+            Column("priority", "Priority", "{}")
+        ])
+        self.table.pack(fill="both", expand=True, padx=20, pady=10)
 
     def update_process_table(self, arrival_times, burst_times, priorities):
         """Update the table with new process data"""
-        self.tree.delete(*self.tree.get_children())
-        
-        for i in range(len(arrival_times)):
-            self.tree.insert(
-                "",
-                "end",
-                values=(f"P{i+1}",
-                        f"{arrival_times[i]:.2f}",
-                        f"{burst_times[i]:.2f}",
-                        f"{priorities[i]}")
-            )
+        self.table.set_data({"arrival": arrival_times, "burst": burst_times, "priority": priorities})
 
 class ResultsTab(ctk.CTkFrame):
     """Tab for displaying scheduling results"""
@@ -94,33 +79,30 @@ class ResultsTab(ctk.CTkFrame):
         )
         self.algorithm_menu.pack(side="left")
         
-        # Results display table
-        self.tree = ttk.Treeview(
-            self,
-            columns=("ID", "Arrival", "Start", "End", "Turnaround"),
-            show="headings",
-            style="Enhanced.Treeview"
-        )
-        self.tree.heading("ID", text="Process ID")
-        self.tree.heading("Arrival", text="Arrival Time")
-        self.tree.heading("Start", text="Start Time")
-        self.tree.heading("End", text="End Time")
-        self.tree.heading("Turnaround", text="Turnaround Time")
-        self.tree.pack(fill="both", expand=True, padx=20, pady=20)
+        # Results display table, one row per process
+        self.table = VirtualTable(self, [
+            Column(ROW_INDEX, "Process ID", "P{}"),
+            Column("arrival", "Arrival Time"),
+            Column("first_start", "First Start"),
+            Column("completion", "Completion"),
+            Column("turnaround", "Turnaround Time"),
+            Column("waiting", "Waiting Time"),
+            Column("response", "Response Time"),
+            Column("max_wait", "Longest Wait"),
+            Column("slowdown", "Slowdown"),
+            Column("weighted_share", "Weighted Share")
+        ])
+        self.table.pack(fill="both", expand=True, padx=20, pady=20)
 
-        # Averages display label
+        # Averages and tail metrics display labels
         self.avg_label = ctk.CTkLabel(self, text="", font=ctk.CTkFont(size=14))
-        self.avg_label.pack(pady=10)
+        self.avg_label.pack(pady=(10, 0))
+        self.tail_label = ctk.CTkLabel(self, text="", font=ctk.CTkFont(size=12))
+        self.tail_label.pack(pady=(0, 10))
 
-        configure_treeview_styles(self.tree)
-
-    def display_results(self, results: List[Tuple[int, float, float, float, float]]):
-        """Display scheduling results in the table"""
-        self.tree.delete(*self.tree.get_children())
-        for pid, arrival, start, end, turnaround in results:
-            self.tree.insert("", "end", 
-                           values=(f"P{pid+1}", f"{arrival:.2f}", f"{start:.2f}", 
-                                  f"{end:.2f}", f"{turnaround:.2f}"))
+    def display_results(self, arrival_times: "np.ndarray", per_process: Dict[str, "np.ndarray"]):
+        """Display per-process results (metrics.process_metrics plus metrics.fairness_metrics) in the table"""
+        self.table.set_data({"arrival": arrival_times, **per_process})
 
     def update_averages(self, avg_tat: float, avg_wt: float):
         """Update the averages display"""
@@ -128,6 +110,18 @@ class ResultsTab(ctk.CTkFrame):
             text=f"Average Turnaround: {avg_tat:.2f} | Average Waiting: {avg_wt:.2f}"
         )
 
+    def update_tail_metrics(self, summary: Dict[str, Any]):
+        """Update the percentile and fairness display (from metrics.tail_summary)"""
+        parts = [f"{name.capitalize()} p50/p95/p99/max: "
+                 f"{summary[name]['p50']:.1f} / {summary[name]['p95']:.1f} / "
+                 f"{summary[name]['p99']:.1f} / {summary[name]['max']:.1f}"
+                 for name in ("turnaround", "waiting", "response")]
+        parts.append(f"Fairness: {summary['fairness']:.3f}")
+        parts.append(f"Max starvation: {summary['max_starvation']:.1f}")
+        if "weighted_fairness" in summary:
+            parts.append(f"Weighted: {summary['weighted_fairness']:.3f}")
+        self.tail_label.configure(text="  |  ".join(parts))
+
     def get_selected_algorithm(self) -> str:
         """Get currently selected algorithm"""
         return self.algorithm_var.get()
@@ -163,13 +157,19 @@ class VisualizationTab(ctk.CTkFrame):
         )
         self.algorithm_menu.pack(side="left")
 
-        # Matplotlib figure for Gantt chart
-        self.figure = plt.Figure(figsize=(10, 5))
+        # Matplotlib figure for Gantt chart (imported on first use)
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
+        self.figure = Figure(figsize=(10, 5))
         self.canvas = FigureCanvasTkAgg(self.figure, master=self)
+        self.toolbar = NavigationToolbar2Tk(self.canvas, self, pack_toolbar=False)  # Zoom and pan
+        self.toolbar.pack(side="bottom", fill="x")
         self.canvas.get_tk_widget().pack(fill="both", expand=True)
+        self.chart = None
 
-    def update_visualization(self, execution_order: List[Tuple[int, float, float]], title: str):
+    def update_visualization(self, execution_order: ExecutionTrace, title: str):
         """Update the Gantt chart with new data"""
+        from gantt import GanttChart, GanttLanes  # NumPy-backed, so imported on first use
         self.figure.clear()
         ax = self.figure.add_subplot(111)
         
@@ -177,16 +177,8 @@ class VisualizationTab(ctk.CTkFrame):
         self.figure.patch.set_facecolor('#2b2b2b')
         ax.set_facecolor('#2b2b2b')
         
-        # Prepare data for plotting
-        y_pos = range(len(execution_order))
-        process_labels = [f"P{pid+1}" for pid, _, _ in execution_order]
-        start_times = [start for _, start, _ in execution_order]
-        durations = [end-start for _, start, end in execution_order]
-        
-        # Create horizontal bars
-        bars = ax.barh(y_pos, durations, left=start_times, height=0.5, align='center', color='#1f77b4')
-        ax.set_yticks(y_pos)
-        ax.set_yticklabels(process_labels)
+        # One lane per process; layers are recomputed on zoom and pan
+        self.chart = GanttChart(ax, GanttLanes(execution_order), schedule=self.after_idle)
         ax.set_xlabel('Time', color='white')
         ax.set_ylabel('Processes', color='white')
         ax.set_title(title, color='white')
@@ -195,17 +187,11 @@ class VisualizationTab(ctk.CTkFrame):
         ax.tick_params(axis='x', colors='white')
         ax.tick_params(axis='y', colors='white')
         
-        # Add duration labels on bars
-        for bar in bars:
-            width = bar.get_width()
-            ax.text(bar.get_x() + width, bar.get_y() + bar.get_height()/2,
-                    f'{width:.1f}',
-                    ha='left', va='center',
-                    color='white',
-                    fontsize=8)
-        
-        ax.grid(True, color='#3b3b3b')
-        self.canvas.draw()
+        ax.grid(True, axis='x', color='#3b3b3b')
+        self.figure.tight_layout()
+        self.chart.draw_layers()
+        self.toolbar.update()  # New home view for the toolbar
+        self.canvas.draw_idle()
 
 class ComparisonTab(ctk.CTkFrame):
     """Tab for comparing algorithm performance"""
@@ -228,9 +214,9 @@ class ComparisonTab(ctk.CTkFrame):
         # Results comparison table
         self.results_table = ttk.Treeview(
             main_frame,
-            columns=("algorithm", "avg_tat", "avg_wt", "throughput"),
+            columns=("algorithm", "avg_tat", "avg_wt", "p95_tat", "fairness", "throughput", "switches"),
             show="headings",
-            height=5,
+            height=len(self.algorithms),
             style="Enhanced.Treeview"
         )
         
@@ -238,65 +224,99 @@ class ComparisonTab(ctk.CTkFrame):
         self.results_table.heading("algorithm", text="Algorithm")
         self.results_table.heading("avg_tat", text="Avg Turnaround")
         self.results_table.heading("avg_wt", text="Avg Waiting")
+        self.results_table.heading("p95_tat", text="P95 Turnaround")
+        self.results_table.heading("fairness", text="Fairness")
         self.results_table.heading("throughput", text="Throughput")
+        self.results_table.heading("switches", text="Context Switches")
         
         self.results_table.column("algorithm", width=150, anchor="center")
         self.results_table.column("avg_tat", width=120, anchor="center")
         self.results_table.column("avg_wt", width=120, anchor="center")
+        self.results_table.column("p95_tat", width=120, anchor="center")
+        self.results_table.column("fairness", width=100, anchor="center")
         self.results_table.column("throughput", width=120, anchor="center")
+        self.results_table.column("switches", width=120, anchor="center")
         
         self.results_table.pack(fill="x", pady=(0, 20))
         
-        # Comparison chart figure
-        self.figure = plt.Figure(figsize=(8, 4), dpi=100)
+        # Comparison chart figure (imported on first use)
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+        self.figure = Figure(figsize=(8, 4), dpi=100)
         self.canvas = FigureCanvasTkAgg(self.figure, master=main_frame)
         self.canvas.get_tk_widget().pack(fill="both", expand=True)
         
+        # Profile overlay in the chart's top right corner, shown after profiled runs
+        self.profile_overlay = ctk.CTkLabel(
+            main_frame,
+            text="",
+            justify="left",
+            anchor="nw",
+            font=ctk.CTkFont(family="Courier", size=11),
+            fg_color="#2b2b2b",
+            corner_radius=6
+        )
+        
         configure_treeview_styles(self.results_table)
     
-    def update_data(self, arrival_times: List[float], burst_times: List[float], priorities: List[int]):
-        """Update process data and run comparison"""
+    def show_profile(self, report: Optional[str]):
+        """Show a profile report (instrumentation.Profiler.format_report) over the chart, or hide it for None"""
+        if report is None:
+            self.profile_overlay.place_forget()
+            return
+        self.profile_overlay.configure(text=report)
+        self.profile_overlay.place(in_=self.canvas.get_tk_widget(), relx=1.0, rely=0.0, x=-10, y=10, anchor="ne")
+        self.profile_overlay.lift()
+    
+    def update_data(self, arrival_times: "np.ndarray", burst_times: "np.ndarray", priorities: "np.ndarray",
+                    simulations: Dict[str, Tuple[ExecutionTrace, float, float]],
+                    tails: Optional[Dict[str, dict]] = None):
+        """Update process data and compare the given simulation results"""
         self.arrival_times = arrival_times
         self.burst_times = burst_times
         self.priorities = priorities
-        self.run_comparison()
+        self.run_comparison(simulations, tails)
     
-    def run_comparison(self):
-        """Run all algorithms and compare results"""
-        if not self.arrival_times or len(self.arrival_times) == 0:
+    def run_comparison(self, simulations: Dict[str, Tuple[ExecutionTrace, float, float]],
+                       tails: Optional[Dict[str, dict]] = None):
+        """
+        Compare algorithms from their (execution_order, avg_tat, avg_wt) results.
+
+        tails maps algorithm names to metrics.tail_summary results computed on
+        the worker thread; algorithms without one show "-" for the tail columns.
+        """
+        if tails is None:
+            tails = {}
+        if len(self.arrival_times) == 0:
             return
             
         results = {}
         
-        # Run each algorithm and store results
-        for name, algo_func in self.algorithms.items():
+        for name in self.algorithms:
+            if name not in simulations:
+                continue
             try:
-                if name == "Priority Scheduling":
-                    execution_order, avg_tat, avg_wt = algo_func(
-                        self.arrival_times.copy(),
-                        self.burst_times.copy(),
-                        self.priorities.copy()
-                    )
-                else:
-                    execution_order, avg_tat, avg_wt = algo_func(
-                        self.arrival_times.copy(),
-                        self.burst_times.copy()
-                    )
+                execution_order, avg_tat, avg_wt = simulations[name]
                 
-                # Calculate throughput
-                if execution_order:
-                    total_time = max(end for _, _, end in execution_order) - min(self.arrival_times)
+                # Calculate throughput (works for recorded and metrics-only traces)
+                if execution_order.slice_count:
+                    total_time = execution_order.makespan - min(self.arrival_times)
                     throughput = len(self.arrival_times) / total_time if total_time > 0 else 0
                 else:
                     throughput = 0
                     
+                tail = tails.get(name)
+                    
                 results[name] = {
                     "avg_tat": round(avg_tat, 2),
                     "avg_wt": round(avg_wt, 2),
-                    "throughput": round(throughput, 4)
+                    "p95_tat": round(tail["turnaround"]["p95"], 2) if tail else None,
+                    "fairness": round(tail["fairness"], 4) if tail else None,
+                    "throughput": round(throughput, 4),
+                    "context_switches": execution_order.context_switches
                 }
             except Exception as e:
-                print(f"Error running {name}: {str(e)}")
+                print(f"Error comparing {name}: {str(e)}")
                 continue
         
         self.update_results(results)
@@ -311,7 +331,10 @@ class ComparisonTab(ctk.CTkFrame):
                 algo,
                 f"{data['avg_tat']:.2f}",
                 f"{data['avg_wt']:.2f}",
-                f"{data['throughput']:.4f}"
+                "-" if data['p95_tat'] is None else f"{data['p95_tat']:.2f}",
+                "-" if data['fairness'] is None else f"{data['fairness']:.4f}",
+                f"{data['throughput']:.4f}",
+                data['context_switches']
             ))
         
         # Update comparison chart
@@ -360,5 +383,46 @@ class ComparisonTab(ctk.CTkFrame):
         
         ax.grid(True, linestyle='--', alpha=0.6, color='#3b3b3b')
         
-        plt.tight_layout()
-        self.canvas.draw() 
\ No newline at end of file
+        self.figure.tight_layout()
+        self.canvas.draw() 
+
+class StatusBar(ctk.CTkFrame):
+    """Progress bar, status text and cancel button for background runs"""
+    def __init__(self, master, on_cancel: Callable, **kwargs):
+        super().__init__(master, **kwargs)
+        self.on_cancel = on_cancel
+        self.create_widgets()
+        self.pack(fill="x", side="bottom", padx=10, pady=(0, 10))
+    
+    def create_widgets(self):
+        """Create status bar UI"""
+        self.status_label = ctk.CTkLabel(self, text="Ready", anchor="w")
+        self.status_label.pack(side="left", padx=10)
+
+        self.cancel_button = ctk.CTkButton(
+            self,
+            text="Cancel",
+            width=80,
+            state="disabled",
+            command=self.on_cancel
+        )
+        self.cancel_button.pack(side="right", padx=10)
+
+        # Instrument the next run (counters and timings in the Comparison tab)
+        self.profile_var = ctk.BooleanVar(value=False)
+        ctk.CTkSwitch(self, text="Profile", variable=self.profile_var).pack(side="right", padx=10)
+
+        self.progress = ctk.CTkProgressBar(self)
+        self.progress.set(0)
+        self.progress.pack(side="right", fill="x", expand=True, padx=10)
+
+    def show_progress(self, completed: int, total: int, label: str):
+        """Show progress of the running job"""
+        self.progress.set(completed / total if total else 1)
+        self.status_label.configure(text=f"{label} ({completed}/{total})")
+        self.cancel_button.configure(state="normal")
+
+    def show_idle(self, text: str = "Ready"):
+        """Show that no job is running"""
+        self.status_label.configure(text=text)
+        self.cancel_button.configure(state="disabled")
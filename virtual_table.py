@@ -0,0 +1,186 @@
+"""Virtualized tables: a fixed pool of Treeview rows over NumPy columns."""
+from typing import TYPE_CHECKING, Dict, List, NamedTuple, Optional, Sequence, Tuple
+import customtkinter as ctk
+from tkinter import ttk
+from utils import configure_treeview_styles
+
+if TYPE_CHECKING:
+    import numpy as np  # Imported when data is first set, so empty tables are built without NumPy
+
+class Column(NamedTuple):
+    """One table column: data key, heading and a format for one cell"""
+    key: str
+    heading: str
+    format: str = "{:.2f}"
+
+# Key of the implicit row-number column; its cells are formatted from the row index
+ROW_INDEX = "#index"
+
+class TableModel:
+    """
+    Sorted, windowed view of equally long NumPy columns.
+
+    Setting data only stores references; sorting is one np.argsort per click;
+    only the rows asked for by rows() are ever formatted.
+    """
+    def __init__(self, columns: Sequence[Column]):
+        self.columns = list(columns)
+        self.data: Dict[str, "np.ndarray"] = {}
+        self.num_rows = 0
+        self.order: Optional["np.ndarray"] = None  # Row permutation, None while unsorted
+        self.sort_key: Optional[str] = None
+        self.descending = False
+
+    def set_data(self, data: Dict[str, Sequence]):
+        """Replace the backing columns, keeping the current sort column"""
+        import numpy as np
+        self.data = {key: np.asarray(values) for key, values in data.items()}
+        self.num_rows = len(next(iter(self.data.values()))) if self.data else 0
+        self.order = None
+        if self.sort_key is not None:
+            self.sort(self.sort_key, self.descending)
+
+    def sort(self, key: str, descending: bool = False):
+        """Order rows by one column (stable, so ties keep their original order)"""
+        import numpy as np
+        self.sort_key = key
+        self.descending = descending
+        if key == ROW_INDEX:
+            self.order = None if not descending else np.arange(self.num_rows - 1, -1, -1)
+            return
+        order = np.argsort(self.data[key], kind="stable")
+        self.order = order[::-1] if descending else order
+
+    def rows(self, first: int, count: int) -> List[Tuple[str, ...]]:
+        """Formatted cells of count rows starting at display position first"""
+        import numpy as np
+        first = max(0, min(first, self.num_rows))
+        last = min(first + count, self.num_rows)
+        if self.order is None:
+            indices = np.arange(first, last)
+        else:
+            indices = self.order[first:last]
+
+        cells = []
+        for column in self.columns:
+            if column.key == ROW_INDEX:
+                values = (indices + 1).tolist()
+            else:
+                values = self.data[column.key][indices].tolist()
+            cells.append([column.format.format(value) for value in values])
+        return list(zip(*cells))
+
+class VirtualTable(ctk.CTkFrame):
+    """
+    Table widget that shows any number of rows with a fixed number of items.
+
+    The Treeview holds only as many items as fit on screen; scrolling,
+    paging and sorting just refill them from the TableModel. Updating the
+    data therefore costs the same for a million rows as for fifty.
+    """
+    def __init__(self, master, columns: Sequence[Column], **kwargs):
+        super().__init__(master, **kwargs)
+        self.model = TableModel(columns)
+        self.first = 0  # Display position of the top row
+        self.visible_rows = 10
+        self.items: List[str] = []
+
+        body = ctk.CTkFrame(self, fg_color="transparent")
+        body.pack(fill="both", expand=True)
+        self.tree = ttk.Treeview(
+            body,
+            columns=[column.key for column in columns],
+            show="headings",
+            style="Enhanced.Treeview",
+            selectmode="none"
+        )
+        for column in columns:
+            self.tree.heading(column.key, text=column.heading, command=lambda key=column.key: self.on_heading(key))
+        self.scrollbar = ttk.Scrollbar(body, orient="vertical", command=self.on_scrollbar)
+        self.scrollbar.pack(side="right", fill="y")
+        self.tree.pack(side="left", fill="both", expand=True)
+        configure_treeview_styles(self.tree)
+
+        # Paging controls
+        pager = ctk.CTkFrame(self, fg_color="transparent")
+        pager.pack(fill="x", pady=(5, 0))
+        ctk.CTkButton(pager, text="◀", width=40, command=lambda: self.scroll_pages(-1)).pack(side="left")
+        ctk.CTkButton(pager, text="▶", width=40, command=lambda: self.scroll_pages(1)).pack(side="left", padx=5)
+        self.position_label = ctk.CTkLabel(pager, text="")
+        self.position_label.pack(side="left", padx=10)
+
+        self.tree.bind("<Configure>", self.on_resize)
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.tree.bind(sequence, self.on_mouse_wheel)
+
+    def set_data(self, data: Dict[str, Sequence]):
+        """Show new columns (arrays are referenced, not copied) from the top"""
+        self.model.set_data(data)
+        self.first = 0
+        self.refresh()
+
+    def scroll_to(self, first: int):
+        """Show rows starting at display position first"""
+        self.first = max(0, min(first, self.model.num_rows - self.visible_rows))
+        self.refresh()
+
+    def scroll_pages(self, pages: int):
+        """Move by whole pages"""
+        self.scroll_to(self.first + pages * self.visible_rows)
+
+    def refresh(self):
+        """Refill the item pool with the visible window of rows"""
+        rows = self.model.rows(self.first, self.visible_rows)
+        while len(self.items) < len(rows):
+            self.items.append(self.tree.insert("", "end"))
+        while len(self.items) > len(rows):
+            self.tree.delete(self.items.pop())
+        for item, values in zip(self.items, rows):
+            self.tree.item(item, values=values)
+
+        total = self.model.num_rows
+        if total:
+            self.scrollbar.set(self.first / total, (self.first + len(rows)) / total)
+            self.position_label.configure(text=f"Rows {self.first + 1:,}–{self.first + len(rows):,} of {total:,}")
+        else:
+            self.scrollbar.set(0, 1)
+            self.position_label.configure(text="")
+
+        # Mark the sorted column in its heading
+        for column in self.model.columns:
+            arrow = ""
+            if column.key == self.model.sort_key:
+                arrow = " ▼" if self.model.descending else " ▲"
+            self.tree.heading(column.key, text=column.heading + arrow)
+
+    def on_heading(self, key: str):
+        """Sort by a column; clicking it again reverses the order"""
+        descending = self.model.sort_key == key and not self.model.descending
+        self.model.sort(key, descending)
+        self.scroll_to(0)
+
+    def on_scrollbar(self, action: str, amount: str, unit: Optional[str] = None):
+        """Handle scrollbar drags ('moveto') and arrow/trough clicks ('scroll')"""
+        if action == "moveto":
+            self.scroll_to(int(float(amount) * self.model.num_rows))
+        elif unit == "pages":
+            self.scroll_pages(int(amount))
+        else:
+            self.scroll_to(self.first + int(amount))
+
+    def on_mouse_wheel(self, event):
+        """Scroll three rows per wheel notch"""
+        if event.num == 4 or getattr(event, "delta", 0) > 0:
+            self.scroll_to(self.first - 3)
+        else:
+            self.scroll_to(self.first + 3)
+        return "break"
+
+    def on_resize(self, event):
+        """Fit the item pool to the new height"""
+        row_height = int(ttk.Style().lookup("Enhanced.Treeview", "rowheight") or 20)
+        header_height = row_height  # Headings are about one row tall
+        visible_rows = max(1, (event.height - header_height) // row_height)
+        if visible_rows != self.visible_rows:
+            self.visible_rows = visible_rows
+            self.scroll_to(self.first)
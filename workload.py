@@ -0,0 +1,244 @@
+"""Workload sources: configuration files, random generation and process traces."""
+import io
+from itertools import islice
+from typing import TYPE_CHECKING, Iterator, List, NamedTuple, Optional, Tuple
+
+if TYPE_CHECKING:
+    import numpy as np  # Imported lazily so trace-only runs never load NumPy
+
+class WorkloadConfig(NamedTuple):
+    """Parameters of the random workload described by data/input.txt"""
+    num_processes: int
+    arrival_mean: float
+    arrival_sd: float
+    burst_mean: float
+    burst_sd: float
+    priority_lambda: float
+
+def read_config(path: str) -> WorkloadConfig:
+    """
+    Read a workload configuration file.
+
+    The file has four lines: number of processes, arrival mean and standard
+    deviation, burst mean and standard deviation, and the Poisson lambda for
+    priorities.
+    """
+    with open(path) as file:
+        num_processes = int(file.readline())
+        arrival_mean, arrival_sd = map(float, file.readline().split())
+        burst_mean, burst_sd = map(float, file.readline().split())
+        priority_lambda = float(file.readline())
+    return WorkloadConfig(num_processes, arrival_mean, arrival_sd, burst_mean, burst_sd, priority_lambda)
+
+def generate_workload(config: WorkloadConfig, rng: Optional["np.random.Generator"] = None) -> Tuple["np.ndarray", "np.ndarray", "np.ndarray"]:
+    """
+    Draw one random workload.
+
+    Arrival and burst times come from normal distributions (folded at zero)
+    and priorities from a Poisson distribution.
+
+    Args:
+        config: Workload parameters
+        rng: Random generator; a fresh unseeded one is used if None
+
+    Returns:
+        Tuple of (arrival_times, burst_times, priorities) arrays
+    """
+    import numpy as np
+
+    rng = np.random.default_rng() if rng is None else rng
+    n = config.num_processes
+    arrival_times = np.abs(rng.normal(config.arrival_mean, config.arrival_sd, n))
+    burst_times = np.abs(rng.normal(config.burst_mean, config.burst_sd, n))
+    priorities = np.abs(rng.poisson(config.priority_lambda, n))
+    return arrival_times, burst_times, priorities
+
+def read_trace(path: str) -> Tuple[List[float], List[float], List[int]]:
+    """
+    Read a process trace file.
+
+    Each non-empty line holds arrival time, burst time and an optional 32-bit
+    integer priority, separated by commas or whitespace. Lines starting with
+    '#' and a non-numeric header on the first line are skipped.
+
+    Returns:
+        Tuple of (arrival_times, burst_times, priorities) lists
+    """
+    arrival_times, burst_times, priorities = [], [], []
+    with open(path) as file:
+        for line_number, line in enumerate(file, 1):
+            fields = line.replace(",", " ").split()
+            if not fields or fields[0].startswith("#"):
+                continue
+            row = _parse_trace_row(path, line_number, line, fields, header_allowed=line_number == 1)
+            if row is None:
+                continue  # Header row
+            arrival, burst, priority = row
+            arrival_times.append(arrival)
+            burst_times.append(burst)
+            priorities.append(priority)
+    if not arrival_times:
+        raise ValueError(f"{path}: no processes found")
+    return arrival_times, burst_times, priorities
+
+def iter_trace_chunks(path: str, chunk_size: int = 65536) -> Iterator[Tuple["np.ndarray", "np.ndarray", "np.ndarray"]]:
+    """
+    Stream a process trace file in fixed-size chunks.
+
+    Accepts and rejects the same files as read_trace(), but parses each
+    chunk of lines straight into NumPy arrays, so memory stays bounded by
+    chunk_size no matter how long the trace is.
+
+    Args:
+        path: Trace file of 'arrival burst [priority]' rows
+        chunk_size: Maximum number of lines parsed per chunk
+
+    Yields:
+        Tuples of (arrival_times float64, burst_times float64, priorities int32)
+    """
+    line_number = 0
+    found = False
+    with open(path) as file:
+        while True:
+            lines = list(islice(file, chunk_size))
+            if not lines:
+                break
+            first_line_number = line_number + 1
+            line_number += len(lines)
+            if first_line_number == 1:
+                fields = lines[0].replace(",", " ").split()
+                if fields and not fields[0].startswith("#") and _parse_trace_row(path, 1, lines[0], fields, header_allowed=True) is None:
+                    lines[0] = ""  # Header row, as in read_trace()
+            columns = _trace_columns(path, lines, first_line_number)
+            if columns is not None:
+                found = True
+                yield columns
+    if not found:
+        raise ValueError(f"{path}: no processes found")
+
+def _parse_trace_row(path: str, line_number: int, line: str, fields: List[str],
+                     header_allowed: bool = False) -> Optional[Tuple[float, float, int]]:
+    """(arrival, burst, priority) of one trace row; None for a header if allowed, else ValueError"""
+    try:
+        priority = int(fields[2]) if len(fields) > 2 else 0
+        if not -2 ** 31 <= priority < 2 ** 31:
+            raise ValueError("priority out of int32 range")
+        return float(fields[0]), float(fields[1]), priority
+    except (ValueError, IndexError):
+        if header_allowed:
+            return None
+        raise ValueError(f"{path}:{line_number}: expected 'arrival burst [priority]', got {line.strip()!r}")
+
+def _trace_columns(path: str, lines: List[str], first_line_number: int) -> Optional[Tuple["np.ndarray", "np.ndarray", "np.ndarray"]]:
+    """Arrival, burst and priority arrays of a chunk of trace lines, None if it has no data rows"""
+    import numpy as np
+
+    rows = [line for line in lines if line.strip() and not line.replace(",", " ").lstrip().startswith("#")]
+    if not rows:
+        return None
+    width = len(rows[0].replace(",", " ").split())
+    if width in (2, 3):
+        dtype = [("arrival", "<f8"), ("burst", "<f8"), ("priority", "<i4")][:width]
+        try:
+            table = np.loadtxt(io.StringIO("".join(rows).replace(",", " ")), dtype=dtype, comments=None, ndmin=1)
+        except ValueError:
+            pass  # Mixed widths or a malformed row; the loop below names the line
+        else:
+            priorities = table["priority"] if width == 3 else np.zeros(len(table), dtype=np.int32)
+            return table["arrival"].copy(), table["burst"].copy(), priorities.copy()
+
+    parsed = []
+    for line_number, line in enumerate(lines, first_line_number):
+        fields = line.replace(",", " ").split()
+        if fields and not fields[0].startswith("#"):
+            parsed.append(_parse_trace_row(path, line_number, line, fields))
+    arrival_times, burst_times, priorities = zip(*parsed)
+    return (np.array(arrival_times, dtype=np.float64), np.array(burst_times, dtype=np.float64),
+            np.array(priorities, dtype=np.int32))
+
+# Binary workload format: a 64-byte header followed by contiguous little-endian
+# columns arrival (float64), burst (float64) and priority (int32)
+WORKLOAD_MAGIC = b"PSWL"
+WORKLOAD_VERSION = 1
+WORKLOAD_HEADER_SIZE = 64
+WORKLOAD_FLAG_SORTED = 1  # Arrival times are non-decreasing
+
+def _workload_header_dtype():
+    """Header layout of the binary workload format"""
+    import numpy as np
+    return np.dtype([
+        ("magic", "S4"),
+        ("version", "<u4"),
+        ("count", "<u8"),
+        ("flags", "<u8"),
+        ("reserved", "V40")
+    ])
+
+def write_workload(path: str, arrival_times, burst_times, priorities=None):
+    """
+    Write a workload in the binary format read by open_workload().
+
+    Args:
+        path: Output file (conventionally *.psw)
+        arrival_times: Arrival time per process
+        burst_times: Burst time per process
+        priorities: Priority per process (zeros if None)
+    """
+    import numpy as np
+
+    arrival = np.asarray(arrival_times, dtype="<f8")
+    burst = np.asarray(burst_times, dtype="<f8")
+    priority = np.zeros(len(arrival), dtype="<i4") if priorities is None else np.asarray(priorities, dtype="<i4")
+    if not (len(arrival) == len(burst) == len(priority)):
+        raise ValueError("arrival_times, burst_times and priorities must have the same length")
+
+    header = np.zeros(1, dtype=_workload_header_dtype())
+    header["magic"] = WORKLOAD_MAGIC
+    header["version"] = WORKLOAD_VERSION
+    header["count"] = len(arrival)
+    header["flags"] = WORKLOAD_FLAG_SORTED if np.all(arrival[1:] >= arrival[:-1]) else 0
+
+    with open(path, "wb") as file:
+        header.tofile(file)
+        arrival.tofile(file)
+        burst.tofile(file)
+        priority.tofile(file)
+
+def open_workload(path: str) -> Tuple["np.ndarray", "np.ndarray", "np.ndarray"]:
+    """
+    Open a binary workload without copying it into memory.
+
+    The columns are read-only np.memmap views of the file, so opening is
+    near-instant regardless of size and pages are loaded only when touched.
+
+    Returns:
+        Tuple of (arrival_times, burst_times, priorities) arrays
+    """
+    import numpy as np
+
+    header = np.fromfile(path, dtype=_workload_header_dtype(), count=1)
+    if len(header) != 1 or header["magic"][0] != WORKLOAD_MAGIC:
+        raise ValueError(f"{path}: not a binary workload file")
+    if header["version"][0] != WORKLOAD_VERSION:
+        raise ValueError(f"{path}: unsupported workload version {header['version'][0]}")
+
+    count = int(header["count"][0])
+    if count == 0:
+        return np.empty(0, "<f8"), np.empty(0, "<f8"), np.empty(0, "<i4")
+    offset = WORKLOAD_HEADER_SIZE
+    arrival_times = np.memmap(path, dtype="<f8", mode="r", offset=offset, shape=(count,))
+    burst_times = np.memmap(path, dtype="<f8", mode="r", offset=offset + 8 * count, shape=(count,))
+    priorities = np.memmap(path, dtype="<i4", mode="r", offset=offset + 16 * count, shape=(count,))
+    return arrival_times, burst_times, priorities
+
+def iter_workload_chunks(workload: Tuple["np.ndarray", "np.ndarray", "np.ndarray"], chunk_size: int = 65536) -> Iterator[Tuple["np.ndarray", "np.ndarray", "np.ndarray"]]:
+    """
+    Split workload columns (e.g. from open_workload) into zero-copy chunks.
+
+    Yields:
+        Tuples of (arrival_times, burst_times, priorities) slices
+    """
+    arrival_times, burst_times, priorities = workload
+    for start in range(0, len(arrival_times), chunk_size):
+        end = start + chunk_size
+        yield arrival_times[start:end], burst_times[start:end], priorities[start:end]